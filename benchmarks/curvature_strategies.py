@@ -0,0 +1,81 @@
+"""
+Compare curvature strategies on a few reference metrics.
+
+Run with ``PYTHONPATH=src python benchmarks/curvature_strategies.py``. The
+SymPy cache is cleared before every run so each timing starts cold.
+"""
+
+import time
+
+import sympy as sp
+from sympy.core.cache import clear_cache
+
+from lyra_geometry import LyraCurvatureStrategy, TensorSpace
+from lyra_geometry.frames import CartanCurvatureStrategy
+
+
+def _flrw_with_scale():
+    t, r, theta, phi = sp.symbols("t r theta phi")
+    k = sp.symbols("k")
+    a = sp.Function("a")(t)
+    metric = sp.diag(-1, a**2 / (1 - k * r**2), a**2 * r**2, a**2 * r**2 * sp.sin(theta) ** 2)
+    return (t, r, theta, phi), metric, sp.Function("phi")(t)
+
+
+def _schwarzschild():
+    t, r, theta, phi = sp.symbols("t r theta phi")
+    mass = sp.symbols("M")
+    f = 1 - 2 * mass / r
+    metric = sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(theta) ** 2)
+    return (t, r, theta, phi), metric, None
+
+
+def _static_spherical_with_scale():
+    t, r, theta, phi = sp.symbols("t r theta phi")
+    A = sp.Function("A")(r)
+    B = sp.Function("B")(r)
+    metric = sp.diag(-A, B, r**2, r**2 * sp.sin(theta) ** 2)
+    return (t, r, theta, phi), metric, sp.Function("phi")(r)
+
+
+CASES = {
+    "flrw+phi(t)": _flrw_with_scale,
+    "schwarzschild": _schwarzschild,
+    "static A(r),B(r)+phi(r)": _static_spherical_with_scale,
+}
+
+
+def _prepared_space(case):
+    coords, metric, scale = case()
+    space = TensorSpace(coords, metric=metric, curvature_strategy=None)
+    if scale is not None:
+        space.set_scale(scale)
+        space.update(exclude=("riemann", "ricci", "einstein"))
+    return space
+
+
+def time_strategy(case, strategy, repeat=3):
+    best = None
+    for _ in range(repeat):
+        space = _prepared_space(case)
+        clear_cache()
+        start = time.perf_counter()
+        strategy.build(space, space.gamma.components)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    strategies = {
+        "lyra": LyraCurvatureStrategy(),
+        "cartan": CartanCurvatureStrategy(),
+    }
+    print(f"{'metric':<26}" + "".join(f"{name:>10}" for name in strategies))
+    for label, case in CASES.items():
+        times = [time_strategy(case, strategy) for strategy in strategies.values()]
+        print(f"{label:<26}" + "".join(f"{t:>9.2f}s" for t in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 """Lyra Geometry: symbolic differential geometry tools built on SymPy."""
 
+from .abstract import AbstractSpace
+from .codegen import CompiledKernel, compile_kernel
 from .core import (
     Connection,
     ConnectionStrategy,
@@ -15,7 +17,22 @@ from .core import (
     TensorSpace,
 )
 from .diff_ops import divergence, gradient, laplacian
+from .domains import Domains
+from .field_equations import FieldEquations, reduce_field_equations
+from .frames import CartanConnectionStrategy, CartanCurvatureStrategy, cartan_connection_forms
+from .geodesics import (
+    FirstIntegrals,
+    connection_geodesics,
+    euler_lagrange_geodesics,
+    first_integrals,
+    lagrangian_christoffel,
+)
+from .grid import GridSpace
+from .hamiltonian import CompiledHamiltonian, geodesic_hamiltonian, leapfrog, yoshida4
 from .invariants import euler_density, kretschmann_scalar, ricci_scalar
+from .lyapunov import VariationalEquations, lyapunov_spectrum
+from .numeric_tensors import NumericIndexed, NumericSpace, NumericTensor
+from .raytrace import NullGeodesicTracer
 from .tensors import (
     D,
     Down,
@@ -34,18 +51,32 @@ from .tensors import (
     u,
 )
 from .utils import example_indexing, greek
+from .warped import WarpedCurvatureStrategy, detect_warped_product, warped_product
+from .zero_test import probably_zero
 
 __all__ = [
+    "AbstractSpace",
+    "CartanConnectionStrategy",
+    "CartanCurvatureStrategy",
+    "CompiledHamiltonian",
+    "CompiledKernel",
     "Connection",
     "ConnectionStrategy",
     "ConnectionTensor",
     "CurvatureStrategy",
     "D",
+    "Domains",
     "Down",
     "DownIndex",
+    "FieldEquations",
+    "FirstIntegrals",
     "FixedConnectionStrategy",
     "autoparallel_equations",
+    "cartan_connection_forms",
+    "compile_kernel",
+    "connection_geodesics",
     "geodesic_equations",
+    "geodesic_hamiltonian",
     "Index",
     "IndexedTensor",
     "IndexedArray",
@@ -54,6 +85,10 @@ __all__ = [
     "Manifold",
     "Metric",
     "NO_LABEL",
+    "NullGeodesicTracer",
+    "NumericIndexed",
+    "NumericSpace",
+    "NumericTensor",
     "SpaceTime",
     "Tensor",
     "TensorFactory",
@@ -61,16 +96,29 @@ __all__ = [
     "U",
     "Up",
     "UpIndex",
+    "VariationalEquations",
+    "WarpedCurvatureStrategy",
     "d",
+    "detect_warped_product",
     "divergence",
     "euler_density",
+    "euler_lagrange_geodesics",
     "example_indexing",
+    "first_integrals",
     "gradient",
     "greek",
+    "GridSpace",
     "kretschmann_scalar",
     "laplacian",
+    "leapfrog",
+    "lagrangian_christoffel",
+    "lyapunov_spectrum",
+    "probably_zero",
+    "reduce_field_equations",
     "ricci_scalar",
     "u",
+    "warped_product",
+    "yoshida4",
 ]
 
 __version__ = "0.1.20"
@@ -0,0 +1,191 @@
+import itertools
+
+import sympy as sp
+from sympy.combinatorics import Permutation, PermutationGroup
+from sympy.tensor.tensor import (
+    TensAdd,
+    TensExpr,
+    TensMul,
+    Tensor as TensorFactor,
+    TensorHead,
+    TensorIndexType,
+    TensorSymmetry,
+    tensor_indices,
+)
+
+from .tensors import D, Tensor, U, _normalize_symmetries, _validate_signature
+
+# Riemann monoterm symmetries as (index permutation, sign): both antisymmetric pairs and pair exchange.
+_RIEMANN_GENERATORS = (((1, 0, 2, 3), -1), ((0, 1, 3, 2), -1), ((2, 3, 0, 1), 1))
+
+
+def _tensor_symmetry(rank, symmetries):
+    """TensorSymmetry generated by (pos1, pos2, sign) transpositions (sign -1 flips the overall sign)."""
+    if not symmetries:
+        return TensorSymmetry.no_symmetry(rank)
+    generators = []
+    for pos1, pos2, sign in symmetries:
+        image = list(range(rank + 2))
+        image[pos1], image[pos2] = pos2, pos1
+        if sign == -1:
+            image[rank], image[rank + 1] = rank + 1, rank
+        generators.append(Permutation(image))
+    base, strong = PermutationGroup(generators).schreier_sims_incremental()
+    return TensorSymmetry(base, strong)
+
+
+def _riemann_components(name, dim, coords):
+    """All-lower components W_abcd(coords) with the Riemann symmetries: one function per orbit."""
+    values = {}
+    for idx in itertools.product(range(dim), repeat=4):
+        if idx in values:
+            continue
+        signs, stack, vanishes = {idx: 1}, [idx], False
+        while stack:
+            cur = stack.pop()
+            for perm, sign in _RIEMANN_GENERATORS:
+                nxt = tuple(cur[p] for p in perm)
+                if nxt in signs:
+                    vanishes = vanishes or signs[nxt] != signs[cur] * sign
+                    continue
+                signs[nxt] = signs[cur] * sign
+                stack.append(nxt)
+        canon = min(signs)
+        function = sp.Function(f"{name}{''.join(map(str, canon))}")(*coords)
+        for member, sign in signs.items():
+            values[member] = sp.Integer(0) if vanishes else sign * function
+    return sp.Array([values[idx] for idx in itertools.product(range(dim), repeat=4)], (dim,) * 4)
+
+
+class AbstractSpace:
+    """
+    Abstract-index view of a TensorSpace on top of sympy.tensor.tensor.
+
+    Tensors are TensorHeads with declared monoterm symmetries: pair
+    symmetries as in TensorSpace.generic, or "riemann" (antisymmetric pairs
+    plus pair exchange). Expressions are built with +a/-a for
+    upper/lower indices and canonicalized with canon_bp (Butler-Portugal
+    dummy relabeling), so identities following from these symmetries reduce
+    to 0 without components. Multi-term identities (first Bianchi) are
+    beyond canon_bp; components() expands any expression on demand.
+    """
+
+    def __init__(self, space, name="L"):
+        self.space = space
+        self.index_type = TensorIndexType(name, dummy_name=name, dim=space.dim)
+        self.metric = self.index_type.metric
+        self.delta = self.index_type.delta
+        self._heads = {}
+
+    def __repr__(self):
+        return f"AbstractSpace(dim={self.space.dim}, tensors={sorted(self._heads)})"
+
+    def indices(self, names):
+        """Abstract indices (upper by default; -a lowers) named by a string such as "a b c"."""
+        found = tensor_indices(names, self.index_type)
+        return found if isinstance(found, list) else [found]
+
+    def tensor(self, name, signature, symmetries=None, components=None):
+        """
+        TensorHead for a tensor of this space.
+
+        components (a Tensor of the space) supplies the values used by
+        components(); without it a TensorSpace.generic tensor with the
+        same name and symmetries is built the first time it is needed. For
+        "riemann" that tensor is all-lower (one function per orbit of both
+        antisymmetries and pair exchange) and is raised to the variance in
+        use with the metric.
+        """
+        signature = _validate_signature(signature, len(signature))
+        rank = len(signature)
+        if symmetries == "riemann":
+            if rank != 4:
+                raise ValueError("The riemann symmetry needs a rank-4 tensor.")
+            symmetry = TensorSymmetry.riemann()
+            pairs = "riemann"
+        else:
+            pairs = _normalize_symmetries(symmetries, signature)
+            symmetry = _tensor_symmetry(rank, pairs)
+        if components is not None and (not isinstance(components, Tensor) or components.space is not self.space):
+            raise ValueError("components must be a Tensor of this TensorSpace.")
+        head = TensorHead(name, [self.index_type] * rank, symmetry)
+        self._heads[name] = (head, signature, pairs, components)
+        return head
+
+    def canonicalize(self, expr):
+        """Canonical form under the declared symmetries and dummy relabeling."""
+        if not isinstance(expr, TensExpr):
+            return sp.sympify(expr)
+        return expr.canon_bp()
+
+    def is_zero(self, expr):
+        return self.canonicalize(expr) == 0
+
+    def _factor_array(self, factor):
+        head = factor.component
+        variance = tuple(U if i.is_up else D for i in factor.get_indices())
+        if head is self.delta or (head is self.metric and variance[0] is not variance[1]):
+            return sp.Array(sp.eye(self.space.dim))
+        if head is self.metric:
+            if self.space.metric is None:
+                raise ValueError("Metric not defined.")
+            return sp.Array(self.space.metric_inv if variance[0] is U else self.space.metric.components)
+        declared = self._heads.get(head.name)
+        if declared is None or declared[0] is not head:
+            raise ValueError(f"Tensor {head.name} was not declared on this AbstractSpace.")
+        _, signature, pairs, tensor = declared
+        if tensor is None:
+            if pairs == "riemann":
+                array = _riemann_components(head.name, self.space.dim, self.space.coords)
+                tensor = self.space.from_array(array, (D, D, D, D), name=head.name, label=head.name)
+            else:
+                tensor = self.space.generic(head.name, signature, symmetries=pairs)
+            self._heads[head.name] = (head, signature, pairs, tensor)
+        return sp.Array(tensor(*variance).components)
+
+    def _term_array(self, term, free):
+        factors = [f for f in term.args if isinstance(f, TensorFactor)] if isinstance(term, TensMul) else [term]
+        coefficient = term.coeff
+        # Contract as soon as both ends of a dummy pair are present, keeping products small.
+        array, remaining = sp.Integer(1), []
+        for factor in factors:
+            array = sp.tensorproduct(array, self._factor_array(factor))
+            remaining = remaining + list(factor.get_indices())
+            pairs = [(i, remaining.index(-x)) for i, x in enumerate(remaining) if x.is_up and -x in remaining]
+            if pairs:
+                array = sp.tensorcontraction(array, *pairs)
+                contracted = {p for pair in pairs for p in pair}
+                remaining = [x for i, x in enumerate(remaining) if i not in contracted]
+        if sorted(map(str, remaining)) != sorted(map(str, free)):
+            raise ValueError(f"Free indices {remaining} do not match {free}.")
+        if remaining:
+            array = sp.permutedims(array, [remaining.index(x) for x in free])
+            return coefficient * array
+        return coefficient * (array[()] if isinstance(array, sp.NDimArray) else array)
+
+    def components(self, expr, indices=None):
+        """
+        Expand expr into a Tensor of the space.
+
+        indices fixes the order of the free indices of the result, e.g.
+        [a, -b]; by default the order in which they appear. Every factor is
+        taken in the variance it carries in expr (raised or lowered with
+        the space's metric), then contracted over the dummy pairs.
+        """
+        expr = self.canonicalize(expr)
+        if not isinstance(expr, TensExpr):
+            if not indices:
+                return self.space.scalar(expr)
+            if expr != 0:
+                raise ValueError(f"Free indices [] do not match {list(indices)}.")
+            return self.space.zeros(tuple(U if i.is_up else D for i in indices))
+        free = list(indices) if indices is not None else expr.get_free_indices()
+        terms = expr.args if isinstance(expr, TensAdd) else (expr,)
+        array = sum((self._term_array(term, free) for term in terms[1:]), self._term_array(terms[0], free))
+        if not free:
+            return self.space.scalar(array)
+        signature = tuple(U if i.is_up else D for i in free)
+        return self.space.from_array(array, signature)
+
+
+__all__ = ["AbstractSpace"]
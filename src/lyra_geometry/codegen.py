@@ -0,0 +1,214 @@
+import ctypes
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+
+import sympy as sp
+from sympy.printing.c import C99CodePrinter
+
+from .numeric import _check_numeric, _compile_vector, _require_numpy
+
+BACKENDS = ("c", "numpy")
+_CODEGEN_VERSION = "1"
+_FLAGS = ("-O3", "-fno-math-errno", "-fPIC", "-shared")
+
+
+def default_cache_dir():
+    """$LYRA_GEOMETRY_CACHE, or ~/.cache/lyra_geometry."""
+    path = os.environ.get("LYRA_GEOMETRY_CACHE")
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "lyra_geometry")
+
+
+def _c_source(exprs, symbols):
+    # Inputs are renamed to in_j so any coordinate or parameter name is valid C.
+    inputs = [sp.Symbol(f"in_{j}") for j in range(len(symbols))]
+    exprs = [e.xreplace(dict(zip(symbols, inputs))) for e in exprs]
+    replacements, reduced = sp.cse(exprs, symbols=sp.numbered_symbols("cse_"))
+    printer = C99CodePrinter()
+    lines = [
+        "#include <math.h>",
+        "",
+        "void lyra_kernel(const double *const *in, const long *stride, double *out, long n)",
+        "{",
+        "    for (long i = 0; i < n; i++) {",
+    ]
+    for j, s in enumerate(inputs):
+        lines.append(f"        const double {s} = in[{j}][i * stride[{j}]];")
+    for s, e in replacements:
+        lines.append(f"        const double {s} = {printer.doprint(e)};")
+    width = len(reduced)
+    for k, e in enumerate(reduced):
+        lines.append(f"        out[i * {width} + {k}] = {printer.doprint(e)};")
+    lines += ["    }", "}", ""]
+    return "\n".join(lines)
+
+
+def _compile_library(source, path, compiler, flags):
+    compiler_path = shutil.which(compiler)
+    if compiler_path is None:
+        raise RuntimeError(f"C compiler '{compiler}' not found; set CC or use backend=\"numpy\".")
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    with open(path[: -len(".so")] + ".c", "w") as handle:
+        handle.write(source)
+    # Build under a temporary name and rename, so concurrent runs never load a partial file.
+    fd, tmp = tempfile.mkstemp(suffix=".so", dir=directory)
+    os.close(fd)
+    try:
+        result = subprocess.run(
+            [compiler_path, *flags, "-o", tmp, path[: -len(".so")] + ".c", "-lm"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"C compilation failed:\n{result.stderr}")
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+class CompiledKernel:
+    """
+    Batched numeric kernel for a list of symbolic arrays.
+
+    Calling it with a point mapping (Symbols or names -> numbers or arrays
+    that broadcast together; inputs no expression uses may be omitted) returns {name: ndarray} with the broadcast
+    shape leading. The C backend evaluates all outputs in one loop over
+    contiguous input columns (scalars are passed with stride 0); threads
+    splits the loop across threads, since ctypes releases the GIL.
+    """
+
+    def __init__(self, names, shapes, exprs, symbols, backend="c", cache_dir=None, compiler=None, flags=_FLAGS):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Allowed: {', '.join(BACKENDS)}.")
+        self.names = tuple(names)
+        self.shapes = tuple(tuple(s) for s in shapes)
+        self.symbols = tuple(symbols)
+        self.exprs = _check_numeric(exprs, self.symbols)
+        self._used = set().union(*(e.free_symbols for e in self.exprs))
+        self.backend = backend
+        self.path = None
+        self.from_cache = False
+        self._func = None
+        if backend == "c":
+            compiler = compiler or os.environ.get("CC", "cc")
+            key = repr((_CODEGEN_VERSION, compiler, tuple(flags), [str(s) for s in self.symbols]))
+            key += "".join(sp.srepr(e) for e in self.exprs)
+            digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+            self.path = os.path.join(cache_dir or default_cache_dir(), f"lyra_{digest}.so")
+            self.from_cache = os.path.exists(self.path)
+            if not self.from_cache:
+                _compile_library(_c_source(self.exprs, self.symbols), self.path, compiler, flags)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_func"] = None
+        return state
+
+    def __repr__(self):
+        return f"CompiledKernel(names={self.names}, backend={self.backend!r}, inputs={len(self.symbols)})"
+
+    def _load(self):
+        if self._func is None:
+            if self.backend == "numpy":
+                self._func = _compile_vector(self.exprs, self.symbols)
+            else:
+                library = ctypes.CDLL(self.path)
+                kernel = library.lyra_kernel
+                kernel.restype = None
+                kernel.argtypes = [
+                    ctypes.POINTER(ctypes.POINTER(ctypes.c_double)),
+                    ctypes.POINTER(ctypes.c_long),
+                    ctypes.POINTER(ctypes.c_double),
+                    ctypes.c_long,
+                ]
+                self._func = kernel
+        return self._func
+
+    def _columns(self, point):
+        np = _require_numpy()
+        by_name = {str(k): v for k, v in point.items()}
+        columns = []
+        for s in self.symbols:
+            if s in point:
+                columns.append(np.asarray(point[s], dtype=float))
+            elif str(s) in by_name:
+                columns.append(np.asarray(by_name[str(s)], dtype=float))
+            elif s not in self._used:
+                columns.append(np.asarray(0.0))
+            else:
+                raise ValueError(f"Missing value for {s}.")
+        return columns
+
+    def evaluate(self, columns, threads=None):
+        """Raw entry point: 1D float columns (or scalars) -> array of shape (n, len(exprs))."""
+        np = _require_numpy()
+        columns = [np.ascontiguousarray(c, dtype=float) for c in columns]
+        n = max((c.size for c in columns), default=1)
+        width = len(self.exprs)
+        func = self._load()
+        if self.backend == "numpy":
+            return func(*(np.broadcast_to(c.reshape(-1), (n,)) for c in columns)).reshape(n, width)
+        for c in columns:
+            if c.size not in (1, n):
+                raise ValueError("Input columns must have the same length (or be scalars).")
+        out = np.empty((n, width))
+        count = max(len(columns), 1)
+        strides = (ctypes.c_long * count)(*[0 if c.size == 1 and n != 1 else 1 for c in columns])
+        double_p = ctypes.POINTER(ctypes.c_double)
+
+        def run(a, b):
+            pointers = (double_p * count)()
+            for j, c in enumerate(columns):
+                pointers[j] = ctypes.cast(c.ctypes.data + a * strides[j] * c.itemsize, double_p)
+            func(pointers, strides, out[a:b].ctypes.data_as(double_p), b - a)
+
+        if not threads or threads <= 1 or n < 2 * threads:
+            run(0, n)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            bounds = [n * k // threads for k in range(threads + 1)]
+            with ThreadPoolExecutor(threads) as pool:
+                list(pool.map(run, bounds[:-1], bounds[1:]))
+        return out
+
+    def __call__(self, point, threads=None):
+        np = _require_numpy()
+        columns = self._columns(point)
+        shape = np.broadcast_shapes(*(c.shape for c in columns))
+        flat = [c.reshape(-1) if c.size == 1 else np.broadcast_to(c, shape).reshape(-1) for c in columns]
+        values = self.evaluate(flat, threads=threads)
+        out = {}
+        start = 0
+        for name, item_shape in zip(self.names, self.shapes):
+            size = int(np.prod(item_shape, dtype=np.int64))
+            out[name] = values[:, start : start + size].reshape(shape + item_shape)
+            start += size
+        return out
+
+
+def compile_kernel(arrays, symbols, names=None, backend="c", cache_dir=None, compiler=None):
+    """
+    CSE-optimized batched kernel for sympy arrays (or scalars) over symbols.
+
+    With backend="c" the generated C is built by the system compiler ($CC,
+    default cc) into a shared library cached in cache_dir (default
+    default_cache_dir()) under a hash of the expressions, so later runs
+    load it without regenerating.
+    """
+    arrays = [a if isinstance(a, sp.NDimArray) else sp.Array(sp.sympify(a)) for a in arrays]
+    names = list(names) if names is not None else [f"array_{k}" for k in range(len(arrays))]
+    exprs = []
+    for a in arrays:
+        exprs.extend([sp.sympify(a[()])] if a.rank() == 0 else sp.flatten(a))
+    return CompiledKernel(names, [a.shape for a in arrays], exprs, symbols, backend, cache_dir, compiler)
+
+
+__all__ = ["BACKENDS", "CompiledKernel", "compile_kernel", "default_cache_dir"]
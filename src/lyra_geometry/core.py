@@ -17,13 +17,32 @@ from .tensors import (
     U,
     Up,
     UpIndex,
+    _dependency_mask,
+    _detect_symmetries,
     _expand_indices,
+    _normalize_symmetries,
     _parse_tensor_token,
+    _same_expr,
+    _symmetry_orbits,
     _validate_signature,
     d,
     table,
     u,
 )
+from .abstract import AbstractSpace
+from .codegen import compile_kernel
+from .domains import Domains
+from .grid import GridSpace
+from .field_equations import reduce_field_equations
+from .geodesics import connection_geodesics, euler_lagrange_geodesics, first_integrals
+from .hamiltonian import CompiledHamiltonian, geodesic_hamiltonian
+from .linalg import metric_inverse
+from .lyapunov import VariationalEquations
+from .numeric import _require_numpy, sweep_arrays, sweep_stats
+from .numeric_tensors import NumericSpace
+from .pointwise import _components, numeric_curvature
+from .rational import ALGEBRAS, RationalAlgebra, RationalGeometry, jet_functions, trig_angles
+from .zero_test import ZERO_TESTS, probably_zero
 
 
 class ConnectionStrategy:
@@ -80,23 +99,30 @@ class LyraConnectionStrategy(ConnectionStrategy):
         g = space.metric.components
         g_inv = space.metric_inv
         phi = space.scale.expr if isinstance(space.scale, Tensor) else space.scale
-        M = space.nonmetricity
-        tau = space.torsion
-        chris = space.christoffel2
+        M = space.nonmetricity(U, D, D).components
+        tau = space.torsion(D, D, D).components
+        chris = space.christoffel2.components
+
+        dphi = [space._diff(phi, s) for s in range(dim)]
 
         def connection_element(b, l, n):
             return (
                 1 / phi * chris[b, l, n]
-                - sp.Rational(1, 2) * M(U, D, D)[b, l, n]
+                - sp.Rational(1, 2) * M[b, l, n]
                 + 1 / (phi) * (
-                    sp.KroneckerDelta(b, n) * 1 / phi * sp.diff(phi, coords[l])
-                    - sum((1 / phi) * g[l, n] * g_inv[b, s] * sp.diff(phi, coords[s]) for s in range(dim))
+                    sp.KroneckerDelta(b, n) * 1 / phi * dphi[l]
+                    - sum(
+                        (1 / phi) * g[l, n] * g_inv[b, s] * dphi[s]
+                        for s in range(dim)
+                        if dphi[s] != 0 and g_inv[b, s] != 0
+                    )
                 )
                 + sp.Rational(1, 2) * sum(
                     g_inv[m, b] * (
-                        tau(D, D, D)[l, m, n] - tau(D, D, D)[n, l, m] - tau(D, D, D)[m, l, n]
+                        tau[l, m, n] - tau[n, l, m] - tau[m, l, n]
                     )
                     for m in range(dim)
+                    if g_inv[m, b] != 0
                 )
             )
 
@@ -114,30 +140,78 @@ class LyraCurvatureStrategy(CurvatureStrategy):
         phi = space.phi.expr if isinstance(space.phi, Tensor) else space.phi
         riemann_sign = space.riemann_convention_sign
 
+        # phi * Gamma and its coordinate dependencies, so vanishing derivatives are skipped
+        A = {}
+        for key in itertools.product(range(dim), repeat=3):
+            if Gamma[key] != 0:
+                value = phi * Gamma[key]
+                A[key] = (value, _dependency_mask(value, coords))
+
+        def dA(l, a, n, m):
+            if (l, a, n) not in A:
+                return 0
+            value, mask = A[l, a, n]
+            return space._diff(value, m, mask)
+
         def curvature_element(l, a, m, n):
             return riemann_sign * (
-                1 / (phi**2) * sp.diff(phi * Gamma[l, a, n], coords[m])
-                - 1 / (phi**2) * sp.diff(phi * Gamma[l, a, m], coords[n])
-                + sum(Gamma[r, a, n] * Gamma[l, r, m] for r in range(dim))
-                - sum(Gamma[r, a, m] * Gamma[l, r, n] for r in range(dim))
+                1 / (phi**2) * dA(l, a, n, m)
+                - 1 / (phi**2) * dA(l, a, m, n)
+                + sum(Gamma[r, a, n] * Gamma[l, r, m] for r in range(dim) if (r, a, n) in A and (l, r, m) in A)
+                - sum(Gamma[r, a, m] * Gamma[l, r, n] for r in range(dim) if (r, a, m) in A and (l, r, n) in A)
             )
 
         Riem = space.from_function(curvature_element, signature=(U, D, D, D), name="Riemann", label="R")
+        Ricc, Ein, scalar_curvature = _contract_riemann(space, Riem)
+        return Riem, Ricc, Ein, scalar_curvature
 
-        def ricci_element(a, m):
-            return sp.simplify(sum(Riem(U, D, D, D).comp[l, a, m, l] for l in range(dim)))
-
-        Ricc = space.from_function(ricci_element, signature=(D, D), name="Ricci", label="Ric")
-
-        g_inv = space.metric_inv
-        scalar_R = sp.simplify(sum(g_inv[a, b] * Ricc.comp[a, b] for a in range(dim) for b in range(dim)))
 
-        def einstein_element(a, b):
-            return sp.simplify(Ricc.comp[a, b] - sp.Rational(1, 2) * space.g.components[a, b] * scalar_R)
-
-        Ein = space.from_function(einstein_element, signature=(D, D), name="Einstein", label="G")
-        scalar_curvature = space.scalar(scalar_R, name="R", label="R")
-        return Riem, Ricc, Ein, scalar_curvature
+def _contract_riemann(space, Riem, simplify=None):
+    dim = space.dim
+    simplify = simplify or space._simplify
+    R = Riem.as_signature((U, D, D, D))
+
+    def ricci_element(a, m):
+        return simplify(sum(R[l, a, m, l] for l in range(dim)))
+
+    Ricc = space.from_function(ricci_element, signature=(D, D), name="Ricci", label="Ric")
+
+    g_inv = space.metric_inv
+    scalar_R = simplify(sum(g_inv[a, b] * Ricc.comp[a, b] for a in range(dim) for b in range(dim)))
+
+    def einstein_element(a, b):
+        return simplify(Ricc.comp[a, b] - sp.Rational(1, 2) * space.g.components[a, b] * scalar_R)
+
+    Ein = space.from_function(einstein_element, signature=(D, D), name="Einstein", label="G")
+    scalar_curvature = space.scalar(scalar_R, name="R", label="R")
+    return Ricc, Ein, scalar_curvature
+
+
+def _transform_array(array, signature, jacobian, inverse_jacobian, subs):
+    """Components in the new chart: substitute the old coordinates, then apply one Jacobian per index."""
+    shape = array.shape
+    dim = shape[0] if shape else 0
+    rank = len(shape)
+    current = {}
+    for idx in itertools.product(range(dim), repeat=rank):
+        value = sp.sympify(array[idx])
+        if value != 0:
+            current[idx] = value.subs(subs, simultaneous=True)
+    for pos, variance in enumerate(signature):
+        updated = {}
+        for idx, value in current.items():
+            mu = idx[pos]
+            for alpha in range(dim):
+                factor = jacobian[mu, alpha] if variance is D else inverse_jacobian[alpha, mu]
+                if factor != 0:
+                    key = idx[:pos] + (alpha,) + idx[pos + 1:]
+                    updated[key] = updated.get(key, 0) + factor * value
+        current = updated
+    if rank == 0:
+        return current.get((), sp.Integer(0))
+    return sp.ImmutableDenseNDimArray(
+        [current.get(idx, sp.Integer(0)) for idx in itertools.product(range(dim), repeat=rank)], shape
+    )
 
 
 class FixedConnectionStrategy(ConnectionStrategy):
@@ -159,18 +233,33 @@ class TensorSpace:
         connection_strategy=None,
         curvature_strategy=None,
         riemann_convention="mtw",
+        algebra="expr",
+        domains=None,
+        zero_test="off",
     ):
+        if algebra not in ALGEBRAS:
+            raise ValueError(f"Unknown algebra '{algebra}'. Allowed: {', '.join(ALGEBRAS)}.")
+        if zero_test not in ZERO_TESTS:
+            raise ValueError(f"Unknown zero_test '{zero_test}'. Allowed: {', '.join(ZERO_TESTS)}.")
+        self.algebra = algebra
+        self.zero_test = zero_test
+        self._rational = None
+        self.domains = Domains(domains)
         self.dim = dim if dim else len(coords)
-        self.coords = tuple(coords)
+        self.coords = tuple(self.domains.apply(c) for c in coords)
+        metric = self._assume_array(metric)
+        metric_inv = self._assume_array(metric_inv)
+        connection = self._assume_array(connection)
         self._tensor_count = 0
         self._label_count = 0
         self._registry = {}
         self.metric = Metric(sp.Array(metric), self, signature=(D, D), name="g", label="g") if metric is not None else None
         self._metric_inv = None
-        if metric is not None:
-            self._metric_inv = (
-                sp.Array(metric_inv) if metric_inv is not None else sp.Array(sp.Matrix(metric).inv())
-            )
+        if metric_inv is not None:
+            self._metric_inv = sp.Array(metric_inv)
+        elif metric is not None and algebra == "expr":
+            # Other algebras invert in the fraction field during update(), falling back to metric_inv.
+            self._metric_inv = sp.Array(metric_inverse(metric)[0])
         self.metric_tensor = None
         self.metric_inv_tensor = None
         self.g = None
@@ -179,8 +268,8 @@ class TensorSpace:
         self.christoffel1 = None
         self._connection_tensor = None
         self.delta = self._build_kronecker_delta()
-        self.levi_civita = self._build_levi_civita_symbol()
-        self.epsilon = self.levi_civita
+        self._levi_civita = None
+        self._abstract = None
         if self.metric is not None:
             self.metric_tensor = self.register(self.metric)
         if self._metric_inv is not None:
@@ -210,10 +299,21 @@ class TensorSpace:
         self.scalar_curvature = None
         self.update()
 
+    def _assume_array(self, array):
+        return self.domains.apply(sp.Array(array)) if array is not None and self.domains else array
+
+    def _simplify(self, expr):
+        if self.zero_test != "off" and probably_zero(expr, self.domains):
+            # "verified" keeps the numeric verdict only when the expanded numerator is exactly zero.
+            if self.zero_test == "numeric" or sp.expand(sp.numer(sp.together(expr))) == 0:
+                return sp.Integer(0)
+        return self.domains.simplify(expr)
+
     def _coord_symbol(self, coord):
         if isinstance(coord, int):
             return self.coords[coord]
         if isinstance(coord, sp.Basic):
+            coord = self.domains.apply(coord)
             if coord in self.coords:
                 return coord
             raise ValueError("Unknown coordinate.")
@@ -233,13 +333,27 @@ class TensorSpace:
             raise ValueError("Number of indices must equal dim.")
         return tuple(CoordIndex(str(p), i) for i, p in enumerate(parts))
 
+    def _diff(self, expr, coord_index, mask=None):
+        """Partial derivative along coords[coord_index]; zero without differentiating when mask rules it out."""
+        if mask is None:
+            mask = _dependency_mask(expr, self.coords)
+        if not mask >> coord_index & 1:
+            return sp.Integer(0)
+        return sp.diff(expr, self.coords[coord_index])
+
     def set_metric(self, metric, metric_inv=None):
+        metric = self._assume_array(metric)
+        metric_inv = self._assume_array(metric_inv)
         self.metric = Metric(sp.Array(metric), self, signature=(D, D), name="g", label="g")
+        self.metric_tensor = self.register(self.metric)
+        if metric_inv is None and self.algebra != "expr":
+            self._metric_inv = None
+            self.metric_inv_tensor = None
+            return
         if metric_inv is None:
-            self._metric_inv = sp.Array(sp.Matrix(metric).inv())
+            self._metric_inv = sp.Array(metric_inverse(metric)[0])
         else:
             self._metric_inv = sp.Array(metric_inv)
-        self.metric_tensor = self.register(self.metric)
         self.metric_inv_tensor = self.register(
             Tensor(self._metric_inv, self, signature=(U, U), name="g_inv", label="g_inv")
         )
@@ -247,7 +361,7 @@ class TensorSpace:
     @property
     def metric_inv(self):
         if self._metric_inv is None and self.metric is not None:
-            self._metric_inv = sp.Array(sp.Matrix(self.metric.components).inv())
+            self._metric_inv = sp.Array(metric_inverse(self.metric.components.tomatrix())[0])
             self.metric_inv_tensor = self.register(
                 Tensor(self._metric_inv, self, signature=(U, U), name="g_inv", label="g_inv")
             )
@@ -256,9 +370,27 @@ class TensorSpace:
     @property
     def detg(self):
         if self._detg is None and self.metric is not None:
-            self._detg = sp.simplify(sp.Matrix(self.metric.components).det())
+            self._detg = self._simplify(metric_inverse(self.metric.components.tomatrix())[1])
         return self._detg
 
+    @property
+    def levi_civita(self):
+        # dim**dim components: built on first use so high-dimensional spaces stay cheap
+        if self._levi_civita is None:
+            self._levi_civita = self._build_levi_civita_symbol()
+        return self._levi_civita
+
+    @property
+    def epsilon(self):
+        return self.levi_civita
+
+    @property
+    def abstract(self):
+        """AbstractSpace for index-free identities on this space, built on first use."""
+        if self._abstract is None:
+            self._abstract = AbstractSpace(self)
+        return self._abstract
+
     @property
     def connection(self):
         return self._connection_tensor
@@ -301,9 +433,13 @@ class TensorSpace:
         return tensor
 
     def get(self, name):
+        if name == "levi_civita" and self._levi_civita is None:
+            # Lazy like the levi_civita property, but visible to name lookups.
+            return self.levi_civita
         return self._registry.get(name)
 
     def set_connection(self, connection):
+        connection = self._assume_array(connection)
         self.connection_strategy = FixedConnectionStrategy(connection)
         self.gamma = Connection(connection, space=self)
         if connection is not None:
@@ -316,6 +452,8 @@ class TensorSpace:
             if coord_index is None:
                 coord_index = 1 if len(self.coords) > 1 else 0
             phi = sp.Function("phi")(self.coords[coord_index])
+        elif not isinstance(phi, Tensor):
+            phi = self.domains.apply(phi)
         self.scale = self.scalar(phi, name="phi", label="phi")
         self.phi = self.scale
         return self.scale
@@ -350,17 +488,33 @@ class TensorSpace:
             self.christoffel1 = None
             return
 
+        geometry = self._rational_geometry()
+        if geometry is not None:
+            self._detg = geometry.algebra.to_expr(geometry.detg)
+            self.christoffel1 = IndexedArray(
+                geometry.array(geometry.christoffel1, 3), self, signature=(D, D, D), name="christoffel1"
+            )
+            self.christoffel2 = IndexedArray(
+                geometry.array(geometry.christoffel2, 3), self, signature=(U, D, D), name="christoffel2"
+            )
+            return
+
         g = self.metric.components
         coords = self.coords
         dim = self.dim
-        self._detg = sp.simplify(sp.Matrix(g).det())
+        self._detg = self._simplify(metric_inverse(g.tomatrix())[1])
+
+        masks = self.metric.dependency_mask
+
+        def dg(a, b, k):
+            return self._diff(g[a, b], k, masks[a * dim + b])
 
         chris1 = [[[
             sp.Rational(1, 2)
             * (
-                sp.diff(g[a, c], coords[b])
-                + sp.diff(g[a, b], coords[c])
-                - sp.diff(g[b, c], coords[a])
+                dg(a, c, b)
+                + dg(a, b, c)
+                - dg(b, c, a)
             )
             for c in range(dim)
         ] for b in range(dim)] for a in range(dim)]
@@ -368,17 +522,105 @@ class TensorSpace:
 
         g_inv = self.metric_inv
         chris2 = [[[
-            sum(g_inv[a, D] * self.christoffel1[D, b, c] for D in range(dim))
+            sum(g_inv[a, e] * chris1[e][b][c] for e in range(dim) if g_inv[a, e] != 0 and chris1[e][b][c] != 0)
             for c in range(dim)
         ] for b in range(dim)] for a in range(dim)]
         self.christoffel2 = IndexedArray(sp.Array(chris2), self, signature=(U, D, D), name="christoffel2")
 
+    def _rational_geometry(self):
+        """
+        RationalGeometry of the current metric (cached), or None on the Expr
+        path: algebra="expr", no metric, or algebra="auto" with a metric that
+        is not a rational function of the coordinates, parameters, sin/cos
+        of them and undefined functions with their derivatives.
+        """
+        if self.algebra == "expr" or self.metric is None:
+            self._rational = None
+            return None
+        g = self.metric.components
+        phi = self.phi.expr if isinstance(self.phi, Tensor) else sp.sympify(self.phi)
+        inputs = [*sp.flatten(g), phi, *sp.flatten(self.torsion.components), *sp.flatten(self.nonmetricity.components)]
+        symbols = set().union(*(sp.sympify(e).free_symbols for e in inputs))
+        angles = trig_angles(inputs)
+        # Curvature differentiates the inputs twice, so keep two more jet orders than they use.
+        functions = {f: order + 2 for f, order in jet_functions(inputs).items()}
+        if self._rational is not None:
+            source, geometry = self._rational
+            algebra = geometry.algebra
+            if (
+                source is g
+                and symbols <= set(algebra.symbols)
+                and angles <= set(algebra.angles)
+                and all(algebra.functions.get(f, -1) >= order for f, order in functions.items())
+            ):
+                return geometry
+        try:
+            algebra = RationalAlgebra(self.coords, symbols, angles, functions)
+            geometry = RationalGeometry(algebra, g, self._metric_inv)
+        except ValueError:
+            if self.algebra == "rational":
+                raise
+            self._rational = None
+            return None
+        self._rational = (g, geometry)
+        if self._metric_inv is None:
+            self._metric_inv = geometry.array(geometry.g_inv, 2)
+            self.metric_inv_tensor = self.register(
+                Tensor(self._metric_inv, self, signature=(U, U), name="g_inv", label="g_inv")
+            )
+        return geometry
+
+    def _rational_connection(self):
+        geometry = self._rational_geometry()
+        if geometry is None:
+            return None
+        phi = self.phi.expr if isinstance(self.phi, Tensor) else sp.sympify(self.phi)
+        try:
+            gamma = geometry.lyra_connection(
+                phi, self.torsion(D, D, D).components, self.nonmetricity(U, D, D).components
+            )
+        except ValueError:
+            if self.algebra == "rational":
+                raise
+            return None
+        return geometry.array(gamma, 3)
+
+    def _rational_curvature(self, gamma_components):
+        geometry = self._rational_geometry()
+        if geometry is None or gamma_components is None:
+            return None
+        phi = self.phi.expr if isinstance(self.phi, Tensor) else sp.sympify(self.phi)
+        try:
+            connection = geometry.connection
+            if connection is None:
+                connection = {}
+                for idx in itertools.product(range(self.dim), repeat=3):
+                    if gamma_components[idx] != 0:
+                        connection[idx] = geometry.algebra.convert(gamma_components[idx])
+            riem, ricc, ein, scalar_R = geometry.lyra_curvature(phi, self.riemann_convention_sign, connection)
+        except ValueError:
+            if self.algebra == "rational":
+                raise
+            return None
+        return (
+            self.from_array(geometry.array(riem, 4), (U, D, D, D), name="Riemann", label="R"),
+            self.from_array(geometry.array(ricc, 2), (D, D), name="Ricci", label="Ric"),
+            self.from_array(geometry.array(ein, 2), (D, D), name="Einstein", label="G"),
+            self.scalar(geometry.array(scalar_R, 0), name="R", label="R"),
+        )
+
     def _update_connection(self):
+        if self._rational is not None:
+            self._rational[1].connection = None
         if self.connection_strategy is None:
             self.gamma = Connection(None, space=self)
             self._connection_tensor = None
             return
-        Gamma = self.connection_strategy.build(self)
+        Gamma = None
+        if type(self.connection_strategy) is LyraConnectionStrategy:
+            Gamma = self._rational_connection()
+        if Gamma is None:
+            Gamma = self.connection_strategy.build(self)
         self.gamma = Connection(Gamma, space=self) if Gamma is not None else Connection(None, space=self)
         if Gamma is not None:
             self._connection_tensor = ConnectionTensor(sp.Array(Gamma), self, signature=(U, D, D), name="connection")
@@ -392,7 +634,14 @@ class TensorSpace:
             self.einstein = None
             self.scalar_curvature = None
             return
-        riem, ricc, ein, scalar = self.curvature_strategy.build(self, self.gamma.components)
+        if self._rational is not None:
+            self._rational[1].riemann = None
+        result = None
+        if type(self.curvature_strategy) is LyraCurvatureStrategy:
+            result = self._rational_curvature(self.gamma.components)
+        if result is None:
+            result = self.curvature_strategy.build(self, self.gamma.components)
+        riem, ricc, ein, scalar = result
         self.riemann = riem
         self.ricci = ricc
         self.einstein = ein
@@ -422,22 +671,276 @@ class TensorSpace:
         if "riemann" in steps or "ricci" in steps or "einstein" in steps:
             self._update_riemann()
 
-    def from_function(self, func, signature, name=None, label=None):
+    def _adopt_geometry(self, metric, metric_inv, detg, christoffel2, connection=None, curvature=None):
+        """Install precomputed metric, connection and curvature without rerunning update()."""
+        dim = self.dim
+        self.set_metric(metric, metric_inv=metric_inv)
+        self.g = self.metric
+        self._detg = detg
+        g = self.metric.components
+        chris1 = [[[
+            sum(g[a, e] * christoffel2[e, b, c] for e in range(dim) if g[a, e] != 0)
+            for c in range(dim)
+        ] for b in range(dim)] for a in range(dim)]
+        self.christoffel1 = IndexedArray(sp.Array(chris1), self, signature=(D, D, D), name="christoffel1")
+        self.christoffel2 = IndexedArray(sp.Array(christoffel2), self, signature=(U, D, D), name="christoffel2")
+        if connection is not None:
+            self.gamma = Connection(connection, space=self)
+            self._connection_tensor = ConnectionTensor(
+                sp.Array(connection), self, signature=(U, D, D), name="connection"
+            )
+        if curvature is not None:
+            riem, ricc, ein, scalar_R = curvature
+            self.riemann = self.from_array(riem, (U, D, D, D), name="Riemann", label="R")
+            self.ricci = self.from_array(ricc, (D, D), name="Ricci", label="Ric")
+            self.einstein = self.from_array(ein, (D, D), name="Einstein", label="G")
+            self.scalar_curvature = self.scalar(scalar_R, name="R", label="R")
+        return self
+
+    def _derived_space(self, coords=None):
+        """Empty space sharing strategies and conventions, ready for _adopt_geometry."""
+        connection_strategy = self.connection_strategy
+        if isinstance(connection_strategy, FixedConnectionStrategy):
+            connection_strategy = None
+        return type(self)(
+            coords if coords is not None else self.coords,
+            connection_strategy=connection_strategy,
+            curvature_strategy=self.curvature_strategy,
+            riemann_convention=self.riemann_convention,
+            algebra=self.algebra,
+            domains=self.domains,
+            zero_test=self.zero_test,
+        )
+
+    def conformal(self, omega):
+        """
+        Space with metric omega**2 * g built from this space's cached geometry.
+
+        Christoffel symbols, connection, Riemann, Ricci, Einstein and scalar
+        curvature follow from the conformal transformation laws applied to the
+        parent results; only derivatives of omega are computed.
+        """
+        if self.metric is None:
+            raise ValueError("Define the metric before a conformal rescaling.")
+        if self.riemann is None or self.ricci is None or self.gamma.components is None:
+            raise ValueError("Compute the curvature (space.update()) before a conformal rescaling.")
+        M = self.nonmetricity.components if isinstance(self.nonmetricity, Tensor) else sp.Array(self.nonmetricity)
+        tau = self.torsion.components if isinstance(self.torsion, Tensor) else sp.Array(self.torsion)
+        if any(v != 0 for v in sp.flatten(M)) or any(v != 0 for v in sp.flatten(tau)):
+            raise ValueError("conformal() requires vanishing torsion and non-metricity.")
+        omega = omega.expr if isinstance(omega, Tensor) else self.domains.apply(sp.sympify(omega))
+
+        dim = self.dim
+        coords = self.coords
+        g = self.metric.components
+        g_inv = self.metric_inv
+        phi = self.phi.expr if isinstance(self.phi, Tensor) else self.phi
+        riemann_sign = self.riemann_convention_sign
+        Gamma = self.gamma.components
+        chris = self.christoffel2
+
+        # Omega**2 g shifts the connection by C^a_bc = d_b(w) delta^a_c + d_c(w) delta^a_b - g_bc d^a(w)
+        w = [sp.diff(omega, x) / omega for x in coords]
+        w_up = [sum(g_inv[a, s] * w[s] for s in range(dim)) for a in range(dim)]
+        C = [[[
+            sp.KroneckerDelta(a, b) * w[c] + sp.KroneckerDelta(a, c) * w[b] - g[b, c] * w_up[a]
+            for c in range(dim)
+        ] for b in range(dim)] for a in range(dim)]
+
+        chris_new = [[[chris[a, b, c] + C[a][b][c] for c in range(dim)] for b in range(dim)] for a in range(dim)]
+        gamma_new = [[[Gamma[a, b, c] + C[a][b][c] / phi for c in range(dim)] for b in range(dim)] for a in range(dim)]
+
+        # phi**2 Riemann = sign (dA + A ^ A) with A = phi Gamma; A -> A + C adds dC + [A, C] + C ^ C.
+        def shift(l, a, m, n):
+            value = sp.diff(C[l][a][n], coords[m]) - sp.diff(C[l][a][m], coords[n])
+            for r in range(dim):
+                A_lrm, A_lrn = phi * Gamma[l, r, m], phi * Gamma[l, r, n]
+                A_ran, A_ram = phi * Gamma[r, a, n], phi * Gamma[r, a, m]
+                value += (A_ran + C[r][a][n]) * C[l][r][m] + C[r][a][n] * A_lrm
+                value -= (A_ram + C[r][a][m]) * C[l][r][n] + C[r][a][m] * A_lrn
+            return riemann_sign * value / phi**2
+
+        delta_riem = {}
+        for l, a in itertools.product(range(dim), repeat=2):
+            for m, n in itertools.combinations(range(dim), 2):
+                value = shift(l, a, m, n)
+                if value != 0:
+                    delta_riem[l, a, m, n] = value
+                    delta_riem[l, a, n, m] = -value
+
+        R_old = self.riemann.as_signature((U, D, D, D))
+        riem_new = [[[[
+            R_old[l, a, m, n] + delta_riem.get((l, a, m, n), 0)
+            for n in range(dim)] for m in range(dim)] for a in range(dim)] for l in range(dim)]
+
+        delta_ricc = [[
+            self._simplify(sum(delta_riem.get((l, a, m, l), 0) for l in range(dim)))
+            for m in range(dim)] for a in range(dim)]
+        delta_scalar = self._simplify(
+            sum(g_inv[a, b] * delta_ricc[a][b] for a in range(dim) for b in range(dim))
+        )
+        ricc_old = self.ricci.components
+        ein_old = self.einstein.components
+        scalar_old = self.scalar_curvature.components[()]
+        ricc_new = [[ricc_old[a, b] + delta_ricc[a][b] for b in range(dim)] for a in range(dim)]
+        ein_new = [[
+            ein_old[a, b] + self._simplify(delta_ricc[a][b] - sp.Rational(1, 2) * g[a, b] * delta_scalar)
+            for b in range(dim)] for a in range(dim)]
+        scalar_new = self._simplify((scalar_old + delta_scalar) / omega**2)
+
+        metric_new = sp.Array([[omega**2 * g[a, b] for b in range(dim)] for a in range(dim)])
+        metric_inv_new = sp.Array([[g_inv[a, b] / omega**2 for b in range(dim)] for a in range(dim)])
+        detg_new = self.detg * omega ** (2 * dim) if self.detg is not None else None
+
+        child = self._derived_space()
+        child.set_scale(phi)
+        return child._adopt_geometry(
+            metric_new,
+            metric_inv_new,
+            detg_new,
+            sp.Array(chris_new),
+            connection=sp.Array(gamma_new),
+            curvature=(sp.Array(riem_new), sp.Array(ricc_new), sp.Array(ein_new), scalar_new),
+        )
+
+    def transform(self, new_coords, mapping, simplify=True):
+        """
+        Same geometry in a new chart, transported from the cached tensors.
+
+        mapping gives the old coordinates as functions of new_coords (a dict
+        keyed by old coordinate, or a sequence in the order of self.coords).
+        The Jacobian dx/dy and its inverse are computed once and kept on the
+        new space as jacobian/inverse_jacobian. Every registered tensor is
+        transformed with one Jacobian per index; the connection picks up the
+        inhomogeneous second-derivative term. Curvature is never recomputed.
+        With simplify=True the metric, its inverse, Ricci, Einstein and the
+        scalar curvature are simplified; Riemann and the connection are left as is.
+        """
+        new_coords = tuple(self.domains.apply(c) for c in new_coords)
+        dim = self.dim
+        if len(new_coords) != dim:
+            raise ValueError("Number of new coordinates must equal dim.")
+        if isinstance(mapping, dict):
+            mapping = {k if isinstance(k, str) else self.domains.apply(k): v for k, v in mapping.items()}
+            exprs = []
+            for x in self.coords:
+                if x in mapping:
+                    exprs.append(self.domains.apply(mapping[x]))
+                elif str(x) in mapping:
+                    exprs.append(self.domains.apply(mapping[str(x)]))
+                elif x in new_coords:
+                    exprs.append(x)
+                else:
+                    raise ValueError(f"mapping does not define old coordinate {x}.")
+        else:
+            exprs = [sp.sympify(self.domains.apply(v)) for v in mapping]
+            if len(exprs) != dim:
+                raise ValueError("mapping must give one expression per old coordinate.")
+        subs = dict(zip(self.coords, exprs))
+
+        jacobian = sp.Matrix(dim, dim, lambda mu, a: sp.diff(exprs[mu], new_coords[a]))
+        if jacobian.det() == 0:
+            raise ValueError("Coordinate mapping has a singular Jacobian.")
+        jacobian = jacobian.applyfunc(self._simplify)
+        inverse_jacobian = jacobian.inv().applyfunc(self._simplify)
+
+        def transport(tensor):
+            return _transform_array(tensor.components, tensor.signature, jacobian, inverse_jacobian, subs)
+
+        def polish(array):
+            return array.applyfunc(self._simplify) if simplify else array
+
+        phi = self.phi.expr if isinstance(self.phi, Tensor) else sp.sympify(self.phi)
+        phi_new = phi.subs(subs, simultaneous=True)
+
+        child = self._derived_space(coords=new_coords)
+        child.jacobian = jacobian
+        child.inverse_jacobian = inverse_jacobian
+        child.set_scale(phi_new)
+        child.torsion = child.from_array(transport(self.torsion(D, D, D)), (D, D, D), name="tau", label="tau")
+        child.nonmetricity = child.from_array(
+            transport(self.nonmetricity(U, D, D)), (U, D, D), name="M", label="M"
+        )
+
+        if self.metric is None:
+            return child
+
+        metric = polish(transport(self.metric))
+        metric_inv = polish(
+            _transform_array(self.metric_inv, (U, U), jacobian, inverse_jacobian, subs)
+        )
+        detg = self.detg
+        if detg is not None:
+            detg = detg.subs(subs, simultaneous=True) * jacobian.det() ** 2
+            if simplify:
+                detg = self._simplify(detg)
+
+        # Gamma'^a_bc = (dy^a/dx^m) (J^n_b J^r_c Gamma^m_nr + d^2 x^m / dy^b dy^c / phi)
+        second = [[[sp.diff(exprs[m], new_coords[b], new_coords[c]) for c in range(dim)]
+                   for b in range(dim)] for m in range(dim)]
+
+        def inhomogeneous(scale):
+            return sp.ImmutableDenseNDimArray([
+                sum(inverse_jacobian[a, m] * second[m][b][c] for m in range(dim) if second[m][b][c] != 0)
+                / scale
+                for a, b, c in itertools.product(range(dim), repeat=3)
+            ], (dim, dim, dim))
+
+        christoffel2 = _transform_array(self.christoffel2.components, (U, D, D), jacobian, inverse_jacobian, subs)
+        christoffel2 = christoffel2 + inhomogeneous(1)
+        connection = None
+        if self.gamma.components is not None:
+            connection = _transform_array(
+                sp.Array(self.gamma.components), (U, D, D), jacobian, inverse_jacobian, subs
+            ) + inhomogeneous(phi_new)
+
+        curvature = None
+        if self.riemann is not None:
+            curvature = (
+                transport(self.riemann),
+                polish(transport(self.ricci)),
+                polish(transport(self.einstein)),
+                self._simplify(transport(self.scalar_curvature)) if simplify else transport(self.scalar_curvature),
+            )
+        child._adopt_geometry(metric, metric_inv, detg, christoffel2, connection=connection, curvature=curvature)
+
+        handled = {"g", "g_inv", "phi", "tau", "M", "Riemann", "Ricci", "Einstein", "R"}
+        for name, tensor in self._registry.items():
+            if name in handled or isinstance(tensor, IndexedArray) or not isinstance(tensor, Tensor):
+                continue
+            child.register(
+                Tensor(
+                    transport(tensor),
+                    child,
+                    signature=tensor.signature,
+                    name=tensor.name,
+                    label=tensor.label,
+                    symmetries=tensor.symmetries,
+                )
+            )
+        return child
+
+    def from_function(self, func, signature, name=None, label=None, symmetries=None):
         rank = len(signature)
         signature = _validate_signature(signature, rank)
         shape = (self.dim,) * rank
-        flat = [func(*idx) for idx in itertools.product(range(self.dim), repeat=rank)]
+        flat = [self.domains.apply(func(*idx)) for idx in itertools.product(range(self.dim), repeat=rank)]
         arr = sp.ImmutableDenseNDimArray(flat, shape)
-        return self.register(Tensor(arr, self, signature=signature, name=name, label=label))
+        return self.register(
+            Tensor(arr, self, signature=signature, name=name, label=label, symmetries=symmetries)
+        )
 
-    def from_array(self, array, signature, name=None, label=None):
+    def from_array(self, array, signature, name=None, label=None, symmetries=None):
         if not isinstance(array, (sp.Array, sp.ImmutableDenseNDimArray)):
             array = sp.Array(array)
+        array = self._assume_array(array)
         rank = len(array.shape)
         signature = _validate_signature(signature, rank)
         if not isinstance(array, sp.ImmutableDenseNDimArray):
             array = sp.ImmutableDenseNDimArray(array)
-        return self.register(Tensor(array, self, signature=signature, name=name, label=label))
+        return self.register(
+            Tensor(array, self, signature=signature, name=name, label=label, symmetries=symmetries)
+        )
 
     def zeros(self, signature, name=None, label=None):
         signature = _validate_signature(signature, len(signature))
@@ -446,7 +949,7 @@ class TensorSpace:
         return self.register(Tensor(arr, self, signature=signature, name=name, label=label))
 
     def scalar(self, expr, name=None, label=None):
-        return self.register(Tensor(sp.Array(expr), self, signature=(), name=name, label=label))
+        return self.register(Tensor(self.domains.apply(sp.Array(expr)), self, signature=(), name=name, label=label))
 
     def tensor(self, tensor, index=None, name=None, label=None):
         if isinstance(tensor, IndexedTensor):
@@ -509,24 +1012,62 @@ class TensorSpace:
         result._labels = list(target_labels)
         return result
 
-    def generic(self, name, signature, coords=None, label=None):
+    def generic(self, name, signature, coords=None, label=None, symmetries=None):
         signature = _validate_signature(signature, len(signature))
-        coords = self.coords if coords is None else tuple(coords)
+        coords = self.coords if coords is None else tuple(self.domains.apply(c) for c in coords)
         rank = len(signature)
         shape = (self.dim,) * rank
+        tensor_symmetries = _normalize_symmetries(symmetries, signature)
+        orbits = _symmetry_orbits(self.dim, rank, tensor_symmetries) if tensor_symmetries else None
 
         def comp(*idx):
+            sign = 1
+            if orbits is not None:
+                idx, sign = orbits[idx]
+                if sign == 0:
+                    return sp.Integer(0)
             suf = "".join(map(str, idx))
-            return sp.Function(f"{name}{suf}")(*coords)
+            return sign * sp.Function(f"{name}{suf}")(*coords)
 
         flat = [comp(*idx) for idx in itertools.product(range(self.dim), repeat=rank)]
         arr = sp.ImmutableDenseNDimArray(flat, shape)
-        return self.register(Tensor(arr, self, signature=signature, name=name, label=label or name))
+        return self.register(
+            Tensor(arr, self, signature=signature, name=name, label=label or name, symmetries=tensor_symmetries)
+        )
 
-    def nabla(self, tensor, order=1, deriv_position="prepend"):
+    def _connection_lower_symmetric(self):
+        connection = self.connection
+        if connection is None:
+            return False
+        cached = getattr(connection, "_lower_symmetric", None)
+        if cached is None:
+            Gamma = connection.components
+            dim = self.dim
+            cached = all(
+                _same_expr(Gamma[a, b, c], Gamma[a, c, b])
+                for a in range(dim)
+                for b in range(dim)
+                for c in range(b + 1, dim)
+            )
+            connection._lower_symmetric = cached
+        return cached
+
+    def _nabla_symmetries(self, tensor, deriv_position):
+        symmetries = tensor.symmetries or _detect_symmetries(tensor.components, tensor.signature)
+        shift = 1 if deriv_position == "prepend" else 0
+        out = [(pos1 + shift, pos2 + shift, sign) for pos1, pos2, sign in symmetries]
+        if getattr(tensor, "_scalar_gradient", False) and self._connection_lower_symmetric():
+            out.append((0, 1, 1))
+        return tuple(out)
+
+    def nabla(self, tensor, order=1, deriv_position="prepend", use_symmetry=True):
         """
         Lyra covariant derivative:
         ∇_k T = (1/phi) ∂_k T + Σ Γ^{a_i}{}_{m k} T^{...m...} - Σ Γ^{m}{}_{b_j k} T_{...m...}
+
+        With use_symmetry=True, symmetries of the input (declared or detected) and
+        the lower-index symmetry of the connection are carried to the result, so
+        only canonical components are computed and simplified.
         """
         if not isinstance(order, int) or order < 1:
             raise ValueError("order must be an integer >= 1.")
@@ -540,30 +1081,46 @@ class TensorSpace:
                 expr = sp.sympify(tensor)
             except (TypeError, ValueError) as exc:
                 raise TypeError("nabla accepts a Tensor or a SymPy expression.") from exc
-            tensor = Tensor(sp.Array(expr), self, signature=())
+            tensor = Tensor(sp.Array(self.domains.apply(expr)), self, signature=())
+
+        if deriv_position not in ("append", "prepend"):
+            raise ValueError("deriv_position must be 'append' or 'prepend'.")
 
         dim = self.dim
         coords = self.coords
-        Gamma = self.connection
+        Gamma = self.connection.components
         T = tensor.components
+        T_masks = tensor.dependency_mask
         rank = tensor.rank
         sig = tensor.signature
+        phi = self.phi.expr if isinstance(self.phi, Tensor) else self.phi
 
         shape = (dim,) * (rank + 1)
+        out_symmetries = self._nabla_symmetries(tensor, deriv_position) if use_symmetry else ()
+        orbits = _symmetry_orbits(dim, rank + 1, out_symmetries) if out_symmetries else None
+        computed = {}
         out_flat = []
 
         for full_idx in itertools.product(range(dim), repeat=rank + 1):
+            if orbits is not None:
+                canon, sign = orbits[full_idx]
+                if sign == 0:
+                    out_flat.append(sp.Integer(0))
+                    continue
+                if canon != full_idx:
+                    out_flat.append(sign * computed[canon])
+                    continue
             if deriv_position == "append":
                 idx = full_idx[:-1]
                 k = full_idx[-1]
-            elif deriv_position == "prepend":
+            else:
                 k = full_idx[0]
                 idx = full_idx[1:]
-            else:
-                raise ValueError("deriv_position must be 'append' or 'prepend'.")
 
-            phi = self.phi.expr if isinstance(self.phi, Tensor) else self.phi
-            base = (1 / phi) * sp.diff(T[idx], coords[k])
+            flat = 0
+            for i in idx:
+                flat = flat * dim + i
+            base = (1 / phi) * self._diff(T[idx], k, T_masks[flat])
             idx_list = list(idx)
 
             for pos, s in enumerate(sig):
@@ -571,27 +1128,37 @@ class TensorSpace:
                     acc = 0
                     for m in range(dim):
                         idx_list[pos] = m
-                        acc += Gamma[idx[pos], m, k] * T[tuple(idx_list)]
+                        gamma = Gamma[idx[pos], m, k]
+                        if gamma != 0:
+                            acc += gamma * T[tuple(idx_list)]
                     base += acc
                 else:
                     acc = 0
                     for m in range(dim):
                         idx_list[pos] = m
-                        acc += Gamma[m, idx[pos], k] * T[tuple(idx_list)]
+                        gamma = Gamma[m, idx[pos], k]
+                        if gamma != 0:
+                            acc += gamma * T[tuple(idx_list)]
                     base -= acc
                 idx_list[pos] = idx[pos]
 
-            out_flat.append(sp.simplify(base))
+            value = self._simplify(base) if base != 0 else sp.Integer(0)
+            computed[full_idx] = value
+            out_flat.append(value)
 
         out = sp.ImmutableDenseNDimArray(out_flat, shape)
         if deriv_position == "append":
             new_sig = sig + (D,)
         else:
             new_sig = (D,) + sig
-        result = Tensor(out, self, signature=new_sig, name=None, label=tensor.label)
+        result = Tensor(out, self, signature=new_sig, name=None, label=tensor.label, symmetries=out_symmetries)
+        if rank == 0:
+            scalar = tensor._as_scalar()
+            phi_is_constant = not any(sp.sympify(phi).has(c) for c in coords)
+            result._scalar_gradient = phi_is_constant or scalar == phi
         if order == 1:
             return result
-        return self.nabla(result, order=order - 1, deriv_position=deriv_position)
+        return self.nabla(result, order=order - 1, deriv_position=deriv_position, use_symmetry=use_symmetry)
 
     def gradient(self, tensor, deriv_position="prepend"):
         return self.nabla(tensor, order=1, deriv_position=deriv_position)
@@ -623,90 +1190,112 @@ class TensorSpace:
             return nabla2.contract(nabla2.rank - 2, nabla2.rank - 1)
         raise ValueError("deriv_position must be 'append' or 'prepend'.")
 
-    def geodesic_equations(self, parameter="tau"):
+    def geodesic_equations(self, parameter="tau", with_christoffel=False):
         """
-        Compute the 4D geodesic equations for x^mu(s).
+        Compute the geodesic equations for x^mu(s) in any dimension.
 
         parameter accepts "timelike"/"tau" or "null"/"lambda" (or a Symbol).
-        Returns a list with 4 sympy.Eq equations for x^0..x^3.
+        Returns a list with one sympy.Eq per coordinate; with_christoffel=True
+        also returns the sparse table {(c, a, b): Gamma^c_ab}, a <= b, of
+        phi**2 g obtained from the Euler-Lagrange equations.
         """
-        if self.dim != 4:
-            raise ValueError("Geodesics require dim=4.")
         if self.metric is None:
             raise ValueError("Define the metric to compute Christoffel.")
-        if self.christoffel2 is None:
-            self.update(include=("metric", "christoffel"))
-
         param = _resolve_autoparallel_parameter(parameter)
-        coord_funcs = [sp.Function(str(c))(param) for c in self.coords]
-        subs_map = {self.coords[i]: coord_funcs[i] for i in range(self.dim)}
-        del_x = self.tensor.from_array([sp.diff(f, param) for f in coord_funcs], signature=(U,))
-        del_2_x = self.tensor.from_array([sp.diff(f, param, 2) for f in coord_funcs], signature=(U,))
-
-        m, al, b = self.index("mu alpha beta")
-
-        geodesic_lhs = self.tensor(
-            (
-                (
-                    del_2_x[+m]
-                    + (
-                        self.christoffel2[+m,-al,-b]
-                        + (
-                            self.nabla_phi[-al] * self.delta[+m,-b]
-                            + self.nabla_phi[-b] * self.delta[+m,-al]
-                            - self.nabla_phi[+m] * self.g[-al,-b]
-                        )
-                    )
-                    *del_x[+al]*del_x[+b]
-                )
-            ).fmt(),
-            index=(+m,),
+        phi = self.phi.expr if isinstance(self.phi, Tensor) else sp.sympify(self.phi)
+        equations, table = euler_lagrange_geodesics(
+            self.metric.components, self.coords, param, weight=phi, metric_inv=self.metric_inv
         )
-        geodesic_equations = [sp.Eq(x.subs(subs_map).doit(), 0) for x in geodesic_lhs.components]
+        return (equations, table) if with_christoffel else equations
 
-        return geodesic_equations
-
-    def autoparallel_equations(self, parameter="tau"):
+    def autoparallel_equations(self, parameter="tau", with_christoffel=False):
         """
-        Compute the 4D autoparallel curve equations for x^mu(s).
+        Compute the autoparallel curve equations for x^mu(s) in any dimension.
 
         parameter accepts "timelike"/"tau" or "null"/"lambda" (or a Symbol).
-        Returns a list with 4 sympy.Eq equations for x^0..x^3.
-        Uses the Lyra autoparallel form: d2x^a/ds^2 + (phi*Gamma^a_{mu nu} + nabla_nu phi*delta_mu^a) v^mu v^nu = 0.
+        Returns a list with one sympy.Eq per coordinate (and the sparse
+        coefficient table when with_christoffel=True).
+        Uses the Lyra autoparallel form: d2x^a/ds^2 + (phi*Gamma^a_{mu nu} + nabla_nu phi/phi*delta_mu^a) v^mu v^nu = 0.
+        Without torsion and non-metricity this is the Euler-Lagrange system of phi**2 g.
         """
-        if self.dim != 4:
-            raise ValueError("Geodesics require dim=4.")
         if self.metric is None:
             raise ValueError("Define the metric to compute Christoffel.")
-        if self.christoffel2 is None:
-            self.update(include=("metric", "christoffel"))
-
         param = _resolve_autoparallel_parameter(parameter)
-        coord_funcs = [sp.Function(str(c))(param) for c in self.coords]
-        subs_map = {self.coords[i]: coord_funcs[i] for i in range(self.dim)}
-        del_x = self.tensor.from_array([sp.diff(f, param) for f in coord_funcs], signature=(U,))
-        del_2_x = self.tensor.from_array([sp.diff(f, param, 2) for f in coord_funcs], signature=(U,))
+        phi = self.phi.expr if isinstance(self.phi, Tensor) else sp.sympify(self.phi)
+        torsion = self.torsion.components if isinstance(self.torsion, Tensor) else sp.Array(self.torsion)
+        nonmetricity = (
+            self.nonmetricity.components if isinstance(self.nonmetricity, Tensor) else sp.Array(self.nonmetricity)
+        )
+        variational = (
+            type(self.connection_strategy) is LyraConnectionStrategy
+            and all(v == 0 for v in sp.flatten(torsion))
+            and all(v == 0 for v in sp.flatten(nonmetricity))
+        )
+        if variational:
+            equations, table = euler_lagrange_geodesics(
+                self.metric.components, self.coords, param, weight=phi, metric_inv=self.metric_inv
+            )
+        else:
+            if self.gamma.components is None:
+                self.update(include=("metric", "christoffel", "connection"))
+            equations, table = connection_geodesics(self.gamma.components, self.coords, param, phi=phi)
+        return (equations, table) if with_christoffel else equations
 
+    def first_integrals(self, parameter="tau", normalization=None, eliminate=None):
+        """
+        Conserved momenta of cyclic coordinates and the reduced first-order geodesic system.
 
-        m, al, b = self.index("mu alpha beta")
+        Cyclic coordinates are those absent from phi**2 g. The result reduces
+        geodesic_equations (and autoparallel_equations, which coincide without
+        torsion and non-metricity); the normalization, 0 for "null"/"lambda"
+        and the Symbol epsilon otherwise, fixes the velocity of eliminate.
+        Returns a FirstIntegrals.
+        """
+        if self.metric is None:
+            raise ValueError("Define the metric to compute Christoffel.")
+        param = _resolve_autoparallel_parameter(parameter)
+        if normalization is None and param == sp.Symbol("lambda"):
+            normalization = 0
+        phi = self.phi.expr if isinstance(self.phi, Tensor) else sp.sympify(self.phi)
+        return first_integrals(
+            self.metric.components,
+            self.coords,
+            param,
+            weight=phi,
+            metric_inv=self.metric_inv,
+            normalization=normalization,
+            eliminate=eliminate,
+        )
 
+    def hamiltonian(self, params=None):
+        """
+        Geodesic Hamiltonian H = g^{ab} p_a p_b / (2 phi**2) from metric_inv.
 
-        autoparallel_lhs = self.tensor(
-            (
-                (
-                    del_2_x[+m]
-                    + (
-                        self.phi * self.gamma[+m,-al,-b]
-                        + self.nabla_phi[-b] * self.delta[+m,-al]
-                    )
-                    *del_x[+al]*del_x[+b]
-                )
-            ).fmt(),
-            index=(+m,),
-        )
-        autoparallel_equations = [sp.Eq(x.subs(subs_map).doit(), 0) for x in autoparallel_lhs.components]
+        Its flow reproduces geodesic_equations (and torsion-free autoparallels).
+        params substitutes constants before compiling; returns a
+        CompiledHamiltonian for leapfrog/yoshida4.
+        """
+        if self.metric is None:
+            raise ValueError("Define the metric to compute Christoffel.")
+        phi = self.phi.expr if isinstance(self.phi, Tensor) else sp.sympify(self.phi)
+        expr, momenta = geodesic_hamiltonian(self.metric_inv, self.coords, weight=phi)
+        return CompiledHamiltonian(expr, self.coords, momenta, params=params)
+
+    def variational_equations(self, kind="geodesic", parameter="tau", params=None):
+        """
+        Geodesic ("geodesic") or autoparallel ("autoparallel") flow with its
+        compiled Jacobian, for tangent dynamics and lyapunov_spectrum.
 
-        return autoparallel_equations
+        params substitutes constants before compiling; returns a
+        VariationalEquations over states (x, v).
+        """
+        if kind == "geodesic":
+            _, table = self.geodesic_equations(parameter, with_christoffel=True)
+        elif kind == "autoparallel":
+            _, table = self.autoparallel_equations(parameter, with_christoffel=True)
+        else:
+            raise ValueError("kind must be 'geodesic' or 'autoparallel'.")
+        return VariationalEquations(table, self.coords, params=params)
 
     def ricci_scalar(self):
         if self.ricci is None or self.metric_inv is None or self.scalar_curvature is None:
@@ -716,7 +1305,7 @@ class TensorSpace:
         if self.ricci is None or self.metric_inv is None:
             raise ValueError("Ricci tensor or metric not defined.")
         dim = self.dim
-        scalar_R = sp.simplify(sum(self.metric_inv[a, b] * self.ricci.comp[a, b] for a in range(dim) for b in range(dim)))
+        scalar_R = self._simplify(sum(self.metric_inv[a, b] * self.ricci.comp[a, b] for a in range(dim) for b in range(dim)))
         return self.scalar(scalar_R, name="R", label="R")
 
     def kretschmann_scalar(self):
@@ -724,13 +1313,27 @@ class TensorSpace:
             self.update(include=("riemann", "ricci", "einstein"))
         if self.riemann is None:
             raise ValueError("Riemann tensor not defined.")
+        if self._rational is not None and self._rational[1].riemann is not None:
+            geometry = self._rational[1]
+            return self.scalar(geometry.array(geometry.kretschmann(), 0), name="K", label="K")
         dim = self.dim
         R_down = self.riemann.as_signature((D, D, D, D))
         R_up = self.riemann.as_signature((U, U, U, U))
         total = 0
         for a, b, c, d in itertools.product(range(dim), repeat=4):
             total += R_down[a, b, c, d] * R_up[a, b, c, d]
-        return self.scalar(sp.simplify(total), name="K", label="K")
+        return self.scalar(self._simplify(total), name="K", label="K")
+
+    def is_flat(self, samples=4):
+        """True when every Riemann component vanishes at random points (see probably_zero)."""
+        if self.riemann is None:
+            self.update(include=("riemann",))
+        if self.riemann is None:
+            raise ValueError("Riemann tensor not defined.")
+        return all(
+            probably_zero(value, self.domains, samples=samples)
+            for value in sp.flatten(self.riemann.components)
+        )
 
     def euler_density(self, normalize=False):
         if self.dim != 2:
@@ -738,11 +1341,249 @@ class TensorSpace:
         if self.metric is None:
             raise ValueError("Metric not defined for Euler density.")
         scalar_R = self.ricci_scalar()
-        density = sp.simplify(scalar_R.components[()] * sp.sqrt(self.detg))
+        density = self._simplify(scalar_R.components[()] * sp.sqrt(self.detg))
         if normalize:
-            density = sp.simplify(density / (4 * sp.pi))
+            density = self._simplify(density / (4 * sp.pi))
         return self.scalar(density, name="Euler", label="Euler")
 
+    def at_point(self, point, quantities=("riemann",)):
+        """
+        Numeric geometry at coordinate values without symbolic curvature.
+
+        point maps coordinates (and remaining parameters) to numbers or
+        broadcastable arrays; quantities are names from "metric",
+        "christoffel2", "connection", "riemann", "ricci", "ricci_scalar",
+        "einstein", "kretschmann". Returns {name: ndarray}.
+        """
+        return numeric_curvature(self, point, quantities=quantities)
+
+    def on_grid(self, axes, params=None, order=4):
+        """
+        Tabulate metric, phi, torsion and non-metricity into a GridSpace.
+
+        axes maps coordinates (Symbols, names or indices) to uniformly spaced
+        1D arrays; coordinates left out must not appear in the fields. params
+        gives numeric values for the remaining symbols. Useful to check
+        finite-difference results against at_point on the same formulas.
+        """
+        np = _require_numpy()
+        if self.metric is None:
+            raise ValueError("Define the metric first.")
+        grids = {}
+        for key, value in axes.items():
+            grids[self._coord_symbol(key if isinstance(key, (int, sp.Basic)) else str(key))] = value
+        phi = self.phi.expr if isinstance(self.phi, Tensor) else sp.sympify(self.phi)
+        arrays = [self.metric.components, phi]
+        torsion = _components(self.torsion, (D, D, D))
+        nonmetricity = _components(self.nonmetricity, (U, D, D))
+        arrays += [a for a in (torsion, nonmetricity) if a is not None]
+        used = 0
+        for array in arrays:
+            for expr in sp.flatten(array) if isinstance(array, sp.NDimArray) else [array]:
+                used |= _dependency_mask(expr, self.coords)
+        for i, c in enumerate(self.coords):
+            if used >> i & 1 and c not in grids:
+                raise ValueError(f"Missing grid for coordinate {c}.")
+        grid_axes = [np.asarray(grids[c], dtype=float) if c in grids else None for c in self.coords]
+        mesh = np.meshgrid(*(ax for ax in grid_axes if ax is not None), indexing="ij")
+        columns = dict(zip([c for c in self.coords if c in grids], mesh))
+        free = {str(x): x for array in arrays for x in sp.sympify(array).free_symbols}
+        for key, value in (params or {}).items():
+            symbol = free.get(key, sp.Symbol(key)) if isinstance(key, str) else key
+            columns[symbol] = np.full(mesh[0].shape if mesh else (), float(value))
+        values = sweep_arrays(arrays, columns)
+        torsion_values = values[2] if torsion is not None else None
+        nonmetricity_values = values[-1] if nonmetricity is not None else None
+        return GridSpace(
+            grid_axes,
+            values[0],
+            phi=values[1],
+            torsion=torsion_values,
+            nonmetricity=nonmetricity_values,
+            order=order,
+            riemann_sign=self.riemann_convention_sign,
+        )
+
+    def numeric(self, point):
+        """
+        NumericSpace with the metric evaluated at point.
+
+        point maps coordinates (Symbols, names or indices) and parameters to
+        numbers or broadcastable arrays; array values become leading batch
+        axes of every NumericTensor. Use .evaluate(tensor) to bring symbolic
+        tensors of this space over at the same point.
+        """
+        if self.metric is None:
+            raise ValueError("Define the metric first.")
+        coord_names = {str(c) for c in self.coords}
+        free = {str(s): s for s in self.metric.components.free_symbols}
+        resolved = {}
+        for key, value in point.items():
+            if isinstance(key, int) or str(key) in coord_names:
+                symbol = self._coord_symbol(key if isinstance(key, (int, sp.Basic)) else str(key))
+            elif isinstance(key, str):
+                symbol = free.get(key, sp.Symbol(key))
+            else:
+                symbol = sp.sympify(key)
+            resolved[symbol] = value
+        metric = sweep_arrays([self.metric.components], resolved)[0]
+        return NumericSpace(metric, point=resolved)
+
+    def _parameter_symbols(self):
+        """Coordinates followed by the parameters of the metric, scale, torsion and non-metricity."""
+        inputs = [] if self.metric is None else list(sp.flatten(self.metric.components))
+        inputs.append(self.phi.expr if isinstance(self.phi, Tensor) else sp.sympify(self.phi))
+        for tensor in (self.torsion, self.nonmetricity):
+            if isinstance(tensor, Tensor):
+                inputs.extend(sp.flatten(tensor.components))
+        parameters = set().union(*(sp.sympify(e).free_symbols for e in inputs)) - set(self.coords)
+        return tuple(self.coords) + tuple(sorted(parameters, key=str))
+
+    def _sweep_quantity(self, name):
+        key = str(name).strip().lower().replace("-", "_")
+        if key in ("kretschmann", "kretschmann_scalar"):
+            return self.kretschmann_scalar()
+        if key in ("scalar", "ricci_scalar", "scalar_curvature"):
+            return self.ricci_scalar()
+        if key in ("metric", "g"):
+            return self.metric
+        if key in ("christoffel", "christoffel2"):
+            return self.christoffel2
+        if key in ("connection", "gamma"):
+            return self.gamma
+        if key in ("riemann", "ricci", "einstein"):
+            if getattr(self, key) is None:
+                self.update()
+            return getattr(self, key)
+        tensor = self.get(name)
+        if tensor is None:
+            raise ValueError(f"Unknown quantity '{name}'.")
+        return tensor
+
+    def sweep(self, quantities, param_grid, chunk_size=65536, workers=None, out=None):
+        """
+        Evaluate curvature quantities over a grid of parameter values.
+
+        quantities are names ("kretschmann", "ricci_scalar", "riemann", "ricci",
+        "einstein", "metric", "christoffel2", "connection" or registered tensors). They are
+        compiled together once and broadcast over param_grid, whose keys are
+        coordinates or parameters of the space (a quantity may ignore some of
+        them); large grids are split into chunks over workers processes.
+        Returns {name: ndarray}.
+        With out (a directory, or {name: array}) chunks stream into
+        <out>/<name>.npy memmaps and memory is bounded by chunk_size.
+        """
+        if isinstance(quantities, str):
+            quantities = [quantities]
+        tensors = [self._sweep_quantity(name) for name in quantities]
+        arrays = [sp.Array(t.components) for t in tensors]
+        values = sweep_arrays(
+            arrays,
+            param_grid,
+            chunk_size=chunk_size,
+            workers=workers,
+            out=out,
+            names=quantities,
+            known=self._parameter_symbols(),
+        )
+        return dict(zip(quantities, values))
+
+    def field_equations(
+        self, T=None, unknowns=(), variable=None, coupling=8 * sp.pi, cosmological_constant=0, extra=(), params=None
+    ):
+        """
+        Compile G_ab + Lambda g_ab = coupling T_ab for a symmetry-reduced ansatz.
+
+        unknowns are undefined functions of variable (a coordinate) appearing
+        in the metric, scale or T (lower components; None for vacuum). extra
+        appends equations (expressions equal to zero), e.g. a conservation
+        law or a scalar-field equation; params substitutes constants or known
+        functions first. Returns a FieldEquations with the independent
+        components, the solved highest derivatives, constraints and
+        vectorized rhs/constraint_values.
+        """
+        if self.metric is None:
+            raise ValueError("Define the metric first.")
+        if variable is None:
+            raise ValueError("Provide the evolution variable, e.g. variable=t.")
+        variable = self._coord_symbol(variable if isinstance(variable, (int, sp.Basic)) else str(variable))
+        if self.einstein is None:
+            self.update()
+        einstein = self.einstein(D, D).components
+        g = self.metric.components
+        if T is None:
+            source = sp.MutableDenseNDimArray.zeros(self.dim, self.dim)
+        elif isinstance(T, Tensor):
+            source = T(D, D).components
+        else:
+            source = self._assume_array(sp.Array(T))
+        Lambda = self.domains.apply(sp.sympify(cosmological_constant))
+        equations = [
+            einstein[a, b] + Lambda * g[a, b] - coupling * source[a, b] for a in range(self.dim) for b in range(self.dim)
+        ]
+        equations += [self.domains.apply(e) for e in extra]
+        if params:
+            params = {self.domains.apply(sp.sympify(k)): self.domains.apply(v) for k, v in dict(params).items()}
+            equations = [e.subs(params) for e in equations]
+        unknowns = [u if isinstance(u, sp.FunctionClass) else self.domains.apply(u) for u in unknowns]
+        return reduce_field_equations(equations, unknowns, variable, coords=self.coords)
+
+    def codegen(self, quantities, backend="c", params=None, cache_dir=None, compiler=None):
+        """
+        Ahead-of-time compiled kernel for curvature quantities.
+
+        quantities are sweep names plus "geodesic", the right-hand side
+        d2x^c/ds2 = -Gamma^c_ab v^a v^b with velocity inputs v_<coord>.
+        params substitutes constants first. backend="c" emits CSE-optimized
+        C, builds it with the system compiler and caches the shared library
+        on disk by expression hash; backend="numpy" lambdifies instead.
+        Returns a CompiledKernel taking {coordinate/parameter: array}.
+        """
+        if isinstance(quantities, str):
+            quantities = [quantities]
+        params = dict(params or {})
+        velocities = ()
+        arrays = []
+        for name in quantities:
+            if name == "geodesic":
+                _, table = self.geodesic_equations(with_christoffel=True)
+                velocities = tuple(sp.Symbol(f"v_{c}") for c in self.coords)
+                rhs = [sp.Integer(0)] * self.dim
+                for (c, a, b), value in table.items():
+                    factor = 1 if a == b else 2
+                    rhs[c] -= factor * value * velocities[a] * velocities[b]
+                arrays.append(sp.Array(rhs))
+            else:
+                arrays.append(sp.Array(self._sweep_quantity(name).components))
+        if params:
+            free = {str(x): x for a in arrays for x in a.free_symbols}
+            subs = {free.get(k, k) if isinstance(k, str) else k: v for k, v in params.items()}
+            arrays = [a.subs(subs) for a in arrays]
+        inputs = tuple(self.coords) + velocities
+        extra = set().union(*(a.free_symbols for a in arrays)) - set(inputs)
+        symbols = inputs + tuple(sorted(extra, key=str))
+        return compile_kernel(arrays, symbols, names=quantities, backend=backend, cache_dir=cache_dir, compiler=compiler)
+
+    def sweep_stats(self, quantities, param_grid, chunk_size=65536, workers=None, bins=None, range=None):
+        """
+        Streaming reductions (min, max, abs_max, mean, norm, histogram) of
+        quantities over param_grid without storing the grid; see sweep.
+        Returns {name: StreamingStats}.
+        """
+        if isinstance(quantities, str):
+            quantities = [quantities]
+        arrays = [sp.Array(self._sweep_quantity(name).components) for name in quantities]
+        stats = sweep_stats(
+            arrays,
+            param_grid,
+            chunk_size=chunk_size,
+            workers=workers,
+            bins=bins,
+            range=range,
+            known=self._parameter_symbols(),
+        )
+        return dict(zip(quantities, stats))
+
     def index(self, names):
         if isinstance(names, str):
             parts = [p for p in names.replace(",", " ").split() if p]
@@ -900,6 +1741,8 @@ def autoparallel_equations(metric, coords, parameter="tau", connection_strategy=
     """
     Quick constructor for autoparallel equations from metric and coordinates.
     """
+    if connection_strategy is None:
+        return geodesic_equations(metric, coords, parameter=parameter)
     space = TensorSpace(coords=coords, metric=metric, connection_strategy=connection_strategy)
     return space.autoparallel_equations(parameter=parameter)
 
@@ -908,6 +1751,9 @@ def geodesic_equations(metric, coords, parameter="tau", connection_strategy=None
     """
     Quick constructor for geodesic equations from metric and coordinates.
     """
+    if connection_strategy is None:
+        param = _resolve_autoparallel_parameter(parameter)
+        return euler_lagrange_geodesics(metric, coords, param)[0]
     space = TensorSpace(coords=coords, metric=metric, connection_strategy=connection_strategy)
     return space.geodesic_equations(parameter=parameter)
 
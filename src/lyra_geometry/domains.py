@@ -0,0 +1,94 @@
+import sympy as sp
+
+_KEYWORDS = ("negative", "nonnegative", "nonpositive", "positive", "real")
+
+
+def _interval_assumptions(name, lower, upper):
+    lower = -sp.oo if lower is None else sp.sympify(lower)
+    upper = sp.oo if upper is None else sp.sympify(upper)
+    if (upper - lower).is_positive is not True:
+        raise ValueError(f"Empty interval ({lower}, {upper}) for {name}.")
+    assumptions = {"real": True}
+    if lower.is_nonnegative:
+        assumptions["positive"] = True
+    elif upper.is_nonpositive:
+        assumptions["negative"] = True
+    return assumptions, lower, upper
+
+
+def _interval_facts(x, lower, upper):
+    """Q-predicates refine() cannot derive from the symbol's own assumptions."""
+    facts = []
+    if lower.is_finite and not lower.is_zero:
+        facts.append(sp.Q.positive(x - lower))
+    if upper.is_finite and not upper.is_zero:
+        facts.append(sp.Q.positive(upper - x))
+    if lower.is_nonnegative and (sp.pi - upper).is_nonnegative:
+        facts.append(sp.Q.positive(sp.sin(x)))
+    if (lower + sp.pi / 2).is_nonnegative and (sp.pi / 2 - upper).is_nonnegative:
+        facts.append(sp.Q.positive(sp.cos(x)))
+    return facts
+
+
+class Domains:
+    """
+    Domain declarations for coordinates and parameters.
+
+    spec maps Symbols or names to "real", "positive", "negative",
+    "nonnegative", "nonpositive" or an open interval (lower, upper) (None
+    for an unbounded end). Every symbol with a declared name is replaced by
+    one carrying the matching SymPy assumptions; bounds that assumptions
+    cannot express (sin(theta) > 0 for theta in (0, pi)) are kept as facts
+    for refine().
+    """
+
+    def __init__(self, spec=None):
+        if isinstance(spec, Domains):
+            spec = spec.spec
+        self.spec = {str(key): value for key, value in dict(spec or {}).items()}
+        self.symbols = {}
+        facts = []
+        for name, domain in self.spec.items():
+            if isinstance(domain, str):
+                if domain not in _KEYWORDS:
+                    raise ValueError(
+                        f"Unknown domain '{domain}' for {name}. Allowed: {', '.join(_KEYWORDS)}, or (lower, upper)."
+                    )
+                self.symbols[name] = sp.Symbol(name, **{domain: True})
+            elif isinstance(domain, (tuple, list)) and len(domain) == 2:
+                assumptions, lower, upper = _interval_assumptions(name, *domain)
+                symbol = sp.Symbol(name, **assumptions)
+                self.symbols[name] = symbol
+                facts.extend(_interval_facts(symbol, lower, upper))
+            else:
+                raise ValueError(
+                    f"Unknown domain '{domain}' for {name}. Allowed: {', '.join(_KEYWORDS)}, or (lower, upper)."
+                )
+        self.facts = sp.And(*facts) if facts else None
+
+    def __bool__(self):
+        return bool(self.symbols)
+
+    def __repr__(self):
+        return f"Domains({self.spec!r})"
+
+    def apply(self, expr):
+        """expr (or an array) with declared symbols replaced by their assumption-carrying versions."""
+        if not self.symbols or expr is None:
+            return expr
+        expr = sp.sympify(expr)
+        subs = {s: self.symbols[s.name] for s in expr.free_symbols if s.name in self.symbols}
+        subs = {old: new for old, new in subs.items() if old != new}
+        return expr.xreplace(subs) if subs else expr
+
+    def refine(self, expr):
+        if self.facts is None:
+            return expr
+        return sp.refine(expr, self.facts)
+
+    def simplify(self, expr):
+        """sp.simplify, followed by refine() under the interval facts."""
+        return self.refine(sp.simplify(expr))
+
+
+__all__ = ["Domains"]
@@ -0,0 +1,212 @@
+import random
+
+import sympy as sp
+from sympy.core.function import AppliedUndef
+from sympy.solvers.solveset import NonlinearError
+
+from .numeric import _compile_vector, _require_numpy
+
+
+def _function_of(unknown, variable):
+    if isinstance(unknown, AppliedUndef):
+        return unknown
+    if isinstance(unknown, sp.FunctionClass):
+        return unknown(variable)
+    raise TypeError("unknowns must be undefined functions, e.g. a or a(t).")
+
+
+def _max_order(exprs, func, variable):
+    order = None
+    for expr in exprs:
+        if expr.has(func):
+            order = max(order or 0, 0)
+        for d in expr.atoms(sp.Derivative):
+            if d.expr == func:
+                order = max(order or 0, d.variable_count[0][1] if d.variables[0] == variable else 0)
+    return order
+
+
+def _reduced(expr, unknowns):
+    """Numerator of expr without the factors free of the unknowns, or 0."""
+    numerator = sp.numer(sp.together(expr))
+    if sp.expand(numerator) == 0:
+        return sp.Integer(0)
+    kept = [f for f in sp.Mul.make_args(sp.factor(numerator)) if any(f.has(u) for u in unknowns)]
+    return sp.expand(sp.Mul(*kept)) if kept else sp.Integer(0)
+
+
+def _numeric_rank(matrix, symbols):
+    # Rank at a random rational point: exact arithmetic, no simplification needed.
+    rng = random.Random(len(symbols))
+    values = {s: sp.Rational(rng.randint(1, 97), rng.randint(1, 89)) for s in symbols}
+    return matrix.subs(values).rank()
+
+
+class FieldEquations:
+    """
+    Symmetry-reduced field equations as a first-order numeric system.
+
+    equations are the independent non-trivial components (expressions equal
+    to zero); state lists the variables y (each unknown and its derivatives
+    below the highest order), highest maps the highest derivatives (and
+    algebraic unknowns) to their solution in terms of state and variable,
+    and constraints are the remaining equations on the state. rhs and
+    constraint_values evaluate dy/d(variable) and the constraints for arrays
+    of shape (..., len(state)); params supplies the remaining symbols.
+    """
+
+    def __init__(self, variable, unknowns, equations, state, highest, derivatives, constraints):
+        self.variable = variable
+        self.unknowns = unknowns
+        self.equations = equations
+        self.state = state
+        self.highest = highest
+        self.derivatives = derivatives
+        self.constraints = constraints
+        exprs = list(derivatives) + list(constraints)
+        inputs = {variable, *state}
+        self.params = tuple(sorted(set().union(*(sp.sympify(e).free_symbols for e in exprs)) - inputs, key=str))
+        self._compiled = None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_compiled"] = None
+        return state
+
+    def __repr__(self):
+        names = ", ".join(str(s) for s in self.state)
+        return f"FieldEquations(state=({names}), constraints={len(self.constraints)})"
+
+    def _columns(self, x, y, params):
+        np = _require_numpy()
+        y = np.asarray(y, dtype=float)
+        if y.shape[-1] != len(self.state):
+            raise ValueError(f"y must have a trailing axis of size {len(self.state)}.")
+        by_name = {str(k): v for k, v in (params or {}).items()}
+        columns = [np.asarray(x, dtype=float)] + [y[..., i] for i in range(len(self.state))]
+        for s in self.params:
+            if str(s) not in by_name:
+                raise ValueError(f"Missing value for {s}.")
+            columns.append(np.asarray(by_name[str(s)], dtype=float))
+        return columns
+
+    def _compile(self):
+        if self._compiled is None:
+            symbols = (self.variable,) + tuple(self.state) + self.params
+            self._compiled = (
+                _compile_vector(self.derivatives, symbols),
+                _compile_vector(self.constraints, symbols) if self.constraints else None,
+            )
+        return self._compiled
+
+    def rhs(self, x, y, params=None):
+        """dy/dx for states y of shape (..., len(state))."""
+        return self._compile()[0](*self._columns(x, y, params))
+
+    def constraint_values(self, x, y, params=None):
+        """Constraint residuals with shape (..., len(constraints))."""
+        np = _require_numpy()
+        func = self._compile()[1]
+        columns = self._columns(x, y, params)
+        if func is None:
+            return np.zeros(np.broadcast_shapes(*(np.shape(c) for c in columns)) + (0,))
+        return func(*columns)
+
+
+def reduce_field_equations(equations, unknowns, variable, coords=()):
+    """
+    Turn field-equation components (expressions equal to zero) into a
+    FieldEquations system for unknown functions of variable.
+
+    Components that vanish or are proportional to an earlier one are dropped;
+    an independent subset is solved for the highest derivative of each
+    unknown (unknowns without derivatives are solved algebraically) and the
+    rest become constraints. Raises ValueError when the equations depend on
+    other coords or do not determine every highest derivative.
+    """
+    funcs = [_function_of(u, variable) for u in unknowns]
+    coords = [c for c in coords if c != variable]
+
+    independent = []
+    for expr in equations:
+        reduced = _reduced(sp.sympify(expr), funcs)
+        if reduced == 0:
+            continue
+        stray = [c for c in coords if reduced.has(c)]
+        if stray:
+            raise ValueError(f"Equation depends on {stray[0]}; the ansatz does not reduce to {variable}.")
+        if any(sp.cancel(reduced / other).is_number for other in independent):
+            continue
+        independent.append(reduced)
+
+    orders = {}
+    for f in funcs:
+        order = _max_order(independent, f, variable)
+        if order is None:
+            raise ValueError(f"Unknown {f} does not appear in the field equations.")
+        orders[f] = order
+
+    suffix = str(variable)
+    state, replace, top = [], {}, {}
+    for f in funcs:
+        name = str(f.func)
+        for k in range(orders[f] + 1):
+            symbol = sp.Symbol(name + ("_" + suffix * k if k else ""))
+            target = f if k == 0 else sp.Derivative(f, (variable, k))
+            replace[target] = symbol
+            if k < orders[f]:
+                state.append(symbol)
+            else:
+                top[f] = symbol
+    # Replace higher derivatives first so Derivative(a, 2) is not seen as a function of a.
+    ordered = sorted(replace.items(), key=lambda item: -(item[0].derivative_count if item[0].is_Derivative else 0))
+
+    def to_state(expr):
+        for target, symbol in ordered:
+            expr = expr.subs(target, symbol)
+        return expr
+
+    reduced = [to_state(e) for e in independent]
+    unknown_top = list(top.values())
+    selected, rest, rank = [], [], 0
+    all_symbols = set().union(*(e.free_symbols for e in reduced)) if reduced else set()
+    for expr in reduced:
+        if not any(expr.has(s) for s in unknown_top):
+            rest.append(expr)
+            continue
+        candidate = selected + [expr]
+        jacobian = sp.Matrix([[sp.diff(e, s) for s in unknown_top] for e in candidate])
+        new_rank = _numeric_rank(jacobian, all_symbols)
+        if new_rank > rank:
+            selected, rank = candidate, new_rank
+        else:
+            rest.append(expr)
+    if rank < len(unknown_top):
+        names = ", ".join(str(s) for s in unknown_top)
+        raise ValueError(f"Field equations do not determine {names}; add equations through extra.")
+
+    try:
+        A, b = sp.linear_eq_to_matrix(selected, unknown_top)
+        solution = dict(zip(unknown_top, (sp.cancel(v) for v in A.LUsolve(b))))
+    except NonlinearError:
+        solutions = sp.solve(selected, unknown_top, dict=True)
+        if len(solutions) != 1:
+            raise ValueError("Highest derivatives are not uniquely determined by the field equations.")
+        solution = {s: sp.cancel(v) for s, v in solutions[0].items()}
+
+    constraints = []
+    for expr in rest:
+        value = sp.numer(sp.together(expr.subs(solution)))
+        value = sp.expand(value)
+        if value != 0:
+            constraints.append(value)
+
+    derivatives = []
+    for f in funcs:
+        for k in range(orders[f]):
+            derivatives.append(replace[sp.Derivative(f, (variable, k + 1))] if k + 1 < orders[f] else solution[top[f]])
+    highest = {f if orders[f] == 0 else sp.Derivative(f, (variable, orders[f])): solution[top[f]] for f in funcs}
+    return FieldEquations(variable, tuple(funcs), independent, tuple(state), highest, derivatives, constraints)
+
+
+__all__ = ["FieldEquations", "reduce_field_equations"]
@@ -0,0 +1,259 @@
+import itertools
+
+import sympy as sp
+
+from .core import (
+    ConnectionStrategy,
+    CurvatureStrategy,
+    LyraConnectionStrategy,
+    LyraCurvatureStrategy,
+    _contract_riemann,
+)
+from .tensors import D, Tensor, U
+
+
+def _diagonal_sign(expr):
+    expr = sp.sympify(expr)
+    if expr.is_number:
+        return -1 if expr < 0 else 1
+    return -1 if expr.could_extract_minus_sign() else 1
+
+
+def _uses_metric_connection(space):
+    """True when the space's connection is the metric Lyra one that frame formulas rebuild."""
+    return type(space.connection_strategy) in (LyraConnectionStrategy, CartanConnectionStrategy)
+
+
+def _is_diagonal(matrix):
+    n = matrix.shape[0]
+    return all(matrix[i, j] == 0 for i in range(n) for j in range(n) if i != j)
+
+
+def _orthonormal_coframe(space, coframe=None, eta=None):
+    if space.metric is None:
+        raise ValueError("Define the metric to build an orthonormal coframe.")
+    dim = space.dim
+    g = sp.Matrix(space.metric.components.tolist())
+    if coframe is None:
+        if not _is_diagonal(g):
+            raise ValueError("Provide an orthonormal coframe for non-diagonal metrics.")
+        signs = list(eta) if eta is not None else [_diagonal_sign(g[a, a]) for a in range(dim)]
+        e = sp.diag(*[sp.sqrt(signs[a] * g[a, a]) for a in range(dim)])
+    else:
+        e = sp.Matrix(coframe)
+        if e.shape != (dim, dim):
+            raise ValueError(f"coframe must be a {dim}x{dim} matrix e^a_mu.")
+        if eta is None:
+            eta_matrix = (e.inv().T * g * e.inv()).applyfunc(sp.simplify)
+            if not _is_diagonal(eta_matrix) or any(eta_matrix[a, a] not in (1, -1) for a in range(dim)):
+                raise ValueError("Coframe is not orthonormal for this metric; pass eta explicitly.")
+            signs = [int(eta_matrix[a, a]) for a in range(dim)]
+        else:
+            signs = list(eta)
+    if len(signs) != dim or any(s not in (1, -1) for s in signs):
+        raise ValueError("eta must list dim entries equal to +1 or -1.")
+    if _is_diagonal(e):
+        E = sp.diag(*[1 / e[a, a] for a in range(dim)])
+    else:
+        E = e.inv()
+    return e, E, signs
+
+
+def _frame_tensor(X, e, E, dim):
+    """Frame components X^a_{cd} of a coordinate (U, D, D) array, skipping zeros."""
+    out = [[[sp.Integer(0)] * dim for _ in range(dim)] for _ in range(dim)]
+    nonzero = [
+        (b, l, n, X[b, l, n])
+        for b, l, n in itertools.product(range(dim), repeat=3)
+        if X[b, l, n] != 0
+    ]
+    for a, c, d in itertools.product(range(dim), repeat=3):
+        acc = 0
+        for b, l, n, value in nonzero:
+            factor = e[a, b] * E[l, c] * E[n, d]
+            if factor != 0:
+                acc += factor * value
+        out[a][c][d] = acc
+    return out
+
+
+def cartan_connection_forms(space, coframe=None, eta=None):
+    """
+    Lyra connection 1-forms in an orthonormal frame.
+
+    Returns (e, E, eta, omega) where e[a, mu] is the coframe, E[mu, a] its
+    inverse frame and omega[a][b][mu] the coordinate components of the 1-forms
+    phi * Gamma expressed in the frame, so that the Lyra curvature is
+    (1/phi**2) (d omega + omega ^ omega).
+    """
+    e, E, signs = _orthonormal_coframe(space, coframe=coframe, eta=eta)
+    dim = space.dim
+    coords = space.coords
+    phi = space.phi.expr if isinstance(space.phi, Tensor) else space.phi
+
+    de = {}
+    for a in range(dim):
+        for mu, nu in itertools.combinations(range(dim), 2):
+            value = sp.diff(e[a, nu], coords[mu]) - sp.diff(e[a, mu], coords[nu])
+            if value != 0:
+                de[a, mu, nu] = value
+
+    # c_{acd} = eta_a de^a(E_c, E_d), antisymmetric in (c, d)
+    c_low = {}
+    for (a, mu, nu), value in de.items():
+        for c, d in itertools.product(range(dim), repeat=2):
+            factor = E[mu, c] * E[nu, d] - E[nu, c] * E[mu, d]
+            if factor != 0:
+                c_low[a, c, d] = c_low.get((a, c, d), 0) + signs[a] * factor * value
+
+    def c_comp(a, c, d):
+        return c_low.get((a, c, d), 0)
+
+    omega_frame = [[[sp.Integer(0)] * dim for _ in range(dim)] for _ in range(dim)]
+    for a, b, c in itertools.product(range(dim), repeat=3):
+        value = -sp.Rational(1, 2) * (c_comp(a, c, b) - c_comp(c, b, a) + c_comp(b, a, c))
+        if value != 0:
+            omega_frame[a][b][c] = space._simplify(signs[a] * value)
+
+    dphi = [sp.diff(phi, x) for x in coords]
+    if any(v != 0 for v in dphi):
+        E_phi = [sum(E[mu, c] * dphi[mu] for mu in range(dim)) for c in range(dim)]
+        for a, c, d in itertools.product(range(dim), repeat=3):
+            value = 0
+            if a == d:
+                value += E_phi[c]
+            if c == d:
+                value -= signs[c] * signs[a] * E_phi[a]
+            if value != 0:
+                omega_frame[a][c][d] += value / phi
+
+    M = space.nonmetricity
+    tau = space.torsion
+    M_comp = M(U, D, D).components if isinstance(M, Tensor) else sp.Array(M)
+    tau_comp = tau(D, D, D).components if isinstance(tau, Tensor) else sp.Array(tau)
+    if any(v != 0 for v in sp.flatten(M_comp)) or any(v != 0 for v in sp.flatten(tau_comp)):
+        g_inv = space.metric_inv
+
+        def extra(b, l, n):
+            return -phi * M_comp[b, l, n] / 2 + phi / 2 * sum(
+                g_inv[m, b] * (tau_comp[l, m, n] - tau_comp[n, l, m] - tau_comp[m, l, n])
+                for m in range(dim)
+            )
+
+        X = [[[extra(b, l, n) for n in range(dim)] for l in range(dim)] for b in range(dim)]
+        X_frame = _frame_tensor(sp.Array(X), e, E, dim)
+        for a, c, d in itertools.product(range(dim), repeat=3):
+            if X_frame[a][c][d] != 0:
+                omega_frame[a][c][d] += X_frame[a][c][d]
+
+    omega = [[[sp.Integer(0)] * dim for _ in range(dim)] for _ in range(dim)]
+    for a, b in itertools.product(range(dim), repeat=2):
+        for mu in range(dim):
+            acc = 0
+            for c in range(dim):
+                if omega_frame[a][b][c] != 0 and e[c, mu] != 0:
+                    acc += omega_frame[a][b][c] * e[c, mu]
+            omega[a][b][mu] = acc
+    return e, E, signs, omega
+
+
+class CartanConnectionStrategy(ConnectionStrategy):
+    """
+    Lyra connection from orthonormal-frame connection 1-forms.
+
+    Accepts an orthonormal coframe e^a_mu (rows are 1-forms) or derives one for
+    diagonal metrics; eta lists the frame signature.
+    """
+
+    def __init__(self, coframe=None, eta=None):
+        self.coframe = coframe
+        self.eta = eta
+
+    def build(self, space):
+        if space.metric is None:
+            return None
+        dim = space.dim
+        coords = space.coords
+        phi = space.phi.expr if isinstance(space.phi, Tensor) else space.phi
+        e, E, _, omega = cartan_connection_forms(space, coframe=self.coframe, eta=self.eta)
+
+        def connection_element(rho, sigma, n):
+            acc = 0
+            for a in range(dim):
+                if E[rho, a] == 0:
+                    continue
+                inner = sp.diff(e[a, sigma], coords[n])
+                for b in range(dim):
+                    if omega[a][b][n] != 0 and e[b, sigma] != 0:
+                        inner += omega[a][b][n] * e[b, sigma]
+                acc += E[rho, a] * inner
+            return space._simplify(acc / phi) if acc != 0 else sp.Integer(0)
+
+        return sp.Array(
+            [[[connection_element(r, s, n) for n in range(dim)] for s in range(dim)] for r in range(dim)]
+        )
+
+
+class CartanCurvatureStrategy(CurvatureStrategy):
+    """
+    Lyra curvature from Cartan's structure equations.
+
+    The curvature 2-forms Omega = d omega + omega ^ omega are built from the
+    frame connection 1-forms (Lyra scale, torsion and non-metricity included)
+    and mapped back to coordinate components of Riemann, Ricci and Einstein.
+    Other connection strategies (e.g. FixedConnectionStrategy) fall back to
+    LyraCurvatureStrategy on the connection in use.
+    """
+
+    def __init__(self, coframe=None, eta=None):
+        self.coframe = coframe
+        self.eta = eta
+
+    def build(self, space, gamma_components):
+        if space.metric is None:
+            return None, None, None, None
+        if not _uses_metric_connection(space):
+            return LyraCurvatureStrategy().build(space, gamma_components)
+
+        dim = space.dim
+        coords = space.coords
+        phi = space.phi.expr if isinstance(space.phi, Tensor) else space.phi
+        riemann_sign = space.riemann_convention_sign
+        e, E, _, omega = cartan_connection_forms(space, coframe=self.coframe, eta=self.eta)
+
+        Omega = {}
+        for a, b in itertools.product(range(dim), repeat=2):
+            for mu, nu in itertools.combinations(range(dim), 2):
+                value = sp.diff(omega[a][b][nu], coords[mu]) - sp.diff(omega[a][b][mu], coords[nu])
+                for c in range(dim):
+                    if omega[a][c][mu] != 0 and omega[c][b][nu] != 0:
+                        value += omega[a][c][mu] * omega[c][b][nu]
+                    if omega[a][c][nu] != 0 and omega[c][b][mu] != 0:
+                        value -= omega[a][c][nu] * omega[c][b][mu]
+                if value != 0:
+                    Omega[a, b, mu, nu] = value
+
+        components = {}
+        for (a, b, mu, nu), value in Omega.items():
+            for rho, sigma in itertools.product(range(dim), repeat=2):
+                factor = E[rho, a] * e[b, sigma]
+                if factor != 0:
+                    key = (rho, sigma, mu, nu)
+                    components[key] = components.get(key, 0) + factor * value
+
+        for key, value in list(components.items()):
+            components[key] = space._simplify(riemann_sign * value / phi**2)
+
+        def curvature_element(rho, sigma, mu, nu):
+            if mu < nu:
+                return components.get((rho, sigma, mu, nu), sp.Integer(0))
+            if mu > nu:
+                return -components.get((rho, sigma, nu, mu), sp.Integer(0))
+            return sp.Integer(0)
+
+        Riem = space.from_function(curvature_element, signature=(U, D, D, D), name="Riemann", label="R")
+        Ricc, Ein, scalar_curvature = _contract_riemann(space, Riem)
+        return Riem, Ricc, Ein, scalar_curvature
+
+
+__all__ = ["CartanConnectionStrategy", "CartanCurvatureStrategy", "cartan_connection_forms"]
@@ -0,0 +1,251 @@
+import itertools
+
+import sympy as sp
+
+from .linalg import metric_inverse
+from .tensors import _dependency_mask
+
+
+def _velocity_symbols(dim):
+    return sp.symbols(f"_v0:{dim}", cls=sp.Dummy)
+
+
+def lagrangian_christoffel(metric, coords, weight=1, metric_inv=None):
+    """
+    Sparse Christoffel table of weight**2 * g from L = weight**2 g_ab v^a v^b.
+
+    Returns {(c, a, b): Gamma^c_ab} with a <= b and only nonzero entries. With
+    weight=1 it matches TensorSpace.christoffel2; with weight=phi it gives the
+    Lyra geodesic coefficients.
+    """
+    g = sp.Matrix(metric)
+    dim = len(coords)
+    g_inv = sp.Matrix(metric_inv) if metric_inv is not None else sp.Matrix(metric_inverse(g)[0])
+    W = sp.sympify(weight) ** 2
+    v = _velocity_symbols(dim)
+    L = sum(W * g[a, b] * v[a] * v[b] for a in range(dim) for b in range(dim) if g[a, b] != 0)
+    L_mask = _dependency_mask(L, coords)
+    dL = [sp.diff(L, x) if L_mask >> i & 1 else sp.Integer(0) for i, x in enumerate(coords)]
+
+    # Euler-Lagrange: 2 W g_mb a^b + Q_m(v) = 0 with Q_m = d_c(dL/dv^m) v^c - dL/dx^m
+    lowered = {}
+    for m in range(dim):
+        p = sp.diff(L, v[m])
+        p_mask = _dependency_mask(p, coords)
+        Q = -dL[m]
+        for c in range(dim):
+            if p_mask >> c & 1:
+                Q += sp.diff(p, coords[c]) * v[c]
+        if Q == 0:
+            continue
+        # Q_m = 2 sum_{a,b} Gamma_{m ab} v^a v^b, so Gamma_{m ab} = (1/4) d2Q_m / dv^a dv^b
+        present = [a for a in range(dim) if v[a] in Q.free_symbols]
+        for a in present:
+            Q_a = sp.diff(Q, v[a])
+            for b in present:
+                if b < a:
+                    continue
+                coeff = sp.diff(Q_a, v[b])
+                if coeff != 0:
+                    lowered[m, a, b] = coeff / 4
+
+    table = {}
+    for c, a, b in itertools.product(range(dim), repeat=3):
+        if a > b:
+            continue
+        value = sum(
+            g_inv[c, m] * lowered[m, a, b] for m in range(dim) if g_inv[c, m] != 0 and (m, a, b) in lowered
+        )
+        if value != 0:
+            value = sp.cancel(value / W)
+            if value != 0:
+                table[c, a, b] = value
+    return table
+
+
+def _equations_from_table(table, coords, parameter):
+    dim = len(coords)
+    funcs = [sp.Function(str(c))(parameter) for c in coords]
+    subs_map = dict(zip(coords, funcs))
+    velocities = [sp.diff(f, parameter) for f in funcs]
+    lhs = [sp.diff(f, parameter, 2) for f in funcs]
+    for (c, a, b), value in table.items():
+        factor = 1 if a == b else 2
+        lhs[c] += factor * value.subs(subs_map) * velocities[a] * velocities[b]
+    return [sp.Eq(expr, 0) for expr in lhs[:dim]]
+
+
+def euler_lagrange_geodesics(metric, coords, parameter, weight=1, metric_inv=None):
+    """
+    Geodesic equations of weight**2 * g from the Euler-Lagrange equations.
+
+    Returns (equations, christoffel) where equations lists one sympy.Eq per
+    coordinate, written for x^mu(parameter), and christoffel is the sparse
+    table from lagrangian_christoffel.
+    """
+    coords = tuple(coords)
+    table = lagrangian_christoffel(metric, coords, weight=weight, metric_inv=metric_inv)
+    return _equations_from_table(table, coords, parameter), table
+
+
+def connection_geodesics(connection, coords, parameter, phi=1):
+    """
+    Lyra autoparallel equations read directly off a connection array.
+
+    d2x^a/ds^2 + (phi Gamma^a_{mu nu} + d_nu phi / phi delta^a_mu) v^mu v^nu = 0,
+    symmetrized into a sparse table; used when torsion or non-metricity make the
+    equations non-variational.
+    """
+    coords = tuple(coords)
+    dim = len(coords)
+    phi = sp.sympify(phi)
+    dphi = [sp.diff(phi, x) / phi for x in coords]
+    coeff = {}
+    for a, mu, nu in itertools.product(range(dim), repeat=3):
+        value = phi * connection[a, mu, nu]
+        if a == mu:
+            value += dphi[nu]
+        if value != 0:
+            key = (a, min(mu, nu), max(mu, nu))
+            coeff[key] = coeff.get(key, 0) + value
+    table = {}
+    for (a, mu, nu), value in coeff.items():
+        value = value if mu == nu else value / 2
+        value = sp.cancel(value)
+        if value != 0:
+            table[a, mu, nu] = value
+    return _equations_from_table(table, coords, parameter), table
+
+
+class FirstIntegrals:
+    """
+    Conserved momenta of cyclic coordinates and the reduced first-order geodesic system.
+
+    cyclic lists the coordinates absent from weight**2 * g, constants the
+    symbols p_<coord> of their momenta p_i = weight**2 g_ib dx^b/ds, and
+    velocities maps each cyclic velocity to its expression in the constants.
+    The normalization weight**2 g_ab v^a v^b = normalization (constraint) is
+    solved for the velocity of eliminated, on the branch sigma = +1 or -1
+    (branch). equations is then a first-order system for state: dx^i/ds for
+    every coordinate and dv_<coord>/ds for the remaining velocities.
+    """
+
+    def __init__(self, cyclic, constants, conserved, velocities, constraint, eliminated, branch, state, equations):
+        self.cyclic = cyclic
+        self.constants = constants
+        self.conserved = conserved
+        self.velocities = velocities
+        self.constraint = constraint
+        self.eliminated = eliminated
+        self.branch = branch
+        self.state = state
+        self.equations = equations
+
+    def __repr__(self):
+        names = ", ".join(str(c) for c in self.cyclic)
+        return f"FirstIntegrals(cyclic=({names}), eliminated={self.eliminated}, equations={len(self.equations)})"
+
+
+def _velocity_root(quadratic, velocity, branch):
+    """Root of quadratic (a polynomial of degree 2 in velocity) selected by branch = +1/-1."""
+    quadratic = sp.expand(quadratic)
+    a, b, c = (sp.cancel(quadratic.coeff(velocity, n)) for n in (2, 1, 0))
+    if b == 0:
+        return branch * sp.sqrt(sp.cancel(-c / a))
+    return sp.cancel(-b / (2 * a)) + branch * sp.sqrt(sp.cancel((b**2 - 4 * a * c) / (4 * a**2)))
+
+
+def first_integrals(metric, coords, parameter, weight=1, metric_inv=None, normalization=None, eliminate=None):
+    """
+    Reduce the geodesic system of weight**2 * g to first order using its cyclic coordinates.
+
+    normalization is the value of weight**2 g_ab v^a v^b (Symbol "epsilon"
+    when not given); eliminate names the non-cyclic coordinate whose velocity
+    the normalization fixes (by default the first one that appears
+    quadratically). Returns a FirstIntegrals.
+    """
+    coords = tuple(coords)
+    dim = len(coords)
+    g = sp.Matrix(metric)
+    W = sp.sympify(weight) ** 2
+    mask = _dependency_mask(W, coords)
+    for value in g:
+        mask |= _dependency_mask(value, coords)
+    cyclic_idx = [i for i in range(dim) if not mask >> i & 1]
+    free_idx = [i for i in range(dim) if mask >> i & 1]
+    if not cyclic_idx:
+        raise ValueError("Metric has no cyclic coordinates.")
+
+    equations, _ = euler_lagrange_geodesics(g, coords, parameter, weight=weight, metric_inv=metric_inv)
+    funcs = [sp.Function(str(c))(parameter) for c in coords]
+    subs_map = dict(zip(coords, funcs))
+    vel = [sp.diff(f, parameter) for f in funcs]
+    Wg = (W * g).subs(subs_map)
+    constants = tuple(sp.Symbol(f"p_{coords[i]}") for i in cyclic_idx)
+    conserved = {
+        p: sum(Wg[i, b] * vel[b] for b in range(dim) if Wg[i, b] != 0) for p, i in zip(constants, cyclic_idx)
+    }
+
+    # p_C = W (g_CC v_C + g_CF v_F)  =>  v_C = g_CC^-1 (p_C / W - g_CF v_F)
+    g_cc = Wg.extract(cyclic_idx, cyclic_idx)
+    rhs = sp.Matrix(constants) - Wg.extract(cyclic_idx, free_idx) * sp.Matrix([vel[i] for i in free_idx])
+    solved = g_cc.inv() * rhs
+    velocities = {vel[i]: sp.cancel(solved[k]) for k, i in enumerate(cyclic_idx)}
+
+    if normalization is None:
+        normalization = sp.Symbol("epsilon")
+    norm = sum(Wg[a, b] * vel[a] * vel[b] for a in range(dim) for b in range(dim) if Wg[a, b] != 0)
+    norm = sp.cancel(norm.xreplace(velocities))
+    constraint = sp.Eq(norm, normalization)
+
+    # The normalization is quadratic in each remaining velocity: solve it for one of them.
+    quadratic = norm - normalization
+    if eliminate is None:
+        candidates = [i for i in free_idx if sp.expand(quadratic).coeff(vel[i], 2) != 0]
+        k = candidates[0] if candidates else None
+    else:
+        eliminate = sp.sympify(eliminate)
+        k = next((i for i in free_idx if coords[i] == eliminate or str(coords[i]) == str(eliminate)), None)
+        if k is None:
+            raise ValueError(f"Cannot eliminate the velocity of {eliminate}: not a non-cyclic coordinate.")
+    branch = sp.Symbol("sigma")
+    root = {vel[k]: _velocity_root(quadratic, vel[k], branch)} if k is not None else {}
+    kept = [i for i in free_idx if i != k]
+    state_vel = {vel[i]: sp.Function(f"v_{coords[i]}")(parameter) for i in kept}
+
+    def reduce(expr):
+        return expr.xreplace(root).xreplace(state_vel)
+
+    reduced = []
+    for i in range(dim):
+        if i in cyclic_idx:
+            reduced.append(sp.Eq(vel[i], reduce(velocities[vel[i]])))
+        elif i == k:
+            reduced.append(sp.Eq(vel[i], reduce(root[vel[i]])))
+        else:
+            reduced.append(sp.Eq(vel[i], state_vel[vel[i]]))
+    for i in kept:
+        accel = sp.diff(funcs[i], parameter, 2)
+        rest = sp.cancel((equations[i].lhs - accel).xreplace(velocities))
+        reduced.append(sp.Eq(sp.diff(state_vel[vel[i]], parameter), -reduce(rest)))
+    state = tuple(funcs) + tuple(state_vel[vel[i]] for i in kept)
+    return FirstIntegrals(
+        tuple(coords[i] for i in cyclic_idx),
+        constants,
+        conserved,
+        velocities,
+        constraint,
+        coords[k] if k is not None else None,
+        branch,
+        state,
+        reduced,
+    )
+
+
+__all__ = [
+    "FirstIntegrals",
+    "connection_geodesics",
+    "euler_lagrange_geodesics",
+    "first_integrals",
+    "lagrangian_christoffel",
+]
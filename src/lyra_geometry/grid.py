@@ -0,0 +1,197 @@
+from .numeric import _allocate_out, _require_numpy
+from .pointwise import QUANTITIES, _lyra_curvature
+
+_RANKS = {
+    "metric": 2,
+    "christoffel2": 3,
+    "connection": 3,
+    "riemann": 4,
+    "ricci": 2,
+    "ricci_scalar": 0,
+    "einstein": 2,
+    "kretschmann": 0,
+}
+
+
+def _fd_weights(offsets):
+    # First-derivative weights on integer offsets (unit spacing): sum_j w_j o_j**k = [k == 1].
+    np = _require_numpy()
+    offsets = np.asarray(offsets, dtype=float)
+    vander = np.vander(offsets, increasing=True).T
+    rhs = np.zeros(len(offsets))
+    rhs[1] = 1.0
+    return np.linalg.solve(vander, rhs)
+
+
+def _derivative(f, axis, spacing, order):
+    """
+    d/dx along axis with order-accurate stencils.
+
+    Central (order + 1)-point stencils in the interior, shifted one-sided
+    stencils of the same accuracy within order // 2 points of the edges.
+    """
+    np = _require_numpy()
+    f = np.moveaxis(f, axis, 0)
+    n = f.shape[0]
+    half = order // 2
+    if n < order + 1:
+        raise ValueError(f"Grid axis needs at least {order + 1} points for order {order}.")
+    out = np.empty_like(f)
+    central = _fd_weights(range(-half, half + 1))
+    interior = 0
+    for o, w in zip(range(-half, half + 1), central):
+        interior = interior + w * f[half + o : n - half + o]
+    out[half : n - half] = interior
+    for i in list(range(half)) + list(range(n - half, n)):
+        start = min(max(i - half, 0), n - order - 1)
+        offsets = range(start - i, start - i + order + 1)
+        weights = _fd_weights(offsets)
+        out[i] = np.tensordot(weights, f[start : start + order + 1], axes=1)
+    return np.moveaxis(out / spacing, 0, axis)
+
+
+class GridSpace:
+    """
+    Lyra geometry of tabulated fields on a structured grid.
+
+    axes has one entry per coordinate: a uniformly spaced 1D array, or None
+    for coordinates the fields do not depend on. metric has shape
+    grid_shape + (dim, dim), where grid_shape lists the lengths of the
+    non-None axes in coordinate order; phi, torsion (tau_abc) and
+    non-metricity (M^a_bc) follow the same layout. Derivatives use
+    vectorized finite differences of the given (even) order and are pushed
+    through the same Lyra formulas as TensorSpace.at_point.
+    """
+
+    def __init__(self, axes, metric, phi=1, torsion=None, nonmetricity=None, order=4, riemann_sign=1):
+        np = _require_numpy()
+        if not isinstance(order, int) or order <= 0 or order % 2:
+            raise ValueError("order must be a positive even integer.")
+        self.axes = [None if ax is None else np.asarray(ax, dtype=float) for ax in axes]
+        self.dim = len(self.axes)
+        self.order = order
+        self.riemann_sign = riemann_sign
+        self.spacing = []
+        for i, ax in enumerate(self.axes):
+            if ax is None:
+                self.spacing.append(None)
+                continue
+            if ax.ndim != 1 or len(ax) < 2:
+                raise ValueError(f"Grid axis {i} must be a 1D array with at least two points.")
+            step = np.diff(ax)
+            if not np.allclose(step, step[0]):
+                raise ValueError(f"Grid axis {i} must be uniformly spaced.")
+            self.spacing.append(step[0])
+        self.shape = tuple(len(ax) for ax in self.axes if ax is not None)
+        n = (self.dim,)
+        self.metric = self._field(metric, n * 2, "metric")
+        self.phi = self._field(phi, (), "phi")
+        self.torsion = None if torsion is None else self._field(torsion, n * 3, "torsion")
+        self.nonmetricity = None if nonmetricity is None else self._field(nonmetricity, n * 3, "nonmetricity")
+
+    def _field(self, values, tail, name):
+        np = _require_numpy()
+        values = np.asarray(values, dtype=float)
+        if values.ndim == len(tail):
+            values = np.broadcast_to(values, self.shape + tail)
+        if values.shape != self.shape + tail:
+            raise ValueError(f"{name} has shape {values.shape}, expected {self.shape + tail}.")
+        return values
+
+    def __repr__(self):
+        return f"GridSpace(dim={self.dim}, shape={self.shape}, order={self.order})"
+
+    def gradient(self, field, axes=None, spacing=None):
+        """Append a trailing axis of size dim with d_c field (zero along None axes)."""
+        np = _require_numpy()
+        axes = self.axes if axes is None else axes
+        spacing = self.spacing if spacing is None else spacing
+        out = np.zeros(field.shape + (self.dim,))
+        grid_axis = 0
+        for c, ax in enumerate(axes):
+            if ax is None:
+                continue
+            out[..., c] = _derivative(field, grid_axis, spacing[c], self.order)
+            grid_axis += 1
+        return out
+
+    def _blocks(self, window):
+        np = _require_numpy()
+        axes = list(self.axes)
+        first = next((c for c, ax in enumerate(axes) if ax is not None), None)
+        if first is not None:
+            axes[first] = axes[first][window]
+        g = self.metric[window]
+        phi = self.phi[window]
+
+        def grad(field):
+            return self.gradient(field, axes=axes)
+
+        def with_gradient(field):
+            if field is None:
+                return np.zeros(g.shape[:-2] + (self.dim,) * 3), np.zeros(g.shape[:-2] + (self.dim,) * 4)
+            field = field[window]
+            return field, grad(field)
+
+        dg = grad(g)
+        dphi = grad(phi)
+        tau, dtau = with_gradient(self.torsion)
+        M, dM = with_gradient(self.nonmetricity)
+        return [g, dg, grad(dg), phi, dphi, grad(dphi), tau, dtau, M, dM]
+
+    def compute(self, quantities=("riemann",), chunk_size=None, out=None):
+        """
+        Metric, connection and curvature on the grid.
+
+        quantities are names from "metric", "christoffel2", "connection",
+        "riemann", "ricci", "ricci_scalar", "einstein", "kretschmann".
+        chunk_size splits the first grid axis into slabs (with halos wide
+        enough that results match a single pass) to bound memory on large
+        grids. Returns {name: ndarray} with grid_shape leading; with out (a
+        directory, or {name: array}) each slab is written into <out>/<name>.npy
+        memmaps so only one slab is held in memory.
+        """
+        np = _require_numpy()
+        if isinstance(quantities, str):
+            quantities = [quantities]
+        for name in quantities:
+            if name not in QUANTITIES:
+                raise ValueError(f"Unknown quantity '{name}'. Allowed: {', '.join(QUANTITIES)}.")
+        n0 = self.shape[0] if self.shape else 1
+        targets = None
+        if out is not None:
+            shapes = [self.shape + (self.dim,) * _RANKS[name] for name in quantities]
+            targets = dict(zip(quantities, _allocate_out(out, quantities, shapes)))
+        if not self.shape or chunk_size is None or chunk_size >= n0:
+            values = _lyra_curvature(self._blocks(slice(None)), self.riemann_sign, quantities)
+            if targets is None:
+                return values
+            for name in quantities:
+                targets[name][...] = values[name]
+            return _flushed(targets)
+        # Nested first-derivative passes: one-sided edge stencils reach order points,
+        # the central stencils feeding them another order // 2.
+        halo = self.order + self.order // 2
+        parts = {name: [] for name in quantities}
+        for a in range(0, n0, chunk_size):
+            b = min(a + chunk_size, n0)
+            lo, hi = max(a - halo, 0), min(b + halo, n0)
+            block = _lyra_curvature(self._blocks(slice(lo, hi)), self.riemann_sign, quantities)
+            for name in quantities:
+                if targets is None:
+                    parts[name].append(block[name][a - lo : b - lo])
+                else:
+                    targets[name][a:b] = block[name][a - lo : b - lo]
+        if targets is not None:
+            return _flushed(targets)
+        return {name: np.concatenate(parts[name]) for name in quantities}
+
+
+def _flushed(arrays):
+    for array in arrays.values():
+        if hasattr(array, "flush"):
+            array.flush()
+    return arrays
+
+
+__all__ = ["GridSpace"]
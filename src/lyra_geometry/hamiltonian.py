@@ -0,0 +1,136 @@
+import sympy as sp
+
+from .numeric import _compile_vector, _require_numpy
+from .tensors import _dependency_mask
+
+
+def geodesic_hamiltonian(metric_inv, coords, weight=1):
+    """
+    H = g^{ab} p_a p_b / (2 weight**2), the Hamiltonian of L = weight**2 g v v / 2.
+
+    Returns (H, momenta) with momenta the Symbols p_<coord>. Its flow
+    reproduces geodesic_equations for weight=phi.
+    """
+    coords = tuple(coords)
+    dim = len(coords)
+    g_inv = sp.Matrix(metric_inv)
+    momenta = tuple(sp.Symbol(f"p_{c}") for c in coords)
+    kinetic = sum(g_inv[a, b] * momenta[a] * momenta[b] for a in range(dim) for b in range(dim) if g_inv[a, b] != 0)
+    return kinetic / (2 * sp.sympify(weight) ** 2), momenta
+
+
+class CompiledHamiltonian:
+    """
+    Geodesic Hamiltonian with NumPy-compiled value and gradients.
+
+    x and p arrays have shape (..., dim); every call is vectorized over the
+    leading axes. params substitutes constants (and undefined functions)
+    before compiling, which happens on first numeric use.
+    """
+
+    def __init__(self, expr, coords, momenta, params=None):
+        self.coords = tuple(coords)
+        self.momenta = tuple(momenta)
+        self.dim = len(self.coords)
+        self.params = dict(params or {})
+        self.expr = sp.sympify(expr).subs(self.params) if self.params else sp.sympify(expr)
+        self._compiled = None
+
+    def _compile(self):
+        if self._compiled is None:
+            mask = _dependency_mask(self.expr, self.coords)
+            dx = [sp.diff(self.expr, x) if mask >> i & 1 else sp.Integer(0) for i, x in enumerate(self.coords)]
+            dp = [sp.diff(self.expr, p) for p in self.momenta]
+            symbols = self.coords + self.momenta
+            self._compiled = (
+                _compile_vector([self.expr], symbols),
+                _compile_vector(dx, symbols),
+                _compile_vector(dp, symbols),
+            )
+        return self._compiled
+
+    def _columns(self, x, p):
+        np = _require_numpy()
+        x = np.asarray(x, dtype=float)
+        p = np.asarray(p, dtype=float)
+        if x.shape[-1] != self.dim or p.shape[-1] != self.dim:
+            raise ValueError(f"x and p must have a trailing axis of size {self.dim}.")
+        return [x[..., i] for i in range(self.dim)] + [p[..., i] for i in range(self.dim)]
+
+    def energy(self, x, p):
+        return self._compile()[0](*self._columns(x, p))[..., 0]
+
+    def dH_dx(self, x, p):
+        return self._compile()[1](*self._columns(x, p))
+
+    def dH_dp(self, x, p):
+        return self._compile()[2](*self._columns(x, p))
+
+    def __repr__(self):
+        return f"CompiledHamiltonian(dim={self.dim}, coords={self.coords})"
+
+
+def _leapfrog_step(hamiltonian, x, p, h, tol, max_iter):
+    # Generalized Stormer-Verlet for non-separable H: implicit half kick and
+    # drift solved by fixed-point iteration, explicit final half kick.
+    np = _require_numpy()
+    p_half = p - 0.5 * h * hamiltonian.dH_dx(x, p)
+    for _ in range(max_iter):
+        update = p - 0.5 * h * hamiltonian.dH_dx(x, p_half)
+        done = np.max(np.abs(update - p_half), initial=0.0) <= tol
+        p_half = update
+        if done:
+            break
+    velocity = hamiltonian.dH_dp(x, p_half)
+    x_new = x + h * velocity
+    for _ in range(max_iter):
+        update = x + 0.5 * h * (velocity + hamiltonian.dH_dp(x_new, p_half))
+        done = np.max(np.abs(update - x_new), initial=0.0) <= tol
+        x_new = update
+        if done:
+            break
+    p_new = p_half - 0.5 * h * hamiltonian.dH_dx(x_new, p_half)
+    return x_new, p_new
+
+
+_YOSHIDA_W1 = 1.0 / (2.0 - 2.0 ** (1.0 / 3.0))
+_YOSHIDA_W0 = 1.0 - 2.0 * _YOSHIDA_W1
+
+
+def _integrate(hamiltonian, x0, p0, step, n_steps, save_every, tol, max_iter, weights):
+    np = _require_numpy()
+    x = np.array(x0, dtype=float)
+    p = np.array(p0, dtype=float)
+    saved_x, saved_p = [], []
+    for n in range(n_steps):
+        for w in weights:
+            x, p = _leapfrog_step(hamiltonian, x, p, w * step, tol, max_iter)
+        if save_every and (n + 1) % save_every == 0:
+            saved_x.append(x)
+            saved_p.append(p)
+    if save_every:
+        return np.stack(saved_x), np.stack(saved_p)
+    return x, p
+
+
+def leapfrog(hamiltonian, x0, p0, step, n_steps, save_every=None, tol=1e-13, max_iter=50):
+    """
+    Second-order symplectic (generalized Stormer-Verlet) integration.
+
+    x0 and p0 have shape (..., dim) and are advanced together. Returns the
+    final (x, p), or stacked snapshots every save_every steps.
+    """
+    return _integrate(hamiltonian, x0, p0, step, n_steps, save_every, tol, max_iter, (1.0,))
+
+
+def yoshida4(hamiltonian, x0, p0, step, n_steps, save_every=None, tol=1e-13, max_iter=50):
+    """
+    Fourth-order symplectic integration (Yoshida triple-jump of leapfrog).
+
+    Same arguments and return value as leapfrog.
+    """
+    weights = (_YOSHIDA_W1, _YOSHIDA_W0, _YOSHIDA_W1)
+    return _integrate(hamiltonian, x0, p0, step, n_steps, save_every, tol, max_iter, weights)
+
+
+__all__ = ["CompiledHamiltonian", "geodesic_hamiltonian", "leapfrog", "yoshida4"]
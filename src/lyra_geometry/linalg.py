@@ -0,0 +1,112 @@
+import functools
+
+import sympy as sp
+from sympy.polys.constructor import construct_domain
+from sympy.polys.domains import EX
+
+
+def _blocks(matrix):
+    """Index sets of the connected components of the nonzero pattern (symmetric closure)."""
+    n = matrix.rows
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(n):
+        for j in range(i + 1, n):
+            if matrix[i, j] != 0 or matrix[j, i] != 0:
+                parent[find(i)] = find(j)
+    groups = {}
+    for i in range(n):
+        groups.setdefault(find(i), []).append(i)
+    return sorted(groups.values())
+
+
+def _polynomial_atoms(expr, table):
+    """expr with every non-rational subexpression (sin(x), sqrt(r), f(t), ...) replaced by a Dummy."""
+    if expr.is_Symbol or expr.is_Rational:
+        return expr
+    if expr.is_Add or expr.is_Mul:
+        return expr.func(*(_polynomial_atoms(a, table) for a in expr.args))
+    if expr.is_Pow and expr.exp.is_Integer:
+        return _polynomial_atoms(expr.base, table) ** expr.exp
+    if expr not in table:
+        table[expr] = sp.Dummy()
+    return table[expr]
+
+
+def _bareiss_inverse(block):
+    """
+    (det, inverse) of a square block by fraction-free Gauss-Jordan elimination.
+
+    The entries are mapped into a polynomial ring (or its fraction field)
+    over the symbols and the remaining atoms, which is valid because the
+    Bareiss divisions are exact polynomial identities in the entries. The
+    inverse is adj / det, reduced once in the fraction field.
+    """
+    n = block.rows
+    table = {}
+    K, elements = construct_domain([_polynomial_atoms(sp.sympify(e), table) for e in block])
+    if not K.is_Exact:
+        K, elements = EX, [EX.from_sympy(sp.sympify(e)) for e in block]
+        table = {}
+    rows = [elements[i * n:(i + 1) * n] + [K.one if i == j else K.zero for j in range(n)] for i in range(n)]
+    previous, sign = K.one, 1
+    for k in range(n):
+        pivot = next((i for i in range(k, n) if rows[i][k]), None)
+        if pivot is None:
+            return sp.Integer(0), None
+        if pivot != k:
+            rows[k], rows[pivot] = rows[pivot], rows[k]
+            sign = -sign
+        p = rows[k][k]
+        for i in range(n):
+            if i != k:
+                factor = rows[i][k]
+                rows[i] = [K.exquo(p * a - factor * b, previous) for a, b in zip(rows[i], rows[k])]
+        previous = p
+    # Row operations L with L A = d I give L = d A^-1; the swaps only flip the sign of det.
+    back = {dummy: atom for atom, dummy in table.items()}
+    F = K.get_field()
+    d = F.convert_from(previous, K)
+    inverse = sp.Matrix(n, n, lambda i, j: F.to_sympy(F.convert_from(rows[i][n + j], K) / d).xreplace(back))
+    return sign * K.to_sympy(previous).xreplace(back), inverse
+
+
+@functools.lru_cache(maxsize=64)
+def _inverse_and_det(matrix):
+    n = matrix.rows
+    det = sp.Integer(1)
+    inverse = sp.zeros(n, n)
+    for block in _blocks(matrix):
+        block_det, block_inverse = _bareiss_inverse(matrix.extract(block, block))
+        if block_det == 0:
+            raise ValueError("Metric is not invertible.")
+        det *= block_det
+        for a, i in enumerate(block):
+            for b, j in enumerate(block):
+                inverse[i, j] = block_inverse[a, b]
+    return sp.ImmutableMatrix(inverse), det
+
+
+def metric_inverse(metric):
+    """
+    (inverse, determinant) of a square metric, exploiting block structure.
+
+    Indices coupled by nonzero entries form blocks that are inverted
+    separately by fraction-free Bareiss elimination; the determinant is the
+    product of the block determinants, shared with the adjugate. Results
+    are cached by matrix content, so rebuilding a space for the same metric
+    is free.
+    """
+    matrix = sp.ImmutableMatrix(metric)
+    if not matrix.is_square:
+        raise ValueError("Metric must be a square matrix.")
+    return _inverse_and_det(matrix)
+
+
+__all__ = ["metric_inverse"]
@@ -0,0 +1,135 @@
+import sympy as sp
+
+from .numeric import _compile_vector, _require_numpy
+from .tensors import _dependency_mask
+
+
+class VariationalEquations:
+    """
+    Geodesic/autoparallel flow with its symbolic, compiled Jacobian.
+
+    The state is y = (x, v) with shape (..., 2 * dim) and the flow is
+    dx/ds = v, dv^c/ds = -Gamma^c_ab v^a v^b from a sparse table
+    {(c, a, b): Gamma^c_ab} (a <= b), as returned with
+    with_christoffel=True. The Jacobian df/dy is derived once and compiled
+    together with the acceleration (sharing common subexpressions); params
+    (Symbols or names) substitutes constants before compiling.
+    """
+
+    def __init__(self, table, coords, params=None):
+        self.coords = tuple(coords)
+        self.dim = len(self.coords)
+        self.params = dict(params or {})
+        self.velocities = tuple(sp.Symbol(f"v_{c}") for c in self.coords)
+        v = self.velocities
+        table = {key: sp.sympify(value) for key, value in table.items()}
+        if self.params:
+            free = {str(s): s for value in table.values() for s in value.free_symbols}
+            subs = {free.get(k, k) if isinstance(k, str) else k: val for k, val in self.params.items()}
+            table = {key: value.subs(subs) for key, value in table.items()}
+        accel = [sp.Integer(0)] * self.dim
+        for (c, a, b), value in table.items():
+            factor = 1 if a == b else 2
+            accel[c] -= factor * value * v[a] * v[b]
+        self.acceleration = accel
+        rows = []
+        for expr in accel:
+            mask = _dependency_mask(expr, self.coords)
+            row = [sp.diff(expr, x) if mask >> i & 1 else sp.Integer(0) for i, x in enumerate(self.coords)]
+            row += [sp.diff(expr, s) for s in v]
+            rows.append(row)
+        self.jacobian = sp.Matrix(rows)  # d(acceleration)/d(x, v); the top block is [0, I]
+        self._compiled = None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_compiled"] = None
+        return state
+
+    def __repr__(self):
+        return f"VariationalEquations(dim={self.dim}, coords={self.coords})"
+
+    def _evaluate(self, y, with_jacobian=True):
+        np = _require_numpy()
+        if self._compiled is None:
+            inputs = self.coords + self.velocities
+            self._compiled = (
+                _compile_vector(self.acceleration, inputs),
+                _compile_vector(list(self.acceleration) + list(self.jacobian), inputs),
+            )
+        y = np.asarray(y, dtype=float)
+        if y.shape[-1] != 2 * self.dim:
+            raise ValueError(f"y must have a trailing axis of size {2 * self.dim}.")
+        values = self._compiled[with_jacobian](*(y[..., i] for i in range(2 * self.dim)))
+        n = self.dim
+        if not with_jacobian:
+            return y, values, None
+        return y, values[..., :n], values[..., n:].reshape(y.shape[:-1] + (n, 2 * n))
+
+    def rhs(self, y):
+        np = _require_numpy()
+        y, accel, _ = self._evaluate(y, with_jacobian=False)
+        return np.concatenate([y[..., self.dim :], accel], axis=-1)
+
+    def jacobian_at(self, y):
+        """Full df/dy with shape (..., 2 * dim, 2 * dim)."""
+        np = _require_numpy()
+        y, _, lower = self._evaluate(y)
+        n = self.dim
+        upper = np.zeros(y.shape[:-1] + (n, 2 * n))
+        upper[..., :, n:] = np.eye(n)
+        return np.concatenate([upper, lower], axis=-2)
+
+    def tangent_rhs(self, y, tangents):
+        """(f(y), J(y) @ tangents) for tangents of shape (..., 2 * dim, k)."""
+        np = _require_numpy()
+        y, accel, lower = self._evaluate(y)
+        n = self.dim
+        tangents = np.asarray(tangents, dtype=float)
+        flow = np.concatenate([y[..., n:], accel], axis=-1)
+        d_tangents = np.concatenate([tangents[..., n:, :], lower @ tangents], axis=-2)
+        return flow, d_tangents
+
+
+def lyapunov_spectrum(system, y0, step, n_steps, n_vectors=None, renormalize_every=10, transient=0):
+    """
+    Lyapunov exponents of a VariationalEquations flow (batched RK4).
+
+    y0 has shape (..., 2 * dim); every orbit carries n_vectors tangent
+    vectors (default 2 * dim), re-orthonormalized by QR every
+    renormalize_every steps. Growth in renormalization blocks starting
+    before step transient is discarded. Returns (exponents, y) with exponents of shape (..., n_vectors)
+    in decreasing order of the QR columns and the final states.
+    """
+    np = _require_numpy()
+    y = np.array(y0, dtype=float)
+    size = 2 * system.dim
+    k = size if n_vectors is None else n_vectors
+    if not 1 <= k <= size:
+        raise ValueError(f"n_vectors must be between 1 and {size}.")
+    # A fixed generic basis, so no tangent vector starts inside an invariant subspace.
+    basis = np.linalg.qr(np.random.default_rng(0).normal(size=(size, size)))[0][:, :k]
+    Q = np.broadcast_to(basis, y.shape[:-1] + (size, k)).copy()
+    sums = np.zeros(y.shape[:-1] + (k,))
+    elapsed, last = 0.0, 0
+    for n in range(1, n_steps + 1):
+        f1, t1 = system.tangent_rhs(y, Q)
+        f2, t2 = system.tangent_rhs(y + 0.5 * step * f1, Q + 0.5 * step * t1)
+        f3, t3 = system.tangent_rhs(y + 0.5 * step * f2, Q + 0.5 * step * t2)
+        f4, t4 = system.tangent_rhs(y + step * f3, Q + step * t3)
+        y = y + step / 6.0 * (f1 + 2 * f2 + 2 * f3 + f4)
+        Q = Q + step / 6.0 * (t1 + 2 * t2 + 2 * t3 + t4)
+        if n % renormalize_every == 0 or n == n_steps:
+            Q, R = np.linalg.qr(Q)
+            diag = np.diagonal(R, axis1=-2, axis2=-1)
+            Q = Q * np.where(diag < 0, -1.0, 1.0)[..., None, :]
+            if last >= transient:
+                sums += np.log(np.abs(diag))
+                elapsed += step * (n - last)
+            last = n
+    if elapsed == 0:
+        raise ValueError("No steps after the transient; increase n_steps.")
+    return -np.sort(-sums / elapsed, axis=-1), y
+
+
+__all__ = ["VariationalEquations", "lyapunov_spectrum"]
@@ -0,0 +1,333 @@
+import os
+
+import sympy as sp
+from sympy.core.function import AppliedUndef
+
+_WORKER_FUNC = None
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "Numeric evaluation requires numpy; install it with `pip install lyra-geometry[numeric]`."
+        ) from exc
+    return numpy
+
+
+def _check_numeric(exprs, symbols):
+    exprs = [sp.sympify(e) for e in exprs]
+    allowed = set(symbols)
+    free = set().union(*(e.free_symbols for e in exprs)) - allowed
+    if free:
+        names = ", ".join(sorted(str(s) for s in free))
+        raise ValueError(f"Unresolved symbols: {names}; give them numeric values.")
+    undefined = set().union(*(e.atoms(AppliedUndef) for e in exprs))
+    if undefined:
+        names = ", ".join(sorted(str(f) for f in undefined))
+        raise ValueError(f"Undefined functions cannot be compiled: {names}; substitute them first.")
+    return exprs
+
+
+class _CompiledArray:
+    # Lambdified lazily (and again after unpickling in worker processes).
+    def __init__(self, exprs, symbols):
+        self.symbols = tuple(symbols)
+        self.exprs = _check_numeric(exprs, self.symbols)
+        self._func = None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_func"] = None
+        return state
+
+    def __call__(self, *columns):
+        np = _require_numpy()
+        if self._func is None:
+            self._func = sp.lambdify(self.symbols, self.exprs, modules="numpy", cse=True)
+        values = self._func(*columns)
+        shape = np.broadcast_shapes(*(np.shape(c) for c in columns))
+        return np.stack([np.broadcast_to(np.asarray(v, dtype=float), shape) for v in values], axis=-1)
+
+
+def _compile_vector(exprs, symbols):
+    """
+    Compile exprs into f(*columns) -> array with a trailing axis of len(exprs).
+
+    Columns broadcast against each other; constant entries are broadcast to
+    the common shape.
+    """
+    return _CompiledArray(exprs, symbols)
+
+
+def _init_worker(func):
+    global _WORKER_FUNC
+    _WORKER_FUNC = func
+
+
+def _evaluate_worker(columns):
+    return _WORKER_FUNC(*columns)
+
+
+def _map_chunks(func, columns, chunk_size=65536, workers=None):
+    """Evaluate func over 1D columns in chunks, optionally on a process pool."""
+    np = _require_numpy()
+    size = len(columns[0]) if columns else 0
+    bounds = [(i, min(i + chunk_size, size)) for i in range(0, size, chunk_size)]
+    if workers is None or workers <= 1 or len(bounds) <= 1:
+        return func(*columns)
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [[c[a:b] for c in columns] for a, b in bounds]
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(func,)) as pool:
+        return np.concatenate(list(pool.map(_evaluate_worker, jobs)))
+
+
+def _resolve_parameters(param_grid, exprs, known=()):
+    # known: further symbols (a space's coordinates and parameters) that may be named without appearing in exprs.
+    names = {str(s): s for s in known}
+    for expr in exprs:
+        for s in expr.free_symbols:
+            names.setdefault(str(s), s)
+    symbols = []
+    for key in param_grid:
+        if isinstance(key, str):
+            if key not in names:
+                raise ValueError(f"Unknown parameter '{key}'.")
+            symbols.append(names[key])
+        else:
+            key = sp.sympify(key)
+            # A plain Symbol also names a same-named one carrying domain assumptions.
+            symbols.append(names.get(str(key), key) if key.is_Symbol else key)
+    return symbols
+
+
+def _grid_chunks(param_grid, chunk_size):
+    # Broadcast views are indexed chunk by chunk, so columns never exist for the full grid.
+    np = _require_numpy()
+    grids = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in param_grid.values()))
+    shape = grids[0].shape if grids else ()
+    size = int(np.prod(shape, dtype=np.int64))
+
+    def chunks():
+        for a in range(0, size, chunk_size):
+            b = min(a + chunk_size, size)
+            index = np.unravel_index(np.arange(a, b), shape) if shape else ()
+            yield a, b, [g[index] for g in grids]
+
+    return shape, size, chunks()
+
+
+def _stream(func, chunks, workers=None):
+    """Yield (start, stop, func(*columns)) in order, with at most 2 * workers chunks in flight."""
+    if workers is None or workers <= 1:
+        for a, b, columns in chunks:
+            yield a, b, func(*columns)
+        return
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    pending = deque()
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(func,)) as pool:
+        for a, b, columns in chunks:
+            pending.append((a, b, pool.submit(_evaluate_worker, columns)))
+            if len(pending) >= 2 * workers:
+                a0, b0, future = pending.popleft()
+                yield a0, b0, future.result()
+        while pending:
+            a0, b0, future = pending.popleft()
+            yield a0, b0, future.result()
+
+
+def _sweep_shape(param_grid):
+    np = _require_numpy()
+    return np.broadcast_shapes(*(np.shape(v) for v in param_grid.values()))
+
+
+def open_memmap(path, shape, dtype="float64"):
+    """Create a writable .npy-backed numpy.memmap (readable later with np.load(..., mmap_mode="r"))."""
+    np = _require_numpy()
+    directory = os.path.dirname(os.fspath(path))
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return np.lib.format.open_memmap(os.fspath(path), mode="w+", dtype=dtype, shape=tuple(shape))
+
+
+def _allocate_out(out, names, shapes):
+    """Resolve out (directory, list or dict of arrays) into one C-contiguous array per name."""
+    if isinstance(out, (str, os.PathLike)):
+        return [open_memmap(os.path.join(out, f"{name}.npy"), shape) for name, shape in zip(names, shapes)]
+    if isinstance(out, dict):
+        out = [out[name] for name in names]
+    out = list(out)
+    if len(out) != len(names):
+        raise ValueError(f"Expected {len(names)} output arrays, got {len(out)}.")
+    for name, shape, array in zip(names, shapes, out):
+        if tuple(array.shape) != tuple(shape):
+            raise ValueError(f"Output array for {name} has shape {array.shape}, expected {tuple(shape)}.")
+        if not array.flags.c_contiguous:
+            raise ValueError("Output arrays must be C-contiguous.")
+    return out
+
+
+def _flatten_arrays(arrays):
+    arrays = [a if isinstance(a, sp.NDimArray) else sp.Array(sp.sympify(a)) for a in arrays]
+    flat = [[sp.sympify(a[()])] if a.rank() == 0 else sp.flatten(a) for a in arrays]
+    return arrays, flat
+
+
+def _split(values, arrays, flat, rows):
+    out = []
+    start = 0
+    for a, values_a in zip(arrays, flat):
+        out.append(values[:, start : start + len(values_a)].reshape((rows,) + tuple(a.shape)))
+        start += len(values_a)
+    return out
+
+
+def sweep_arrays(arrays, param_grid, chunk_size=65536, workers=None, out=None, names=None, known=()):
+    """
+    Evaluate symbolic arrays over a broadcast grid of parameter values.
+
+    arrays is a list of sympy Arrays (or scalars); param_grid maps Symbols
+    (or their names) to array-like values that broadcast to a common grid
+    shape. Everything is compiled once and evaluated on the flattened grid,
+    split into chunks over workers processes when given. Returns one ndarray
+    per input with shape grid_shape + array shape.
+
+    With out (a directory for .npy memmaps, or a list/dict of preallocated
+    arrays) chunks are written straight into the outputs, so memory stays
+    bounded by chunk_size instead of the grid size; names label the files.
+    known lists further Symbols that param_grid may name by string even
+    when no array uses them.
+    """
+    np = _require_numpy()
+    arrays, flat = _flatten_arrays(arrays)
+    exprs = [e for values in flat for e in values]
+    symbols = _resolve_parameters(param_grid, exprs, known)
+    func = _compile_vector(exprs, symbols)
+    if out is not None:
+        names = list(names) if names is not None else [f"array_{k}" for k in range(len(arrays))]
+        shape, size, chunks = _grid_chunks(param_grid, chunk_size)
+        out = _allocate_out(out, names, [shape + tuple(a.shape) for a in arrays])
+        targets = [o.reshape((size,) + tuple(a.shape)) for o, a in zip(out, arrays)]
+        for lo, hi, values in _stream(func, chunks, workers):
+            for target, block in zip(targets, _split(values.reshape(hi - lo, -1), arrays, flat, hi - lo)):
+                target[lo:hi] = block
+        for o in out:
+            if hasattr(o, "flush"):
+                o.flush()
+        return out
+    grids = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in param_grid.values()))
+    shape = grids[0].shape if grids else ()
+    columns = [g.ravel() for g in grids]
+    if not columns:
+        values = func().reshape(1, -1)
+    else:
+        values = _map_chunks(func, columns, chunk_size=chunk_size, workers=workers)
+    blocks = _split(values, arrays, flat, len(values))
+    return [block.reshape(shape + tuple(a.shape)) for block, a in zip(blocks, arrays)]
+
+
+class StreamingStats:
+    """
+    Running reductions over a stream of chunks of shape (n,) + component shape.
+
+    Keeps count, min, max, abs_max, mean and the L2 norm per component;
+    with bins and range a histogram of all entries is accumulated as well
+    (the range must be fixed up front for a single pass).
+    """
+
+    def __init__(self, bins=None, range=None):
+        if bins is not None and range is None:
+            raise ValueError("Streaming histograms need a fixed range.")
+        self.bins = bins
+        self.range = range
+        self.count = 0
+        self.min = None
+        self.max = None
+        self.abs_max = None
+        self._sum = None
+        self._sumsq = None
+        self.histogram = None
+        self.edges = None
+
+    def update(self, chunk):
+        np = _require_numpy()
+        chunk = np.asarray(chunk, dtype=float)
+        if not len(chunk):
+            return self
+        low, high = chunk.min(axis=0), chunk.max(axis=0)
+        peak = np.abs(chunk).max(axis=0)
+        total, squares = chunk.sum(axis=0), np.square(chunk).sum(axis=0)
+        if self.count == 0:
+            self.min, self.max, self.abs_max, self._sum, self._sumsq = low, high, peak, total, squares
+        else:
+            self.min = np.minimum(self.min, low)
+            self.max = np.maximum(self.max, high)
+            self.abs_max = np.maximum(self.abs_max, peak)
+            self._sum = self._sum + total
+            self._sumsq = self._sumsq + squares
+        self.count += len(chunk)
+        if self.bins is not None:
+            counts, self.edges = np.histogram(chunk, bins=self.bins, range=self.range)
+            self.histogram = counts if self.histogram is None else self.histogram + counts
+        return self
+
+    @property
+    def mean(self):
+        return None if self.count == 0 else self._sum / self.count
+
+    @property
+    def norm(self):
+        np = _require_numpy()
+        return None if self.count == 0 else np.sqrt(self._sumsq)
+
+    @property
+    def rms(self):
+        np = _require_numpy()
+        return None if self.count == 0 else np.sqrt(self._sumsq / self.count)
+
+    def __repr__(self):
+        return f"StreamingStats(count={self.count})"
+
+
+def stream_stats(array, rank=0, chunk_size=65536, bins=None, range=None):
+    """
+    StreamingStats of an existing (e.g. memory-mapped) array, read chunk by chunk.
+
+    The last rank axes are components; all leading axes are grid points.
+    """
+    np = _require_numpy()
+    if not hasattr(array, "reshape"):
+        array = np.asarray(array)
+    tail = tuple(array.shape[array.ndim - rank :]) if rank else ()
+    flat = array.reshape((-1,) + tail)
+    stats = StreamingStats(bins=bins, range=range)
+    start = 0
+    while start < len(flat):
+        stats.update(flat[start : start + chunk_size])
+        start += chunk_size
+    return stats
+
+
+def sweep_stats(arrays, param_grid, chunk_size=65536, workers=None, bins=None, range=None, known=()):
+    """
+    Streaming reductions of compiled arrays over a parameter grid.
+
+    Same arguments as sweep_arrays, but chunks are reduced and discarded
+    instead of stored; returns one StreamingStats per array.
+    """
+    arrays, flat = _flatten_arrays(arrays)
+    exprs = [e for values in flat for e in values]
+    func = _compile_vector(exprs, _resolve_parameters(param_grid, exprs, known))
+    _, _, chunks = _grid_chunks(param_grid, chunk_size)
+    stats = [StreamingStats(bins=bins, range=range) for _ in arrays]
+    for lo, hi, values in _stream(func, chunks, workers):
+        for stat, block in zip(stats, _split(values.reshape(hi - lo, -1), arrays, flat, hi - lo)):
+            stat.update(block)
+    return stats
+
+
+__all__ = ["StreamingStats", "open_memmap", "stream_stats", "sweep_arrays", "sweep_stats"]
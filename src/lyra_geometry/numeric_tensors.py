@@ -0,0 +1,350 @@
+import numbers
+import string
+
+from .numeric import _require_numpy, sweep_arrays
+from .tensors import (
+    D,
+    DownIndex,
+    Index,
+    NO_LABEL,
+    U,
+    UpIndex,
+    _parse_label,
+    _validate_signature,
+)
+
+_PATHS = {}
+_LETTERS = string.ascii_letters
+
+
+def _einsum(spec, *operands):
+    """np.einsum with the contraction path cached per (spec, operand shapes)."""
+    np = _require_numpy()
+    key = (spec,) + tuple(op.shape for op in operands)
+    path = _PATHS.get(key)
+    if path is None:
+        path = np.einsum_path(spec, *operands, optimize="optimal")[0]
+        _PATHS[key] = path
+    return np.einsum(spec, *operands, optimize=path)
+
+
+def _letters(count):
+    if count > len(_LETTERS):
+        raise ValueError(f"At most {len(_LETTERS)} distinct indices per contraction.")
+    return _LETTERS[:count]
+
+
+class NumericSpace:
+    """
+    Numeric counterpart of TensorSpace holding a metric ndarray.
+
+    metric has shape (..., dim, dim); the leading axes are batch/grid axes
+    shared by every tensor of the space. point records the values the
+    metric was evaluated at, so evaluate() can bring symbolic tensors over.
+    """
+
+    def __init__(self, metric, metric_inv=None, point=None):
+        np = _require_numpy()
+        self.metric = np.asarray(metric, dtype=float)
+        if self.metric.ndim < 2 or self.metric.shape[-1] != self.metric.shape[-2]:
+            raise ValueError("metric must have shape (..., dim, dim).")
+        self.metric_inv = np.linalg.inv(self.metric) if metric_inv is None else np.asarray(metric_inv, dtype=float)
+        self.dim = self.metric.shape[-1]
+        self.batch_shape = self.metric.shape[:-2]
+        self.point = point
+        self._label_count = 0
+
+    def _next_label(self):
+        self._label_count += 1
+        return f"_{self._label_count}"
+
+    def index(self, names):
+        if isinstance(names, str):
+            parts = [p for p in names.replace(",", " ").split() if p]
+        else:
+            parts = list(names)
+        out = [None if p in ("_", ".", "empty", None) else Index(str(p)) for p in parts]
+        return out[0] if len(out) == 1 else tuple(out)
+
+    def from_array(self, array, signature, name=None):
+        np = _require_numpy()
+        array = np.asarray(array, dtype=float)
+        rank = len(signature)
+        if rank and array.shape[array.ndim - rank :] != (self.dim,) * rank:
+            raise ValueError(f"Array shape {array.shape} does not end in {(self.dim,) * rank}.")
+        return NumericTensor(array, self, signature, name=name)
+
+    def evaluate(self, tensor, name=None):
+        """Evaluate a symbolic Tensor at this space's point (compiled once, broadcast)."""
+        if self.point is None:
+            raise ValueError("This NumericSpace has no point; use from_array instead.")
+        values = sweep_arrays([tensor.components], self.point)[0]
+        return self.from_array(values, tensor.signature, name=name or tensor.name)
+
+    @property
+    def g(self):
+        return NumericTensor(self.metric, self, (D, D), name="g")
+
+    def contract(self, *indexed):
+        indexed = [t if isinstance(t, NumericIndexed) else t.idx() for t in indexed]
+        labels = [lab for t in indexed for lab in t.labels]
+        sig = [s for t in indexed for s in t.signature]
+        occurrences = {}
+        for lab, s in zip(labels, sig):
+            occurrences.setdefault(lab, []).append(s)
+        letters = dict(zip(occurrences, _letters(len(occurrences))))
+        free = []
+        for lab, variances in occurrences.items():
+            if len(variances) > 2:
+                raise ValueError(f"Index {lab} appears {len(variances)} times.")
+            if len(variances) == 2 and variances[0] is variances[1]:
+                raise ValueError(f"Index {lab} appears with the same variance.")
+        for lab, s in zip(labels, sig):
+            if len(occurrences[lab]) == 1:
+                free.append((lab, s))
+        inputs = ",".join("..." + "".join(letters[lab] for lab in t.labels) for t in indexed)
+        output = "..." + "".join(letters[lab] for lab, _ in free)
+        array = _einsum(f"{inputs}->{output}", *(t.components for t in indexed))
+        result = NumericTensor(array, self, tuple(s for _, s in free))
+        return NumericIndexed(result, array, result.signature, [lab for lab, _ in free])
+
+
+class NumericTensor:
+    """
+    Tensor with float ndarray components of shape (..., dim, ..., dim).
+
+    Supports the symbolic Tensor index syntax: T[+a, -b], T(U, D),
+    as_signature, idx, contract and Einstein summation, all through
+    np.einsum with cached contraction paths.
+    """
+
+    def __init__(self, components, space, signature, name=None):
+        np = _require_numpy()
+        self.components = np.asarray(components, dtype=float)
+        self.rank = len(signature)
+        self.signature = _validate_signature(tuple(signature), self.rank)
+        self.space = space
+        self.name = name
+        self._cache = {self.signature: self.components}
+
+    @property
+    def shape(self):
+        return self.components.shape
+
+    def __repr__(self):
+        name = self.name or "NumericTensor"
+        sig = "".join("^" if s is U else "_" for s in self.signature)
+        return f"{name}[{sig}](shape={self.components.shape})"
+
+    def as_signature(self, target_signature):
+        target_signature = _validate_signature(tuple(target_signature), self.rank)
+        if target_signature in self._cache:
+            return self._cache[target_signature]
+        array = self.components
+        letters = _letters(self.rank + 1)
+        for pos, (have, want) in enumerate(zip(self.signature, target_signature)):
+            if have is want:
+                continue
+            metric = self.space.metric_inv if want is U else self.space.metric
+            idx = letters[: self.rank]
+            new = idx[:pos] + letters[self.rank] + idx[pos + 1 :]
+            array = _einsum(f"...{letters[self.rank]}{idx[pos]},...{idx}->...{new}", metric, array)
+        self._cache[target_signature] = array
+        return array
+
+    def __call__(self, *sig):
+        if len(sig) == 1 and isinstance(sig[0], (tuple, list)):
+            sig = tuple(sig[0])
+        if sig and all(isinstance(s, (UpIndex, DownIndex)) for s in sig):
+            return self[sig]
+        return NumericTensor(self.as_signature(sig), self.space, sig, name=self.name)
+
+    def idx(self, up=None, down=None):
+        rank = self.rank
+        if up is None and down is None:
+            up = [None] * rank
+            down = [None] * rank
+        elif up is None or down is None:
+            raise ValueError("Provide up and down with the same length as the rank.")
+        if len(up) != rank or len(down) != rank:
+            raise ValueError("up/down must have the same length as the tensor rank.")
+        labels = []
+        target = []
+        for i in range(rank):
+            up_i = _parse_label(up[i], None)
+            down_i = _parse_label(down[i], None)
+            if up_i is not None and down_i is not None:
+                raise ValueError("Index cannot be up and down at the same position.")
+            if up_i is None and down_i is None:
+                target.append(self.signature[i])
+                labels.append(self.space._next_label())
+            else:
+                label = up_i if up_i is not None else down_i
+                target.append(U if up_i is not None else D)
+                labels.append(self.space._next_label() if label is NO_LABEL else label)
+        target = tuple(target)
+        return NumericIndexed(self, self.as_signature(target), target, labels)
+
+    def __getitem__(self, indices):
+        if not isinstance(indices, tuple):
+            indices = (indices,)
+        if any(isinstance(i, (UpIndex, DownIndex, Index)) for i in indices):
+            if any(isinstance(i, Index) for i in indices):
+                raise TypeError("Use +a/-b for indices with explicit variance.")
+            if len(indices) != self.rank:
+                raise ValueError("Number of indices does not match tensor rank.")
+            up = [i.label if isinstance(i, UpIndex) else None for i in indices]
+            down = [i.label if isinstance(i, DownIndex) else None for i in indices]
+            indexed = self.idx(up=up, down=down)
+            if len(set(indexed.labels)) != len(indexed.labels):
+                return self.space.contract(indexed)
+            return indexed
+        return self.components[(Ellipsis,) + indices]
+
+    def contract(self, pos1, pos2, use_metric=True):
+        if pos1 == pos2:
+            raise ValueError("pos1 and pos2 must be distinct indices.")
+        if not (0 <= pos1 < self.rank and 0 <= pos2 < self.rank):
+            raise IndexError("pos1/pos2 out of tensor rank.")
+        sig = list(self.signature)
+        if sig[pos1] is sig[pos2]:
+            if not use_metric:
+                raise ValueError("Indices with the same variance require use_metric=True.")
+            sig[pos2] = D if sig[pos2] is U else U
+        array = self.as_signature(tuple(sig))
+        letters = list(_letters(self.rank))
+        letters[pos2] = letters[pos1]
+        out = "".join(c for i, c in enumerate(letters) if i not in (pos1, pos2))
+        contracted = _einsum(f"...{''.join(letters)}->...{out}", array)
+        new_sig = tuple(s for i, s in enumerate(sig) if i not in (pos1, pos2))
+        return NumericTensor(contracted, self.space, new_sig)
+
+    def _binary(self, other, op, word):
+        if isinstance(other, NumericTensor):
+            if other.space is not self.space:
+                raise ValueError("Tensors belong to different spaces.")
+            if other.signature != self.signature:
+                raise ValueError(f"Different signatures; {word} requires the same signature.")
+            return NumericTensor(op(self.components, other.components), self.space, self.signature)
+        return NotImplemented
+
+    def __add__(self, other):
+        return self._binary(other, lambda a, b: a + b, "addition")
+
+    def __sub__(self, other):
+        return self._binary(other, lambda a, b: a - b, "subtraction")
+
+    def __neg__(self):
+        return NumericTensor(-self.components, self.space, self.signature)
+
+    def __mul__(self, other):
+        if isinstance(other, NumericTensor):
+            if other.space is not self.space:
+                raise ValueError("Tensors belong to different spaces.")
+            a = _letters(self.rank + other.rank)
+            spec = f"...{a[: self.rank]},...{a[self.rank :]}->...{a}"
+            return NumericTensor(_einsum(spec, self.components, other.components), self.space, self.signature + other.signature)
+        if isinstance(other, numbers.Number):
+            return NumericTensor(other * self.components, self.space, self.signature)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        if isinstance(other, numbers.Number):
+            return NumericTensor(other * self.components, self.space, self.signature)
+        return NotImplemented
+
+    def __truediv__(self, other):
+        if isinstance(other, numbers.Number):
+            return NumericTensor(self.components / other, self.space, self.signature)
+        return NotImplemented
+
+
+class NumericIndexed:
+    """Labelled view of a NumericTensor; repeated labels contract on multiplication."""
+
+    def __init__(self, tensor, components, signature, labels):
+        self.tensor = tensor
+        self.components = components
+        self.signature = tuple(signature)
+        self.labels = list(labels)
+
+    def __repr__(self):
+        return f"NumericIndexed(labels={self.labels}, shape={self.components.shape})"
+
+    def __call__(self, *idx):
+        return self.components[(Ellipsis,) + idx]
+
+    def _resolve_position(self, idx):
+        if isinstance(idx, int):
+            if not (0 <= idx < len(self.signature)):
+                raise IndexError("Index out of tensor rank.")
+            return idx
+        if not isinstance(idx, (UpIndex, DownIndex)):
+            raise ValueError("Use +a/-b for indices with explicit variance.")
+        matches = [i for i, lab in enumerate(self.labels) if lab == idx.label]
+        if len(matches) != 1:
+            raise ValueError(f"Index {idx.label!r} not found or duplicated.")
+        return matches[0]
+
+    def _with(self, array):
+        tensor = NumericTensor(array, self.tensor.space, self.signature)
+        return NumericIndexed(tensor, array, self.signature, self.labels)
+
+    def _permuted(self, other):
+        np = _require_numpy()
+        if set(other.labels) != set(self.labels) or len(other.labels) != len(self.labels):
+            raise ValueError("Addition requires the same labels.")
+        perm = [other.labels.index(lab) for lab in self.labels]
+        if tuple(other.signature[i] for i in perm) != self.signature:
+            raise ValueError("Different signatures; addition requires the same signature.")
+        lead = other.components.ndim - len(perm)
+        return np.transpose(other.components, list(range(lead)) + [lead + p for p in perm])
+
+    def _symmetrize(self, idx1, idx2, sign, word):
+        np = _require_numpy()
+        pos1 = self._resolve_position(idx1)
+        pos2 = self._resolve_position(idx2)
+        if pos1 == pos2:
+            raise ValueError("Indices must be distinct.")
+        if self.signature[pos1] is not self.signature[pos2]:
+            raise ValueError(f"Indices with different variance cannot be {word}.")
+        swapped = np.swapaxes(self.components, pos1 - len(self.signature), pos2 - len(self.signature))
+        return self._with(0.5 * (self.components + sign * swapped))
+
+    def symmetric(self, idx1, idx2):
+        return self._symmetrize(idx1, idx2, 1, "symmetrized")
+
+    def antisymmetric(self, idx1, idx2):
+        return self._symmetrize(idx1, idx2, -1, "antisymmetrized")
+
+    def __add__(self, other):
+        if isinstance(other, NumericIndexed):
+            return self._with(self.components + self._permuted(other))
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, NumericIndexed):
+            return self._with(self.components - self._permuted(other))
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, NumericIndexed):
+            if other.tensor.space is not self.tensor.space:
+                raise ValueError("Tensors belong to different spaces.")
+            return self.tensor.space.contract(self, other)
+        if isinstance(other, numbers.Number):
+            return self._with(other * self.components)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        if isinstance(other, numbers.Number):
+            return self._with(other * self.components)
+        return NotImplemented
+
+    def __truediv__(self, other):
+        if isinstance(other, numbers.Number):
+            return self._with(self.components / other)
+        return NotImplemented
+
+
+__all__ = ["NumericIndexed", "NumericSpace", "NumericTensor"]
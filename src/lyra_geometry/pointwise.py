@@ -0,0 +1,214 @@
+import sympy as sp
+
+from .numeric import _compile_vector, _require_numpy
+from .tensors import D, Tensor, U, _dependency_mask
+
+QUANTITIES = ("metric", "christoffel2", "connection", "riemann", "ricci", "ricci_scalar", "einstein", "kretschmann")
+
+
+class _Jet:
+    # First-order jet: value with shape (..., *idx) and derivative (..., *idx, dim).
+    def __init__(self, value, der):
+        self.value = value
+        self.der = der
+
+    def transpose(self, *axes):
+        np = _require_numpy()
+        rank = len(axes)
+        lead = self.value.ndim - rank
+        perm = list(range(lead)) + [lead + a for a in axes]
+        return _Jet(np.transpose(self.value, perm), np.transpose(self.der, perm + [lead + rank]))
+
+    def __add__(self, other):
+        return _Jet(self.value + other.value, self.der + other.der)
+
+    def __sub__(self, other):
+        return _Jet(self.value - other.value, self.der - other.der)
+
+    def scale(self, factor):
+        return _Jet(factor * self.value, factor * self.der)
+
+
+def _jet_einsum(spec, *jets):
+    """Product rule for einsum: d(prod) = sum over operands of einsum with that operand's derivative."""
+    np = _require_numpy()
+    inputs, output = spec.split("->")
+    operands = inputs.split(",")
+    value = np.einsum(spec, *(j.value for j in jets), optimize=True)
+    der = 0
+    for k in range(len(jets)):
+        terms = [op + "z" if i == k else op for i, op in enumerate(operands)]
+        args = [j.der if i == k else j.value for i, j in enumerate(jets)]
+        der = der + np.einsum(",".join(terms) + "->" + output + "z", *args, optimize=True)
+    return _Jet(value, der)
+
+
+def _components(tensor, signature):
+    if tensor is None:
+        return None
+    if isinstance(tensor, Tensor):
+        return tensor(*signature).components
+    return sp.Array(tensor)
+
+
+def _jet_expressions(space):
+    """Symbolic derivatives (no simplification) needed for second-order jets of g, phi, tau and M."""
+    dim = space.dim
+    coords = space.coords
+    g = space.metric.components
+    phi = space.phi.expr if isinstance(space.phi, Tensor) else sp.sympify(space.phi)
+    tau = _components(space.torsion, (D, D, D))
+    M = _components(space.nonmetricity, (U, D, D))
+
+    def first(values):
+        out = []
+        for v in values:
+            mask = _dependency_mask(v, coords)
+            out.extend(space._diff(v, c, mask) if v != 0 else sp.Integer(0) for c in range(dim))
+        return out
+
+    g_flat = sp.flatten(g)
+    dg = first(g_flat)
+    ddg = first(dg)
+    dphi = first([phi])
+    ddphi = first(dphi)
+    tau_flat = sp.flatten(tau) if tau is not None else [sp.Integer(0)] * dim**3
+    M_flat = sp.flatten(M) if M is not None else [sp.Integer(0)] * dim**3
+    blocks = [g_flat, dg, ddg, [phi], dphi, ddphi, tau_flat, first(tau_flat), M_flat, first(M_flat)]
+    return blocks
+
+
+def _jet_blocks(space):
+    # Cached per space until the metric, scale, torsion or non-metricity object changes.
+    sources = (space.metric, space.phi, space.torsion, space.nonmetricity)
+    cached = space.__dict__.get("_jet_cache")
+    if cached is None or any(a is not b for a, b in zip(cached[0], sources)):
+        blocks = _jet_expressions(space)
+        exprs = [e for b in blocks for e in b]
+        used = 0
+        for e in exprs:
+            used |= _dependency_mask(e, space.coords)
+        cached = (sources, exprs, [len(b) for b in blocks], used, {})
+        space._jet_cache = cached
+    return cached[1:]
+
+
+def numeric_curvature(space, point, quantities=("riemann",)):
+    """
+    Numeric metric, connection and curvature at coordinate values.
+
+    point maps coordinates (Symbols, names or indices) and any remaining
+    parameters to numbers or broadcastable arrays. Second-order jets of g and
+    phi (first-order for torsion and non-metricity) are evaluated from
+    compiled, unsimplified derivatives, then pushed through the Lyra
+    connection and curvature formulas with np.einsum. Returns {name: ndarray}
+    with the broadcast point shape leading.
+    """
+    np = _require_numpy()
+    if space.metric is None:
+        raise ValueError("Define the metric to compute Christoffel.")
+    if isinstance(quantities, str):
+        quantities = [quantities]
+    for name in quantities:
+        if name not in QUANTITIES:
+            raise ValueError(f"Unknown quantity '{name}'. Allowed: {', '.join(QUANTITIES)}.")
+    dim = space.dim
+
+    exprs, sizes, used, compiled = _jet_blocks(space)
+    free = {str(x): x for x in set().union(*(e.free_symbols for e in exprs))}
+    coord_names = {str(c) for c in space.coords}
+    coord_values = {}
+    param_values = {}
+    for key, value in point.items():
+        if isinstance(key, int) or str(key) in coord_names:
+            coord_values[space._coord_symbol(key if isinstance(key, (int, sp.Basic)) else str(key))] = value
+        else:
+            param_values[free.get(str(key), key)] = value
+    params = tuple(sorted(param_values, key=str))
+    if params not in compiled:
+        compiled[params] = _compile_vector(exprs, tuple(space.coords) + params)
+    func = compiled[params]
+
+    columns = []
+    for i, c in enumerate(space.coords):
+        if c in coord_values:
+            columns.append(np.asarray(coord_values[c], dtype=float))
+        elif used >> i & 1:
+            raise ValueError(f"Missing value for coordinate {c}.")
+        else:
+            columns.append(np.asarray(0.0))
+    columns.extend(np.asarray(param_values[p], dtype=float) for p in params)
+    shape = np.broadcast_shapes(*(c.shape for c in columns))
+    flat = func(*(np.broadcast_to(c, shape) for c in columns))
+
+    pieces = []
+    start = 0
+    for size in sizes:
+        pieces.append(flat[..., start : start + size])
+        start += size
+    n = (dim,)
+    blocks = [p.reshape(shape + n * k) for p, k in zip(pieces, (2, 3, 4, 0, 1, 2, 3, 4, 3, 4))]
+    return _lyra_curvature(blocks, space.riemann_convention_sign, quantities)
+
+
+def _lyra_curvature(blocks, sign, quantities):
+    """
+    Lyra connection and curvature from second-order jets of g and phi.
+
+    blocks are (g, dg, ddg, phi, dphi, ddphi, tau, dtau, M, dM) with the
+    point/grid shape leading and one trailing derivative axis per order,
+    e.g. dg[..., a, b, c] = d_c g_ab.
+    """
+    np = _require_numpy()
+    g, dg, ddg, phi_v, dphi, ddphi, tau, dtau, M, dM = blocks
+    dim = g.shape[-1]
+    g = _Jet(g, dg)
+    G1 = _Jet(dg, ddg)
+    P1 = _Jet(dphi, ddphi)
+    phi = _Jet(phi_v, dphi)
+    tau = _Jet(tau, dtau)
+    M = _Jet(M, dM)
+
+    gi_value = np.linalg.inv(g.value)
+    gi = _Jet(gi_value, -np.einsum("...ab,...bcz,...cd->...adz", gi_value, g.der, gi_value, optimize=True))
+    inv_phi = _Jet(1 / phi_v, -phi.der / phi_v[..., None] ** 2)
+
+    # G1[a, b, c] = d_c g_ab; lowered Christoffel [s, l, n]
+    low = (G1.transpose(0, 2, 1) + G1 - G1.transpose(2, 0, 1)).scale(0.5)
+    chris = _jet_einsum("...bs,...sln->...bln", gi, low)
+
+    delta = np.eye(dim)
+    A = chris - _jet_einsum("...,...bln->...bln", phi, M).scale(0.5)
+    trace_term = _jet_einsum("...l,...->...l", P1, inv_phi)
+    A = A + _Jet(
+        np.einsum("bn,...l->...bln", delta, trace_term.value), np.einsum("bn,...lz->...blnz", delta, trace_term.der)
+    )
+    A = A - _jet_einsum("...ln,...bs,...s,...->...bln", g, gi, P1, inv_phi)
+    torsion = tau.transpose(0, 1, 2) - tau.transpose(1, 2, 0) - tau.transpose(1, 0, 2)
+    A = A + _jet_einsum("...,...mb,...lmn->...bln", phi, gi, torsion).scale(0.5)
+
+    gamma = A.value / phi_v[..., None, None, None]
+    results = {"metric": g.value, "christoffel2": chris.value, "connection": gamma}
+    curvature = {"riemann", "ricci", "ricci_scalar", "einstein", "kretschmann"}
+    if curvature.intersection(quantities):
+        dA = A.der  # dA[l, a, n, m] = d_m A^l_an
+        quad = np.einsum("...ran,...lrm->...lamn", gamma, gamma, optimize=True)
+        riemann = sign * (
+            (np.swapaxes(dA, -1, -2) - dA) / phi_v[..., None, None, None, None] ** 2
+            + quad
+            - np.swapaxes(quad, -1, -2)
+        )
+        ricci = np.einsum("...laml->...am", riemann)
+        scalar = np.einsum("...ab,...ab->...", gi_value, ricci)
+        results["riemann"] = riemann
+        results["ricci"] = ricci
+        results["ricci_scalar"] = scalar
+        results["einstein"] = ricci - 0.5 * g.value * scalar[..., None, None]
+        if "kretschmann" in quantities:
+            down = np.einsum("...ls,...sabc->...labc", g.value, riemann)
+            up = np.einsum("...al,...bs,...ct,...du,...lstu->...abcd", gi_value, gi_value, gi_value, gi_value, down, optimize=True)
+            results["kretschmann"] = np.einsum("...abcd,...abcd->...", down, up)
+    return {name: results[name] for name in quantities}
+
+
+__all__ = ["numeric_curvature"]
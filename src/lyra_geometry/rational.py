@@ -0,0 +1,360 @@
+import itertools
+
+import sympy as sp
+from sympy.polys.matrices import DomainMatrix
+from sympy.core.function import AppliedUndef
+from sympy.polys.polyerrors import CoercionFailed
+
+ALGEBRAS = ("auto", "expr", "rational")
+
+
+_RECIPROCAL_TRIG = {
+    sp.tan: lambda x: sp.sin(x) / sp.cos(x),
+    sp.cot: lambda x: sp.cos(x) / sp.sin(x),
+    sp.sec: lambda x: 1 / sp.cos(x),
+    sp.csc: lambda x: 1 / sp.sin(x),
+}
+
+
+def _sin_cos(expr):
+    """expr with tan/cot/sec/csc rewritten and multiple angles expanded into sin and cos."""
+    if not expr.has(sp.sin, sp.cos, *_RECIPROCAL_TRIG):
+        return expr
+    expr = expr.replace(lambda e: type(e) in _RECIPROCAL_TRIG, lambda e: _RECIPROCAL_TRIG[type(e)](e.args[0]))
+    return sp.expand_trig(expr)
+
+
+def trig_angles(exprs):
+    """Symbols x appearing as sin(x)/cos(x) (after expanding multiple angles)."""
+    angles = set()
+    for expr in exprs:
+        for f in _sin_cos(sp.sympify(expr)).atoms(sp.sin, sp.cos):
+            if f.args[0].is_Symbol:
+                angles.add(f.args[0])
+    return angles
+
+
+def jet_functions(exprs):
+    """Undefined functions of symbols in exprs, with the highest derivative order present."""
+    orders = {}
+    for expr in exprs:
+        expr = sp.sympify(expr)
+        for f in expr.atoms(AppliedUndef):
+            if all(a.is_Symbol for a in f.args) and len(set(f.args)) == len(f.args):
+                orders.setdefault(f, 0)
+        for d in expr.atoms(sp.Derivative):
+            if d.expr in orders:
+                orders[d.expr] = max(orders[d.expr], d.derivative_count)
+    return orders
+
+
+def _multi_indices(size, order):
+    return [alpha for alpha in itertools.product(range(order + 1), repeat=size) if sum(alpha) <= order]
+
+
+class RationalAlgebra:
+    """
+    Fraction field QQ(coords, parameters) with coordinate derivatives.
+
+    Elements are sympy FracElements: sums, products and derivatives stay
+    reduced (numerator and denominator coprime), so no simplification pass
+    is needed. Each symbol x in angles adds generators c = cos(x) and
+    s = sin(x) with dc/dx = -s, ds/dx = c; reduce brings values to the
+    canonical form modulo c**2 + s**2 = 1 (numerator linear in each c, c-free
+    denominator). functions maps undefined functions such as a(t) to the
+    highest derivative order to represent: each derivative becomes a jet
+    generator (a_0, a_t, a_tt, ...) whose derivative is the next one.
+    convert raises ValueError for anything that is not a rational function
+    of these with exact coefficients (floats, other functions, radicals).
+    """
+
+    def __init__(self, coords, symbols=(), angles=(), functions=None):
+        self.coords = tuple(coords)
+        self.functions = dict(functions or {})
+        extra = sorted(set(symbols) - set(self.coords), key=str)
+        self.angles = tuple(sorted(angles, key=str))
+        # cos before sin, so c**2 leads c**2 + s**2 - 1 in lex order and remainders are linear in c.
+        self.trig = {x: (sp.Dummy(f"cos_{x}"), sp.Dummy(f"sin_{x}")) for x in self.angles}
+        trig_symbols = tuple(g for x in self.angles for g in self.trig[x])
+        self.jets = {}
+        for f in sorted(self.functions, key=str):
+            for alpha in _multi_indices(len(f.args), self.functions[f]):
+                suffix = "".join(str(a) * k for a, k in zip(f.args, alpha)) or "0"
+                self.jets[f, alpha] = sp.Dummy(f"{f.func}_{suffix}")
+        self.symbols = self.coords + tuple(extra) + tuple(self.jets.values()) + trig_symbols
+        self.domain = sp.QQ.frac_field(*self.symbols)
+        self.gens = self.domain.gens
+        self.zero = self.domain.zero
+        self.one = self.domain.one
+        field = self.domain.field
+        index = {s: i for i, s in enumerate(self.symbols)}
+        gen = {s: self.gens[index[s]] for s in self.symbols}
+        self._cos = [field.ring.gens[index[c]] for c, _ in self.trig.values()]
+        self._relations = [field.ring.from_expr(c**2 + s**2 - 1) for c, s in self.trig.values()]
+        # Per coordinate: (generator, its derivative) pairs for the chain rule, and jets of top order.
+        self._chain = {i: [] for i in range(len(self.coords))}
+        self._top = {i: [] for i in range(len(self.coords))}
+        for x, (c, s) in self.trig.items():
+            if x in self.coords:
+                i = self.coords.index(x)
+                self._chain[i] += [(index[s], gen[s], gen[c]), (index[c], gen[c], -gen[s])]
+        for (f, alpha), symbol in self.jets.items():
+            for j, arg in enumerate(f.args):
+                if arg not in self.coords:
+                    continue
+                i = self.coords.index(arg)
+                if sum(alpha) == self.functions[f]:
+                    self._top[i].append((index[symbol], f))
+                    continue
+                higher = alpha[:j] + (alpha[j] + 1,) + alpha[j + 1 :]
+                self._chain[i].append((index[symbol], gen[symbol], gen[self.jets[f, higher]]))
+        self._to_trig = {}
+        for x, (c, s) in self.trig.items():
+            self._to_trig[sp.cos(x)] = c
+            self._to_trig[sp.sin(x)] = s
+        self._from_symbols = {c: sp.cos(x) for x, (c, s) in self.trig.items()}
+        self._from_symbols.update({s: sp.sin(x) for x, (c, s) in self.trig.items()})
+        for (f, alpha), symbol in self.jets.items():
+            counts = [(a, k) for a, k in zip(f.args, alpha) if k]
+            self._from_symbols[symbol] = sp.Derivative(f, *counts) if counts else f
+
+    def _jet(self, derivative):
+        f = derivative.expr
+        alpha = [0] * len(f.args)
+        for var, count in derivative.variable_count:
+            alpha[f.args.index(var)] += count
+        key = (f, tuple(alpha))
+        if key not in self.jets:
+            raise ValueError(f"{derivative} exceeds the jet order of {f}.")
+        return self.jets[key]
+
+    def _to_generators(self, expr):
+        if self.jets:
+            expr = expr.replace(lambda e: isinstance(e, sp.Derivative) and e.expr in self.functions, self._jet)
+            expr = expr.xreplace({f: self.jets[f, (0,) * len(f.args)] for f in self.functions})
+        if self.trig:
+            expr = _sin_cos(expr).xreplace(self._to_trig)
+        return expr
+
+    def __repr__(self):
+        names = self.coords + tuple(s for s in self.symbols if s not in self.coords and not isinstance(s, sp.Dummy))
+        return f"RationalAlgebra(symbols={names}, angles={self.angles}, functions={tuple(self.functions)})"
+
+    def convert(self, expr):
+        expr = sp.sympify(expr)
+        if expr.has(sp.Float):
+            raise ValueError(f"{expr} has inexact coefficients.")
+        original, expr = expr, self._to_generators(expr)
+        try:
+            value = self.domain.from_sympy(expr)
+        except (CoercionFailed, ValueError):
+            names = ", ".join(str(s) for s in self.coords)
+            raise ValueError(f"{original} is not a rational function of {names}.") from None
+        return self.reduce(value)
+
+    def to_expr(self, value):
+        expr = self.domain.to_sympy(value)
+        return expr.xreplace(self._from_symbols) if self._from_symbols else expr
+
+    def reduce(self, value):
+        """Canonical representative modulo cos(x)**2 + sin(x)**2 = 1."""
+        if not self._relations or not value:
+            return value
+        numer, denom = value.numer.rem(self._relations), value.denom.rem(self._relations)
+        for c in self._cos:
+            # denom = d0 + c*d1: multiply through by the conjugate d0 - c*d1.
+            d1 = denom.diff(c)
+            if d1:
+                conjugate = denom - 2 * c * d1
+                numer = (numer * conjugate).rem(self._relations)
+                denom = (denom * conjugate).rem(self._relations)
+        return self.domain.field.new(numer, denom)
+
+    def diff(self, value, coord_index):
+        """Partial derivative along coords[coord_index] (chain rule through cos/sin and jet generators)."""
+        if not value:
+            return self.zero
+        present = {
+            i for i, (dn, dd) in enumerate(zip(value.numer.degrees(), value.denom.degrees())) if dn > 0 or dd > 0
+        }
+        for i, f in self._top[coord_index]:
+            if i in present:
+                raise ValueError(f"Derivatives of {f} beyond order {self.functions[f]} are not represented.")
+        result = value.diff(self.gens[coord_index]) if coord_index in present else self.zero
+        for i, symbol, derivative in self._chain[coord_index]:
+            if i in present:
+                result += value.diff(symbol) * derivative
+        return self.reduce(result)
+
+
+def _nonzero(algebra, components):
+    reduced = {key: algebra.reduce(value) for key, value in components.items()}
+    return {key: value for key, value in reduced.items() if value}
+
+
+class RationalGeometry:
+    """
+    Metric, Christoffel symbols, Lyra connection and curvature in a
+    RationalAlgebra. Components are sparse dicts {index: FracElement} holding
+    nonzero entries; array converts them back to sympy Arrays.
+    """
+
+    def __init__(self, algebra, metric, metric_inv=None):
+        self.algebra = algebra
+        dim = len(algebra.coords)
+        self.dim = dim
+        K = algebra
+        g = [[K.convert(metric[a, b]) for b in range(dim)] for a in range(dim)]
+        if metric_inv is None:
+            inverse = DomainMatrix(g, (dim, dim), K.domain).inv().to_list()
+        else:
+            inverse = [[K.convert(metric_inv[a, b]) for b in range(dim)] for a in range(dim)]
+        self.g = _nonzero(K, {(a, b): g[a][b] for a in range(dim) for b in range(dim)})
+        self.g_inv = _nonzero(K, {(a, b): inverse[a][b] for a in range(dim) for b in range(dim)})
+        self.detg = K.reduce(DomainMatrix(g, (dim, dim), K.domain).det())
+        dg = {}
+        for (a, b), value in self.g.items():
+            for k in range(dim):
+                d = K.diff(value, k)
+                if d:
+                    dg[a, b, k] = d
+        half = K.convert(sp.Rational(1, 2))
+        self.christoffel1 = {}
+        for a, b, c in itertools.product(range(dim), repeat=3):
+            value = K.reduce(dg.get((a, c, b), K.zero) + dg.get((a, b, c), K.zero) - dg.get((b, c, a), K.zero))
+            if value:
+                self.christoffel1[a, b, c] = half * value
+        self.christoffel2 = self._raise_first(self.christoffel1)
+        self.connection = None
+        self.riemann = None
+        self.ricci = None
+        self.einstein = None
+        self.scalar_curvature = None
+
+    def _raise_first(self, lowered):
+        total = {}
+        for (e, b, c), value in lowered.items():
+            for a in range(self.dim):
+                if (a, e) in self.g_inv:
+                    total[a, b, c] = total.get((a, b, c), self.algebra.zero) + self.g_inv[a, e] * value
+        return _nonzero(self.algebra, total)
+
+    def array(self, components, rank):
+        shape = (self.dim,) * rank
+        if rank == 0:
+            return self.algebra.to_expr(components)
+        flat = [
+            self.algebra.to_expr(components[idx]) if idx in components else sp.Integer(0)
+            for idx in itertools.product(range(self.dim), repeat=rank)
+        ]
+        return sp.ImmutableDenseNDimArray(flat, shape)
+
+    def lyra_connection(self, phi, torsion, nonmetricity):
+        """Lyra connection from phi, torsion (D, D, D) and non-metricity (U, D, D) components."""
+        K = self.algebra
+        dim = self.dim
+        phi = K.convert(phi)
+        tau = {idx: K.convert(torsion[idx]) for idx in itertools.product(range(dim), repeat=3) if torsion[idx] != 0}
+        M = {idx: K.convert(nonmetricity[idx]) for idx in itertools.product(range(dim), repeat=3) if nonmetricity[idx] != 0}
+        dphi = [K.reduce(K.diff(phi, s) / phi) for s in range(dim)]
+        half = K.convert(sp.Rational(1, 2))
+        gamma = {}
+        for b, l, n in itertools.product(range(dim), repeat=3):
+            value = self.christoffel2.get((b, l, n), K.zero) / phi
+            if (b, l, n) in M:
+                value -= half * M[b, l, n]
+            if b == n and dphi[l]:
+                value += dphi[l] / phi
+            if (l, n) in self.g:
+                value -= sum(
+                    (self.g[l, n] * self.g_inv[b, s] * dphi[s] for s in range(dim) if dphi[s] and (b, s) in self.g_inv),
+                    K.zero,
+                ) / phi
+            if tau:
+                value += half * sum(
+                    (
+                        self.g_inv[m, b] * (tau.get((l, m, n), K.zero) - tau.get((n, l, m), K.zero) - tau.get((m, l, n), K.zero))
+                        for m in range(dim)
+                        if (m, b) in self.g_inv
+                    ),
+                    K.zero,
+                )
+            value = K.reduce(value)
+            if value:
+                gamma[b, l, n] = value
+        self.connection = gamma
+        return gamma
+
+    def lyra_curvature(self, phi, riemann_sign, connection=None):
+        """Riemann (U, D, D, D), Ricci, Einstein and scalar curvature of the Lyra connection."""
+        K = self.algebra
+        dim = self.dim
+        gamma = self.connection if connection is None else connection
+        phi = K.convert(phi)
+        inv_phi2 = K.one / (phi * phi)
+        sign = K.convert(riemann_sign)
+        dA = {}
+        for (l, a, n), value in gamma.items():
+            scaled = phi * value
+            for m in range(dim):
+                d = K.diff(scaled, m)
+                if d:
+                    dA[l, a, n, m] = d
+        riemann = {}
+        for l, a, m, n in itertools.product(range(dim), repeat=4):
+            if m >= n:
+                continue
+            value = (dA.get((l, a, n, m), K.zero) - dA.get((l, a, m, n), K.zero)) * inv_phi2
+            for r in range(dim):
+                if (r, a, n) in gamma and (l, r, m) in gamma:
+                    value += gamma[r, a, n] * gamma[l, r, m]
+                if (r, a, m) in gamma and (l, r, n) in gamma:
+                    value -= gamma[r, a, m] * gamma[l, r, n]
+            value = K.reduce(value)
+            if value:
+                riemann[l, a, m, n] = sign * value
+                riemann[l, a, n, m] = -riemann[l, a, m, n]
+        ricci = {}
+        for (l, a, m, n), value in riemann.items():
+            if l == n:
+                ricci[a, m] = ricci.get((a, m), K.zero) + value
+        ricci = _nonzero(K, ricci)
+        scalar = K.reduce(sum((self.g_inv[a, b] * value for (a, b), value in ricci.items() if (a, b) in self.g_inv), K.zero))
+        half = K.convert(sp.Rational(1, 2))
+        einstein = {}
+        for a, b in itertools.product(range(dim), repeat=2):
+            value = K.reduce(ricci.get((a, b), K.zero) - half * self.g.get((a, b), K.zero) * scalar)
+            if value:
+                einstein[a, b] = value
+        self.riemann, self.ricci, self.einstein, self.scalar_curvature = riemann, ricci, einstein, scalar
+        return riemann, ricci, einstein, scalar
+
+    def kretschmann(self):
+        """R_abcd R^abcd from the stored Riemann tensor."""
+        K = self.algebra
+        dim = self.dim
+        # Only pairs c < d are kept: both factors are antisymmetric in their last two indices.
+        upper = {idx: value for idx, value in self.riemann.items() if idx[2] < idx[3]}
+        down = {}
+        for (e, b, c, d), value in upper.items():
+            for a in range(dim):
+                if (a, e) in self.g:
+                    down[a, b, c, d] = down.get((a, b, c, d), K.zero) + self.g[a, e] * value
+        up = {}
+        for (a, e, c, d), value in upper.items():
+            for b in range(dim):
+                if (b, e) in self.g_inv:
+                    up[a, b, c, d] = up.get((a, b, c, d), K.zero) + self.g_inv[b, e] * value
+        up = _nonzero(K, up)
+        raised = {}
+        for (a, b, p, q), value in up.items():
+            for c, d in itertools.combinations(range(dim), 2):
+                factor = self.g_inv.get((c, p), K.zero) * self.g_inv.get((d, q), K.zero)
+                factor -= self.g_inv.get((c, q), K.zero) * self.g_inv.get((d, p), K.zero)
+                if factor:
+                    raised[a, b, c, d] = raised.get((a, b, c, d), K.zero) + factor * value
+        raised = _nonzero(K, raised)
+        total = sum((value * raised[idx] for idx, value in _nonzero(K, down).items() if idx in raised), K.zero)
+        return K.reduce(2 * total)
+
+__all__ = ["ALGEBRAS", "RationalAlgebra", "RationalGeometry"]
@@ -0,0 +1,192 @@
+import sympy as sp
+
+from .numeric import _compile_vector, _require_numpy
+
+ESCAPED = 0
+CAPTURED = 1
+UNFINISHED = 2
+
+_WORKER_TRACER = None
+
+
+class NullGeodesicTracer:
+    """
+    Batched null-geodesic ray tracer built on geodesic_equations(parameter="null").
+
+    The sparse Christoffel table is compiled once into a vectorized
+    acceleration. Rays stop when coords[radius] drops below horizon (captured)
+    or exceeds escape (escaped); with a radius the affine step is scaled by
+    it, so far-field rays cross large distances in few steps. params
+    substitutes constants before compiling.
+    """
+
+    def __init__(self, space, params=None, radius=None, horizon=None, escape=None, time_index=0):
+        _, table = space.geodesic_equations(parameter="null", with_christoffel=True)
+        params = dict(params or {})
+        self.coords = tuple(space.coords)
+        self.dim = len(self.coords)
+        self.table = {key: value.subs(params) for key, value in table.items()}
+        self.metric = sp.Matrix(space.metric.components).subs(params)
+        self.radius = None if radius is None else self.coords.index(space._coord_symbol(radius))
+        self.horizon = horizon
+        self.escape = escape
+        self.time_index = time_index
+        self._compiled = None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_compiled"] = None
+        return state
+
+    def _compile(self):
+        if self._compiled is None:
+            keys = list(self.table)
+            accel = _compile_vector([self.table[k] for k in keys], self.coords) if keys else None
+            metric = _compile_vector(list(self.metric), self.coords)
+            self._compiled = (keys, accel, metric)
+        return self._compiled
+
+    def acceleration(self, x, v):
+        """d2x/ds2 = -Gamma^c_ab v^a v^b for arrays of shape (..., dim)."""
+        np = _require_numpy()
+        keys, accel, _ = self._compile()
+        x = np.asarray(x, dtype=float)
+        v = np.asarray(v, dtype=float)
+        out = np.zeros(np.broadcast_shapes(x.shape, v.shape))
+        if accel is None:
+            return out
+        values = accel(*(x[..., i] for i in range(self.dim)))
+        for k, (c, a, b) in enumerate(keys):
+            factor = 1.0 if a == b else 2.0
+            out[..., c] -= factor * values[..., k] * v[..., a] * v[..., b]
+        return out
+
+    def metric_at(self, x):
+        np = _require_numpy()
+        _, _, metric = self._compile()
+        x = np.asarray(x, dtype=float)
+        values = metric(*(x[..., i] for i in range(self.dim)))
+        return values.reshape(x.shape[:-1] + (self.dim, self.dim))
+
+    def tetrad(self, x_obs):
+        """
+        Orthonormal frame at x_obs by Gram-Schmidt on the coordinate basis.
+
+        Rows are e_0 (along the time coordinate) followed by the spatial legs
+        in coordinate order.
+        """
+        np = _require_numpy()
+        g = self.metric_at(np.asarray(x_obs, dtype=float))
+        order = [self.time_index] + [i for i in range(self.dim) if i != self.time_index]
+        frame = []
+        for i in order:
+            e = np.zeros(self.dim)
+            e[i] = 1.0
+            for leg, sign in frame:
+                e = e - sign * (leg @ g @ e) * leg
+            norm = e @ g @ e
+            if abs(norm) < 1e-14:
+                raise ValueError("Degenerate metric at the observer.")
+            frame.append((e / np.sqrt(abs(norm)), np.sign(norm)))
+        if frame[0][1] * frame[1][1] >= 0:
+            raise ValueError("Time coordinate is not timelike at the observer.")
+        return np.array([leg for leg, _ in frame])
+
+    def camera_rays(self, x_obs, width, height, fov):
+        """
+        Initial data for a pinhole camera at x_obs looking along -e_1.
+
+        fov is the horizontal field of view in radians; e_3 spans the image
+        horizontally and e_2 vertically. Returns (x0, v0) with shape
+        (height * width, dim); v0 is the past-directed null vector of each pixel.
+        """
+        np = _require_numpy()
+        if self.dim != 4:
+            raise ValueError("Camera requires dim=4.")
+        e = self.tetrad(x_obs)
+        half = np.tan(0.5 * fov)
+        u = np.linspace(-half, half, width)
+        w = np.linspace(-half, half, height) * (height / width if width > 1 else 1.0)
+        uu, ww = np.meshgrid(u, w[::-1])
+        directions = np.stack([-np.ones_like(uu), ww, uu], axis=-1)
+        directions /= np.linalg.norm(directions, axis=-1, keepdims=True)
+        v0 = -e[0] + directions.reshape(-1, 3) @ e[1:]
+        x0 = np.broadcast_to(np.asarray(x_obs, dtype=float), v0.shape).copy()
+        return x0, v0
+
+    def _trace_chunk(self, x, v, step, max_steps):
+        np = _require_numpy()
+        x = np.array(x, dtype=float)
+        v = np.array(v, dtype=float)
+        status = np.full(len(x), UNFINISHED, dtype=np.int8)
+        active = np.arange(len(x))
+        for _ in range(max_steps):
+            if not len(active):
+                break
+            xa, va = x[active], v[active]
+            h = step * np.abs(xa[:, self.radius])[:, None] if self.radius is not None else step
+            k1x, k1v = va, self.acceleration(xa, va)
+            k2x, k2v = va + 0.5 * h * k1v, self.acceleration(xa + 0.5 * h * k1x, va + 0.5 * h * k1v)
+            k3x, k3v = va + 0.5 * h * k2v, self.acceleration(xa + 0.5 * h * k2x, va + 0.5 * h * k2v)
+            k4x, k4v = va + h * k3v, self.acceleration(xa + h * k3x, va + h * k3v)
+            x[active] = xa + h / 6.0 * (k1x + 2 * k2x + 2 * k3x + k4x)
+            v[active] = va + h / 6.0 * (k1v + 2 * k2v + 2 * k3v + k4v)
+            if self.radius is None:
+                continue
+            r = x[active, self.radius]
+            done = np.zeros(len(active), dtype=bool)
+            if self.horizon is not None:
+                captured = (r < self.horizon) | ~np.isfinite(r)
+                status[active[captured]] = CAPTURED
+                done |= captured
+            if self.escape is not None:
+                escaped = r > self.escape
+                status[active[escaped]] = ESCAPED
+                done |= escaped
+            active = active[~done]
+        return status, x
+
+    def trace(self, x0, v0, step=0.01, max_steps=10000, chunk_size=65536, workers=None):
+        """
+        Integrate rays (RK4 in the affine parameter) until they stop.
+
+        Rays are split into chunks of chunk_size; workers > 1 spreads chunks
+        over a process pool. Returns (status, x) with status ESCAPED,
+        CAPTURED or UNFINISHED per ray and the final positions.
+        """
+        np = _require_numpy()
+        x0 = np.asarray(x0, dtype=float)
+        v0 = np.asarray(v0, dtype=float)
+        bounds = [(i, min(i + chunk_size, len(x0))) for i in range(0, len(x0), chunk_size)]
+        if workers is None or workers <= 1 or len(bounds) == 1:
+            results = [self._trace_chunk(x0[a:b], v0[a:b], step, max_steps) for a, b in bounds]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            jobs = [(x0[a:b], v0[a:b], step, max_steps) for a, b in bounds]
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(self,)) as pool:
+                results = list(pool.map(_trace_worker, jobs))
+        if not results:
+            return np.zeros(0, dtype=np.int8), np.zeros((0, self.dim))
+        return np.concatenate([s for s, _ in results]), np.concatenate([x for _, x in results])
+
+    def render(self, x_obs, width, height, fov, **trace_kwargs):
+        """
+        Trace one ray per pixel; returns (status, x) image arrays of shape
+        (height, width) and (height, width, dim).
+        """
+        x0, v0 = self.camera_rays(x_obs, width, height, fov)
+        status, x = self.trace(x0, v0, **trace_kwargs)
+        return status.reshape(height, width), x.reshape(height, width, self.dim)
+
+
+def _init_worker(tracer):
+    global _WORKER_TRACER
+    _WORKER_TRACER = tracer
+
+
+def _trace_worker(job):
+    return _WORKER_TRACER._trace_chunk(*job)
+
+
+__all__ = ["CAPTURED", "ESCAPED", "NullGeodesicTracer", "UNFINISHED"]
@@ -1,7 +1,11 @@
 import itertools
 import numbers
+import os
 import sympy as sp
 
+from .numeric import _sweep_shape, open_memmap, sweep_arrays
+from .zero_test import probably_zero
+
 
 class Index:
     def __init__(self, name):
@@ -93,15 +97,170 @@ def table(func, dim, rank):
     return sp.ImmutableDenseNDimArray(flat, shape)
 
 
+def _normalize_symmetries(symmetries, signature):
+    if not symmetries:
+        return ()
+    rank = len(signature)
+    out = []
+    for item in symmetries:
+        if not isinstance(item, (tuple, list)) or len(item) not in (2, 3):
+            raise ValueError("Symmetries must be (pos1, pos2) or (pos1, pos2, sign) tuples.")
+        pos1, pos2 = item[0], item[1]
+        sign = item[2] if len(item) == 3 else 1
+        if sign not in (1, -1):
+            raise ValueError("Symmetry sign must be +1 or -1.")
+        if not (0 <= pos1 < rank and 0 <= pos2 < rank) or pos1 == pos2:
+            raise ValueError("Symmetry positions must be distinct tensor indices.")
+        if signature[pos1] is not signature[pos2]:
+            raise ValueError("Symmetric index pairs must share the same variance.")
+        out.append((min(pos1, pos2), max(pos1, pos2), sign))
+    return tuple(sorted(set(out)))
+
+
+def _same_expr(a, b):
+    if a == b:
+        return True
+    return sp.expand(a - b) == 0
+
+
+def _detect_symmetries(components, signature):
+    rank = len(signature)
+    if rank < 2:
+        return ()
+    dim = components.shape[0]
+    found = []
+    for pos1, pos2 in itertools.combinations(range(rank), 2):
+        if signature[pos1] is not signature[pos2]:
+            continue
+        for sign in (1, -1):
+            ok = True
+            for idx in itertools.product(range(dim), repeat=rank):
+                if idx[pos1] >= idx[pos2]:
+                    continue
+                swapped = list(idx)
+                swapped[pos1], swapped[pos2] = idx[pos2], idx[pos1]
+                if not _same_expr(components[idx], sign * components[tuple(swapped)]):
+                    ok = False
+                    break
+            if ok:
+                if sign == -1:
+                    ok = all(
+                        components[idx] == 0
+                        for idx in itertools.product(range(dim), repeat=rank)
+                        if idx[pos1] == idx[pos2]
+                    )
+                if ok:
+                    found.append((pos1, pos2, sign))
+                    break
+    return tuple(found)
+
+
+def _symmetry_orbits(dim, rank, symmetries):
+    """
+    Map every index tuple to (canonical index tuple, sign) under pair symmetries.
+
+    The canonical representative is the smallest tuple of the orbit; a sign of 0
+    marks components forced to vanish by an antisymmetry.
+    """
+    orbits = {}
+    for idx in itertools.product(range(dim), repeat=rank):
+        if idx in orbits:
+            continue
+        signs = {idx: 1}
+        stack = [idx]
+        vanishes = False
+        while stack:
+            cur = stack.pop()
+            for pos1, pos2, sign in symmetries:
+                nxt = list(cur)
+                nxt[pos1], nxt[pos2] = cur[pos2], cur[pos1]
+                nxt = tuple(nxt)
+                nxt_sign = signs[cur] * sign
+                if nxt in signs:
+                    if signs[nxt] != nxt_sign:
+                        vanishes = True
+                    continue
+                signs[nxt] = nxt_sign
+                stack.append(nxt)
+        canon = min(signs)
+        for member, member_sign in signs.items():
+            if vanishes:
+                orbits[member] = (canon, 0)
+            else:
+                orbits[member] = (canon, member_sign * signs[canon])
+    return orbits
+
+
+def _dependency_mask(expr, coords):
+    """Bitmask with bit i set when expr depends on coords[i] (directly or through function arguments)."""
+    symbols = sp.sympify(expr).free_symbols
+    mask = 0
+    for i, x in enumerate(coords):
+        if x in symbols:
+            mask |= 1 << i
+    return mask
+
+
+def _combine_masks(left, right):
+    if left is None or right is None:
+        return None
+    return tuple(a | b for a, b in zip(left, right))
+
+
+def _scaled_masks(mask, factor, coords):
+    if mask is None:
+        return None
+    extra = _dependency_mask(factor, coords)
+    return tuple(m | extra for m in mask)
+
+
+def _outer_masks(left, right):
+    if left is None or right is None:
+        return None
+    return tuple(a | b for a in left for b in right)
+
+
 class Tensor:
-    def __init__(self, components, space, signature, name=None, label=None):
+    def __init__(self, components, space, signature, name=None, label=None, symmetries=None):
         self.components = sp.Array(components)
         self.rank = self.components.rank()
         self.signature = _validate_signature(signature, self.rank)
         self.space = space
         self.name = name if name is not None else space._next_tensor_name()
         self.label = label if label is not None else self.name
+        self.symmetries = _normalize_symmetries(symmetries, self.signature)
         self._cache = {self.signature: self.components}
+        self._dependency_mask = None
+
+    @property
+    def dependency_mask(self):
+        """
+        Per-component coordinate bitmasks, flattened in component order.
+
+        Bit i is set when the component may depend on space.coords[i]; a clear
+        bit means the partial derivative along that coordinate vanishes.
+        """
+        if self._dependency_mask is None:
+            coords = self.space.coords
+            if self.rank == 0:
+                self._dependency_mask = (_dependency_mask(self.components[()], coords),)
+            else:
+                self._dependency_mask = tuple(_dependency_mask(v, coords) for v in sp.flatten(self.components))
+        return self._dependency_mask
+
+    def depends_on(self, coord, *idx):
+        """True when component idx (or any component) may depend on coord."""
+        position = self.space.coords.index(self.space._coord_symbol(coord))
+        if idx:
+            flat = 0
+            for i in idx:
+                flat = flat * self.space.dim + i
+            return bool(self.dependency_mask[flat] >> position & 1)
+        return any(mask >> position & 1 for mask in self.dependency_mask)
+
+    def _with_mask(self, mask):
+        self._dependency_mask = mask
+        return self
 
     def _as_scalar(self):
         if self.rank != 0:
@@ -118,20 +277,54 @@ class Tensor:
                 target = arr.applyfunc(lambda v: sp.expand(sp.simplify(v)))
             else:
                 target = sp.expand(sp.simplify(self.components))
-            return Tensor(target, self.space, signature=self.signature, name=self.name, label=self.label)
+            return Tensor(
+                target,
+                self.space,
+                signature=self.signature,
+                name=self.name,
+                label=self.label,
+                symmetries=self.symmetries,
+            )
         if isinstance(expr, Tensor):
             return expr.fmt()
         if isinstance(expr, IndexedTensor):
             return expr.fmt()
         return sp.expand(sp.simplify(expr))
 
+    def equals(self, other, samples=4):
+        """
+        Componentwise equality tested at random points (see probably_zero).
+
+        Structurally equal components are accepted without evaluation; the
+        space's coordinate domains restrict the sample points.
+        """
+        if isinstance(other, IndexedTensor):
+            other = Tensor(other.components, other.tensor.space, signature=other.signature)
+        if not isinstance(other, Tensor):
+            return probably_zero(self._as_scalar() - sp.sympify(other), self.space.domains, samples=samples)
+        if other.space is not self.space:
+            raise ValueError("Tensors belong to different TensorSpaces.")
+        if other.signature != self.signature:
+            other = other(*self.signature)
+        return all(
+            a == b or probably_zero(a - b, self.space.domains, samples=samples)
+            for a, b in zip(sp.flatten(self.components), sp.flatten(other.components))
+        )
+
     def subs(self, *args, **kwargs):
         if isinstance(self.components, (sp.Array, sp.ImmutableDenseNDimArray)):
             flat = [v.subs(*args, **kwargs) for v in self.components]
             target = sp.ImmutableDenseNDimArray(flat, self.components.shape)
         else:
             target = self.components.subs(*args, **kwargs)
-        return Tensor(target, self.space, signature=self.signature, name=self.name, label=self.label)
+        return Tensor(
+            target,
+            self.space,
+            signature=self.signature,
+            name=self.name,
+            label=self.label,
+            symmetries=self.symmetries,
+        )
 
     @property
     def expr(self):
@@ -232,7 +425,8 @@ class Tensor:
                 result = Tensor(self.components + other_components, self.space, signature=self.signature)
                 result._labels = list(labels)
                 return result
-            return Tensor(self.components + other.components, self.space, signature=self.signature)
+            result = Tensor(self.components + other.components, self.space, signature=self.signature)
+            return result._with_mask(_combine_masks(self._dependency_mask, other._dependency_mask))
         return NotImplemented
 
     def __radd__(self, other):
@@ -273,7 +467,8 @@ class Tensor:
                 result = Tensor(self.components - other_components, self.space, signature=self.signature)
                 result._labels = list(labels)
                 return result
-            return Tensor(self.components - other.components, self.space, signature=self.signature)
+            result = Tensor(self.components - other.components, self.space, signature=self.signature)
+            return result._with_mask(_combine_masks(self._dependency_mask, other._dependency_mask))
         return NotImplemented
 
     def __rsub__(self, other):
@@ -288,7 +483,8 @@ class Tensor:
                 if other.space is not self.space:
                     raise ValueError("Tensors belong to different TensorSpaces.")
                 scaled = scalar * other.components
-                return Tensor(scaled, other.space, signature=other.signature)
+                result = Tensor(scaled, other.space, signature=other.signature)
+                return result._with_mask(_scaled_masks(other._dependency_mask, scalar, self.space.coords))
             if isinstance(other, IndexedTensor):
                 if other.tensor.space is not self.space:
                     raise ValueError("Tensors belong to different TensorSpaces.")
@@ -302,16 +498,21 @@ class Tensor:
             other, (Tensor, IndexedTensor)
         ):
             scaled = sp.sympify(other) * self.components
-            return Tensor(scaled, self.space, signature=self.signature)
+            result = Tensor(scaled, self.space, signature=self.signature)
+            return result._with_mask(_scaled_masks(self._dependency_mask, other, self.space.coords))
         if isinstance(other, Tensor):
             if other.rank == 0:
                 scaled = other._as_scalar() * self.components
-                return Tensor(scaled, self.space, signature=self.signature)
+                result = Tensor(scaled, self.space, signature=self.signature)
+                return result._with_mask(
+                    _scaled_masks(self._dependency_mask, other._as_scalar(), self.space.coords)
+                )
             if other.space is not self.space:
                 raise ValueError("Tensors belong to different TensorSpaces.")
             TP = sp.tensorproduct(self.components, other.components)
             new_sig = self.signature + other.signature
-            return Tensor(TP, self.space, signature=new_sig)
+            result = Tensor(TP, self.space, signature=new_sig)
+            return result._with_mask(_outer_masks(self._dependency_mask, other._dependency_mask))
         if isinstance(other, IndexedTensor) and hasattr(self, "_labels"):
             indexed = IndexedTensor(self, self.components, self.signature, list(self._labels))
             indexed._label_history = set(getattr(self, "_label_history", set()))
@@ -325,16 +526,21 @@ class Tensor:
             other, (Tensor, IndexedTensor)
         ):
             scaled = sp.sympify(other) * self.components
-            return Tensor(scaled, self.space, signature=self.signature)
+            result = Tensor(scaled, self.space, signature=self.signature)
+            return result._with_mask(_scaled_masks(self._dependency_mask, other, self.space.coords))
         if isinstance(other, Tensor):
             if other.rank == 0:
                 scaled = other._as_scalar() * self.components
-                return Tensor(scaled, self.space, signature=self.signature)
+                result = Tensor(scaled, self.space, signature=self.signature)
+                return result._with_mask(
+                    _scaled_masks(self._dependency_mask, other._as_scalar(), self.space.coords)
+                )
             if other.space is not self.space:
                 raise ValueError("Tensors belong to different TensorSpaces.")
             TP = sp.tensorproduct(other.components, self.components)
             new_sig = other.signature + self.signature
-            return Tensor(TP, self.space, signature=new_sig)
+            result = Tensor(TP, self.space, signature=new_sig)
+            return result._with_mask(_outer_masks(other._dependency_mask, self._dependency_mask))
         if isinstance(other, IndexedTensor) and hasattr(self, "_labels"):
             indexed = IndexedTensor(self, self.components, self.signature, list(self._labels))
             indexed._label_history = set(getattr(self, "_label_history", set()))
@@ -348,7 +554,8 @@ class Tensor:
             other, (Tensor, IndexedTensor)
         ):
             scaled = self.components / sp.sympify(other)
-            return Tensor(scaled, self.space, signature=self.signature)
+            result = Tensor(scaled, self.space, signature=self.signature)
+            return result._with_mask(_scaled_masks(self._dependency_mask, other, self.space.coords))
         return NotImplemented
 
     def __rtruediv__(self, other):
@@ -370,6 +577,25 @@ class Tensor:
     def comp(self):
         return self.components
 
+    def sweep(self, param_grid, chunk_size=65536, workers=None, out=None):
+        """
+        Evaluate all components over a grid of parameter (or coordinate) values.
+
+        param_grid maps Symbols or names to arrays that broadcast together;
+        components are compiled once. Returns an ndarray of shape
+        grid_shape + tensor shape. out (an .npy path or a preallocated array)
+        streams chunks to disk instead of holding the grid in memory.
+        """
+        known = self.space._parameter_symbols()
+        if out is None:
+            return sweep_arrays([self.components], param_grid, chunk_size=chunk_size, workers=workers, known=known)[0]
+        if isinstance(out, (str, os.PathLike)):
+            out = open_memmap(out, _sweep_shape(param_grid) + tuple(self.components.shape))
+        values = sweep_arrays(
+            [self.components], param_grid, chunk_size=chunk_size, workers=workers, out=[out], known=known
+        )
+        return values[0]
+
     def _move_front_axis_to(self, A, pos):
         rank = A.rank()
         perm = []
@@ -705,6 +931,11 @@ class IndexedTensor:
             raise ValueError("Different signatures; equality requires the same signature.")
         return self.components == other_components
 
+    def equals(self, other, samples=4):
+        """Numeric componentwise equality; see Tensor.equals."""
+        tensor = Tensor(self.components, self.tensor.space, signature=self.signature)
+        return tensor.equals(other, samples=samples)
+
     def __call__(self, *idx):
         rank = len(self.signature)
         if len(idx) > rank:
@@ -994,14 +1225,14 @@ class TensorFactory:
     def coord_index(self, names):
         return self.space.coord_index(names)
 
-    def from_function(self, func, signature, name=None, label=None):
-        return self.space.from_function(func, signature, name=name, label=label)
+    def from_function(self, func, signature, name=None, label=None, symmetries=None):
+        return self.space.from_function(func, signature, name=name, label=label, symmetries=symmetries)
 
-    def from_array(self, array, signature, name=None, label=None):
-        return self.space.from_array(array, signature, name=name, label=label)
+    def from_array(self, array, signature, name=None, label=None, symmetries=None):
+        return self.space.from_array(array, signature, name=name, label=label, symmetries=symmetries)
 
-    def generic(self, name, signature, coords=None, label=None):
-        return self.space.generic(name, signature, coords=coords, label=label)
+    def generic(self, name, signature, coords=None, label=None, symmetries=None):
+        return self.space.generic(name, signature, coords=coords, label=label, symmetries=symmetries)
 
     def zeros(self, signature, name=None, label=None):
         return self.space.zeros(signature, name=name, label=label)
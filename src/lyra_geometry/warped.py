@@ -0,0 +1,305 @@
+import itertools
+
+import sympy as sp
+
+from .core import CurvatureStrategy, LyraCurvatureStrategy, TensorSpace
+from .frames import _uses_metric_connection
+from .tensors import D, Tensor, U
+
+
+def _block(components, rows, cols):
+    return sp.Matrix([[components[r, c] for c in cols] for r in rows])
+
+
+def _warped_split(metric, coords, base_idx):
+    """Return (fiber_idx, F, g_hat) if metric = g_B + F(x_B) g_hat(x_F), else None."""
+    dim = len(coords)
+    fiber_idx = [i for i in range(dim) if i not in base_idx]
+    if not base_idx or not fiber_idx:
+        return None
+    if any(metric[b, f] != 0 for b in base_idx for f in fiber_idx):
+        return None
+    base_syms = {coords[i] for i in base_idx}
+    fiber_syms = [coords[i] for i in fiber_idx]
+    if any(metric[a, b].free_symbols & set(fiber_syms) for a in base_idx for b in base_idx):
+        return None
+    fiber_block = _block(metric, fiber_idx, fiber_idx)
+    pivot = next((v for v in fiber_block if v != 0), None)
+    if pivot is None:
+        return None
+    warp_part, _ = sp.factor(pivot).as_independent(*fiber_syms, as_Add=False)
+    _, F = warp_part.as_coeff_Mul()
+    g_hat = fiber_block.applyfunc(lambda v: sp.factor(sp.cancel(v / F)))
+    if any(v.free_symbols & base_syms for v in g_hat):
+        return None
+    return fiber_idx, F, g_hat
+
+
+def detect_warped_product(space, base_coords=None):
+    """
+    Find a warped-product split g = g_B + f(x_B)**2 g_F of the space metric.
+
+    Returns (base_coords, fiber_coords, f**2) or None. When base_coords is not
+    given, the split with the smallest base (largest fiber) is returned.
+    """
+    if space.metric is None:
+        return None
+    metric = space.metric.components
+    coords = space.coords
+    if base_coords is not None:
+        base_idx = [space.coords.index(space._coord_symbol(c)) for c in base_coords]
+        candidates = [sorted(base_idx)]
+    else:
+        candidates = (
+            list(base_idx)
+            for size in range(1, space.dim)
+            for base_idx in itertools.combinations(range(space.dim), size)
+        )
+    for base_idx in candidates:
+        split = _warped_split(metric, coords, base_idx)
+        if split is not None:
+            fiber_idx, F, _ = split
+            return tuple(coords[i] for i in base_idx), tuple(coords[i] for i in fiber_idx), F
+    return None
+
+
+def _warped_geometry(dim, base_idx, fiber_idx, base, fiber, F, riemann_sign, simplify=sp.simplify):
+    """
+    O'Neill curvature of g_B + F g_F assembled sparsely from block results.
+
+    base and fiber are TensorSpaces holding g_B and g_F; F = f**2 depends on the
+    base coordinates only. Returns full (christoffel2, riemann, ricci, einstein,
+    scalar) arrays in the ordering given by base_idx/fiber_idx; simplify is
+    the full space's TensorSpace._simplify.
+    """
+    p, q = len(base_idx), len(fiber_idx)
+    xb = base.coords
+    gB, gB_inv = base.metric.components, base.metric_inv
+    gF, gF_inv = fiber.metric.components, fiber.metric_inv
+    chrisB, chrisF = base.christoffel2, fiber.christoffel2
+
+    dF = [sp.diff(F, x) for x in xb]
+    dF_up = [sum(gB_inv[a, c] * dF[c] for c in range(p)) for a in range(p)]
+    grad_sq = simplify(sum(dF[a] * dF_up[a] for a in range(p)) / (4 * F))
+    # L_ab = (Hess f)_ab / f written through F = f**2
+    L = [[
+        simplify(
+            (sp.diff(F, xb[a], xb[b]) - sum(chrisB[c, a, b] * dF[c] for c in range(p))) / (2 * F)
+            - dF[a] * dF[b] / (4 * F**2)
+        )
+        for b in range(p)] for a in range(p)]
+    L_up = [[sum(gB_inv[a, c] * L[c][b] for c in range(p)) for b in range(p)] for a in range(p)]
+
+    chris = sp.MutableDenseNDimArray.zeros(dim, dim, dim)
+    for a, b, c in itertools.product(range(p), repeat=3):
+        chris[base_idx[a], base_idx[b], base_idx[c]] = chrisB[a, b, c]
+    for i, j, k in itertools.product(range(q), repeat=3):
+        chris[fiber_idx[i], fiber_idx[j], fiber_idx[k]] = chrisF[i, j, k]
+    for a in range(p):
+        for i, j in itertools.product(range(q), repeat=2):
+            if gF[i, j] != 0 and dF_up[a] != 0:
+                chris[base_idx[a], fiber_idx[i], fiber_idx[j]] = -dF_up[a] * gF[i, j] / 2
+        if dF[a] != 0:
+            for i in range(q):
+                value = dF[a] / (2 * F)
+                chris[fiber_idx[i], base_idx[a], fiber_idx[i]] = value
+                chris[fiber_idx[i], fiber_idx[i], base_idx[a]] = value
+
+    # Block Riemann components already carry the sign convention; the O'Neill
+    # terms are added separately so only they need contracting and simplifying.
+    RB = base.riemann.as_signature((U, D, D, D))
+    RF = fiber.riemann.as_signature((U, D, D, D))
+    riem = sp.MutableDenseNDimArray.zeros(dim, dim, dim, dim)
+    for key in itertools.product(range(p), repeat=4):
+        riem[tuple(base_idx[k] for k in key)] = RB[key]
+    for key in itertools.product(range(q), repeat=4):
+        riem[tuple(fiber_idx[k] for k in key)] = RF[key]
+
+    extra = {}
+
+    def add(key, value):
+        if value != 0:
+            extra[key] = extra.get(key, 0) + riemann_sign * value
+
+    for a, b in itertools.product(range(p), repeat=2):
+        A, B = base_idx[a], base_idx[b]
+        for i, j in itertools.product(range(q), repeat=2):
+            I, J = fiber_idx[i], fiber_idx[j]
+            if gF[i, j] != 0 and L_up[a][b] != 0:
+                add((A, I, B, J), -F * gF[i, j] * L_up[a][b])
+                add((A, I, J, B), F * gF[i, j] * L_up[a][b])
+            if i == j and L[a][b] != 0:
+                add((I, A, J, B), -L[a][b])
+                add((I, A, B, J), L[a][b])
+    if grad_sq != 0:
+        for i, j, k, l in itertools.product(range(q), repeat=4):
+            value = sp.KroneckerDelta(i, k) * gF[j, l] - sp.KroneckerDelta(i, l) * gF[j, k]
+            if value != 0:
+                add(tuple(fiber_idx[n] for n in (i, j, k, l)), -grad_sq * value)
+    for key, value in extra.items():
+        riem[key] += value
+
+    ricci_extra = {}
+    for (l, a, m, n), value in extra.items():
+        if l == n:
+            ricci_extra[a, m] = ricci_extra.get((a, m), 0) + value
+    ricci_extra = {key: simplify(value) for key, value in ricci_extra.items()}
+
+    g_inv = {}
+    for a, b in itertools.product(range(p), repeat=2):
+        g_inv[base_idx[a], base_idx[b]] = gB_inv[a, b]
+    for i, j in itertools.product(range(q), repeat=2):
+        g_inv[fiber_idx[i], fiber_idx[j]] = gF_inv[i, j] / F
+    scalar_R = simplify(
+        base.scalar_curvature.components[()]
+        + fiber.scalar_curvature.components[()] / F
+        + sum(g_inv[key] * value for key, value in ricci_extra.items())
+    )
+
+    ricci = sp.MutableDenseNDimArray.zeros(dim, dim)
+    einstein = sp.MutableDenseNDimArray.zeros(dim, dim)
+    blocks = (
+        (base_idx, base.ricci.components, gB, 1),
+        (fiber_idx, fiber.ricci.components, gF, F),
+    )
+    for idx, block_ricci, block_metric, factor in blocks:
+        for a, b in itertools.product(range(len(idx)), repeat=2):
+            A, B = idx[a], idx[b]
+            value = block_ricci[a, b] + ricci_extra.get((A, B), 0)
+            ricci[A, B] = value
+            einstein[A, B] = simplify(value - sp.Rational(1, 2) * factor * block_metric[a, b] * scalar_R)
+    return sp.Array(chris), sp.Array(riem), sp.Array(ricci), sp.Array(einstein), scalar_R
+
+
+def _block_spaces(space, base_idx, fiber_idx, g_hat):
+    # The blocks inherit the conventions that steer simplification, like _derived_space.
+    metric = space.metric.components
+    inherited = dict(
+        riemann_convention=space.riemann_convention,
+        algebra=space.algebra,
+        domains=space.domains,
+        zero_test=space.zero_test,
+    )
+    base = TensorSpace([space.coords[i] for i in base_idx], metric=_block(metric, base_idx, base_idx), **inherited)
+    fiber = TensorSpace([space.coords[i] for i in fiber_idx], metric=g_hat, **inherited)
+    return base, fiber
+
+
+def _has_plain_connection(space):
+    phi = space.phi.expr if isinstance(space.phi, Tensor) else space.phi
+    M = space.nonmetricity.components if isinstance(space.nonmetricity, Tensor) else sp.Array(space.nonmetricity)
+    tau = space.torsion.components if isinstance(space.torsion, Tensor) else sp.Array(space.torsion)
+    return (
+        all(sp.diff(phi, x) == 0 for x in space.coords)
+        and all(v == 0 for v in sp.flatten(M))
+        and all(v == 0 for v in sp.flatten(tau))
+    )
+
+
+class WarpedCurvatureStrategy(CurvatureStrategy):
+    """
+    Curvature of warped products g = g_B + f(x_B)**2 g_F via O'Neill's formulas.
+
+    The split is detected from the metric (or fixed by base_coords); base and
+    fiber curvature are computed in their own lower-dimensional spaces and the
+    full components are assembled sparsely. Spaces with a non-constant scale
+    field, torsion or non-metricity, a connection other than the metric one
+    (e.g. FixedConnectionStrategy), or without a warped split, fall back to
+    LyraCurvatureStrategy.
+    """
+
+    def __init__(self, base_coords=None):
+        self.base_coords = base_coords
+
+    def build(self, space, gamma_components):
+        if space.metric is None:
+            return None, None, None, None
+        if not _has_plain_connection(space) or not _uses_metric_connection(space):
+            return LyraCurvatureStrategy().build(space, gamma_components)
+        split = detect_warped_product(space, base_coords=self.base_coords)
+        if split is None:
+            if self.base_coords is not None:
+                raise ValueError("Metric is not a warped product over the given base coordinates.")
+            return LyraCurvatureStrategy().build(space, gamma_components)
+
+        base_coords, _, _ = split
+        base_idx = [space.coords.index(x) for x in base_coords]
+        fiber_idx, F, g_hat = _warped_split(space.metric.components, space.coords, base_idx)
+        base, fiber = _block_spaces(space, base_idx, fiber_idx, g_hat)
+        _, riem, ricc, ein, scalar_R = _warped_geometry(
+            space.dim, base_idx, fiber_idx, base, fiber, F, space.riemann_convention_sign, space._simplify
+        )
+        phi = space.phi.expr if isinstance(space.phi, Tensor) else space.phi
+        if phi != 1:
+            riem, ricc, ein, scalar_R = riem / phi**2, ricc / phi**2, ein / phi**2, scalar_R / phi**2
+        return (
+            space.from_array(riem, (U, D, D, D), name="Riemann", label="R"),
+            space.from_array(ricc, (D, D), name="Ricci", label="Ric"),
+            space.from_array(ein, (D, D), name="Einstein", label="G"),
+            space.scalar(scalar_R, name="R", label="R"),
+        )
+
+
+def warped_product(base, fiber, warp):
+    """
+    Space with metric g_B + warp**2 g_F assembled from cached base/fiber results.
+
+    warp must depend on the base coordinates only. Christoffel symbols and
+    curvature come from O'Neill's formulas, so nothing is recomputed in the
+    full dimension.
+    """
+    if base.metric is None or fiber.metric is None:
+        raise ValueError("Base and fiber need a metric.")
+    if set(base.coords) & set(fiber.coords):
+        raise ValueError("Base and fiber coordinates must be distinct.")
+    if base.riemann_convention != fiber.riemann_convention:
+        raise ValueError("Base and fiber must share the Riemann convention.")
+    if base.algebra != fiber.algebra or base.zero_test != fiber.zero_test:
+        raise ValueError("Base and fiber must share the algebra and zero_test.")
+    if not (_has_plain_connection(base) and _has_plain_connection(fiber)):
+        raise ValueError("warped_product() needs Levi-Civita base and fiber spaces.")
+    for block in (base, fiber):
+        phi = block.phi.expr if isinstance(block.phi, Tensor) else block.phi
+        if phi != 1:
+            raise ValueError("warped_product() needs base and fiber spaces without a scale field.")
+        if block.riemann is None:
+            block.update(include=("riemann", "ricci", "einstein"))
+    warp = warp.expr if isinstance(warp, Tensor) else sp.sympify(warp)
+    if warp.free_symbols & set(fiber.coords):
+        raise ValueError("The warp function must depend on base coordinates only.")
+
+    F = warp**2
+    p, q = base.dim, fiber.dim
+    dim = p + q
+    base_idx, fiber_idx = list(range(p)), list(range(p, dim))
+    space = TensorSpace(
+        base.coords + fiber.coords,
+        curvature_strategy=WarpedCurvatureStrategy(base_coords=base.coords),
+        riemann_convention=base.riemann_convention,
+        algebra=base.algebra,
+        domains={**fiber.domains.spec, **base.domains.spec},
+        zero_test=base.zero_test,
+    )
+    chris, riem, ricc, ein, scalar_R = _warped_geometry(
+        dim, base_idx, fiber_idx, base, fiber, space.domains.apply(F), base.riemann_convention_sign, space._simplify
+    )
+
+    metric = sp.zeros(dim, dim)
+    metric_inv = sp.zeros(dim, dim)
+    metric[:p, :p] = sp.Matrix(base.metric.components.tolist())
+    metric_inv[:p, :p] = sp.Matrix(base.metric_inv.tolist())
+    metric[p:, p:] = F * sp.Matrix(fiber.metric.components.tolist())
+    metric_inv[p:, p:] = sp.Matrix(fiber.metric_inv.tolist()) / F
+    detg = base.detg * fiber.detg * F**q if base.detg is not None and fiber.detg is not None else None
+
+    return space._adopt_geometry(
+        metric,
+        metric_inv,
+        detg,
+        chris,
+        connection=chris,
+        curvature=(riem, ricc, ein, scalar_R),
+    )
+
+
+__all__ = ["WarpedCurvatureStrategy", "detect_warped_product", "warped_product"]
@@ -0,0 +1,132 @@
+import random
+
+import mpmath
+import sympy as sp
+from sympy.core.function import AppliedUndef
+
+ZERO_TESTS = ("numeric", "off", "verified")
+
+
+def _sample(rng, symbol, domains):
+    # Rationals of order one, away from the bounds, inside the declared domain.
+    u = sp.Rational(rng.randint(1, 10**6), 10**6 + 1)
+    domain = domains.spec.get(symbol.name) if domains is not None else None
+    if isinstance(domain, (tuple, list)):
+        lower, upper = (sp.sympify(b) if b is not None else None for b in domain)
+        if lower is not None and lower.is_finite is not False and upper is not None and upper.is_finite is not False:
+            return lower + (upper - lower) * (u + 1) / 3
+        if lower is not None and lower.is_finite is not False:
+            return lower + sp.Rational(1, 2) + 2 * u
+        if upper is not None and upper.is_finite is not False:
+            return upper - sp.Rational(1, 2) - 2 * u
+    if domains is not None:
+        symbol = domains.symbols.get(symbol.name, symbol)
+    magnitude = sp.Rational(1, 2) + 2 * u
+    if symbol.is_nonnegative:
+        return magnitude
+    if symbol.is_nonpositive:
+        return -magnitude
+    return magnitude if rng.random() < 0.5 else -magnitude
+
+
+def sample_points(expr, domains=None, samples=4, seed=0):
+    """
+    Random rational points for the free symbols of expr (respecting domains).
+
+    Undefined functions and their derivatives are replaced by independent
+    Dummy symbols first, since jet values at a point are unconstrained.
+    Returns (expr with functions replaced, list of {symbol: value}).
+    """
+    jets = {a: sp.Dummy() for a in expr.atoms(sp.Derivative)}
+    expr = expr.xreplace(jets)
+    functions = {a: sp.Dummy(str(a.func)) for a in expr.atoms(AppliedUndef)}
+    expr = expr.xreplace(functions)
+    rng = random.Random(seed)
+    symbols = sorted(expr.free_symbols, key=str)
+    points = [{s: _sample(rng, s, domains) for s in symbols} for _ in range(samples)]
+    return expr, points
+
+
+_MPMATH = {"Abs": mpmath.fabs}
+
+
+def _to_sympy(value):
+    if isinstance(value, mpmath.mpc):
+        return sp.Float(value.real) + sp.I * sp.Float(value.imag)
+    return sp.Float(value)
+
+
+def _evaluate(node, point, cache, digits):
+    # Memoized on the expression DAG: curvature components share large subtrees.
+    value = cache.get(node)
+    if value is not None:
+        return value
+    args = node.args
+    if node.is_Symbol:
+        value = point[node]
+    elif node.is_Rational:
+        value = mpmath.mpf(node.p) / node.q
+    elif node.is_Add:
+        value = mpmath.fsum(_evaluate(a, point, cache, digits) for a in args)
+    elif node.is_Mul:
+        value = mpmath.fprod(_evaluate(a, point, cache, digits) for a in args)
+    elif node.is_Pow:
+        value = mpmath.power(_evaluate(args[0], point, cache, digits), _evaluate(args[1], point, cache, digits))
+    elif node.is_number:
+        real, imag = node.evalf(digits).as_real_imag()
+        value = mpmath.mpc(str(real), str(imag)) if imag else mpmath.mpf(str(real))
+    else:
+        name = node.func.__name__
+        function = _MPMATH.get(name) or getattr(mpmath, name, None)
+        values = [_evaluate(a, point, cache, digits) for a in args]
+        if function is not None:
+            value = function(*values)
+        else:
+            value = _evaluate(node.func(*map(_to_sympy, values)).evalf(digits), point, {}, digits)
+    cache[node] = value
+    return value
+
+
+def _value_at(expr, point, digits):
+    with mpmath.workdps(digits):
+        point = {s: _evaluate(v, {}, {}, digits) for s, v in point.items()}
+        return _evaluate(expr, point, {}, digits)
+
+
+def probably_zero(expr, domains=None, samples=4, digits=50, seed=0):
+    """
+    True when expr vanishes numerically at every random point.
+
+    Each point is evaluated with digits and with 2 * digits significant
+    digits. A nonzero value keeps its leading digits / 10 digits when the
+    precision doubles, whatever its magnitude, while the rounding residue
+    of a zero shrinks with the precision; so tiny constants such as
+    x / 10**30 are not mistaken for zero. Points where expr is singular are
+    skipped; False (no claim) is returned if none is usable. A nonzero
+    expression can still pass if it vanishes at all random points, or if
+    its terms cancel to within 0.9 * digits significant digits.
+    """
+    expr = sp.sympify(expr)
+    if expr == 0:
+        return True
+    if expr.is_Number:
+        return False
+    expr, points = sample_points(expr, domains, samples, seed)
+    tolerance = mpmath.mpf(10) ** (-(digits // 10))
+    usable = 0
+    for point in points:
+        try:
+            low = _value_at(expr, point, digits)
+            high = _value_at(expr, point, 2 * digits)
+        except (ZeroDivisionError, ValueError, TypeError):
+            continue
+        if any(mpmath.isnan(v) or mpmath.isinf(v) for v in (low, high)):
+            continue
+        with mpmath.workdps(2 * digits):
+            if high != 0 and abs(high - low) <= tolerance * abs(high):
+                return False
+        usable += 1
+    return usable > 0
+
+
+__all__ = ["ZERO_TESTS", "probably_zero", "sample_points"]
@@ -4,6 +4,11 @@ import pytest
 from lyra_geometry import TensorSpace
 
 
+def assert_same(left, right):
+    pairs = zip(sp.flatten(left), sp.flatten(right))
+    assert all(sp.simplify(a - b) == 0 for a, b in pairs)
+
+
 @pytest.fixture
 def coords():
     return sp.symbols("x y")
@@ -0,0 +1,71 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import TensorSpace
+
+np = pytest.importorskip("numpy")
+
+
+def _numeric(array, subs):
+    return np.array(sp.Array(array).subs(subs).applyfunc(float).tolist(), dtype=float)
+
+
+def test_matches_symbolic_lyra_geometry_with_scale_torsion_and_nonmetricity():
+    t, x, y = sp.symbols("t x y")
+    space = TensorSpace((t, x, y), metric=sp.diag(-1, 1, x**2 + 1))
+    torsion = sp.MutableDenseNDimArray.zeros(3, 3, 3)
+    torsion[0, 1, 2] = x * y
+    torsion[0, 2, 1] = -x * y
+    nonmetricity = sp.MutableDenseNDimArray.zeros(3, 3, 3)
+    nonmetricity[1, 1, 2] = y
+    space.set_torsion(torsion)
+    space.set_nonmetricity(nonmetricity)
+    space.set_scale(sp.exp(x))
+    space.update()
+    point = {t: 0.1, x: 0.5, y: 0.3}
+    out = space.at_point(point, ["connection", "riemann", "ricci", "ricci_scalar", "einstein"])
+    assert np.allclose(out["connection"], _numeric(space.gamma.components, point))
+    assert np.allclose(out["riemann"], _numeric(space.riemann.components, point))
+    assert np.allclose(out["ricci"], _numeric(space.ricci.components, point))
+    assert np.allclose(out["einstein"], _numeric(space.einstein.components, point))
+    assert np.isclose(out["ricci_scalar"], float(space.scalar_curvature.expr.subs(point)))
+
+
+def test_sphere_scalar_curvature_is_vectorized():
+    th, ph = sp.symbols("theta phi")
+    space = TensorSpace((th, ph), metric=sp.diag(1, sp.sin(th) ** 2))
+    out = space.at_point({"theta": np.linspace(0.3, 2.5, 7)}, "ricci_scalar")
+    assert np.allclose(out["ricci_scalar"], float(space.scalar_curvature.expr))
+
+
+def test_kerr_kretschmann_without_symbolic_curvature():
+    t, r, th, ph, M, a = sp.symbols("t r theta phi M a", positive=True)
+    sigma = r**2 + a**2 * sp.cos(th) ** 2
+    delta = r**2 - 2 * M * r + a**2
+    g_tp = -2 * M * a * r * sp.sin(th) ** 2 / sigma
+    metric = sp.Matrix(
+        [
+            [-(1 - 2 * M * r / sigma), 0, 0, g_tp],
+            [0, sigma / delta, 0, 0],
+            [0, 0, sigma, 0],
+            [g_tp, 0, 0, (r**2 + a**2 + 2 * M * a**2 * r * sp.sin(th) ** 2 / sigma) * sp.sin(th) ** 2],
+        ]
+    )
+    space = TensorSpace((t, r, th, ph))
+    space.set_metric(metric)
+    radii = np.linspace(3.0, 12.0, 5)
+    out = space.at_point({r: radii, th: 1.0, "M": 1.0, "a": 0.9}, ["kretschmann", "ricci"])
+    c = np.cos(1.0)
+    s2 = radii**2 + 0.81 * c**2
+    expected = 48 * (radii**6 - 15 * radii**4 * 0.81 * c**2 + 15 * radii**2 * 0.81**2 * c**4 - 0.81**3 * c**6) / s2**6
+    assert np.allclose(out["kretschmann"], expected)
+    assert np.allclose(out["ricci"], 0.0)
+
+
+def test_missing_coordinate_raises():
+    r, th = sp.symbols("r theta", positive=True)
+    space = TensorSpace((r, th), metric=sp.diag(1, r**2))
+    with pytest.raises(ValueError, match="r"):
+        space.at_point({th: 0.1})
+    with pytest.raises(ValueError, match="Unknown quantity"):
+        space.at_point({r: 1.0}, "torsion")
@@ -1,6 +1,6 @@
 import sympy as sp
 
-from lyra_geometry import TensorSpace, autoparallel_equations
+from lyra_geometry import D, TensorSpace, autoparallel_equations
 
 
 def test_autoparallel_equations_minkowski_timelike():
@@ -28,3 +28,18 @@ def test_autoparallel_equations_minkowski_null_lambda():
     for eq, func in zip(equations, coord_funcs):
         assert eq.lhs == sp.diff(func, lam, 2)
         assert eq.rhs == 0
+
+
+def test_autoparallel_equations_compute_a_missing_connection():
+    t, x = sp.symbols("t x")
+    space = TensorSpace(coords=(t, x))
+    space.set_metric(sp.diag(-1, 1))
+    torsion = [[[0, 0], [0, 0]], [[0, 0], [0, 0]]]
+    torsion[0][0][1], torsion[0][1][0] = x, -x
+    space.set_torsion(space.from_array(torsion, (D, D, D)))
+    assert space.gamma.components is None
+    equations = space.autoparallel_equations()
+    assert space.gamma.components is not None
+    tau = sp.Symbol("tau")
+    xf = sp.Function("x")(tau)
+    assert equations[1].lhs.has(sp.diff(xf, tau, 2))
@@ -0,0 +1,112 @@
+import itertools
+
+import pytest
+import sympy as sp
+
+from conftest import assert_same
+from lyra_geometry import (
+    CartanConnectionStrategy,
+    CartanCurvatureStrategy,
+    FixedConnectionStrategy,
+    TensorSpace,
+    cartan_connection_forms,
+)
+
+
+def _pair(coords, metric, scale=None, **kwargs):
+    spaces = []
+    for strategy in (None, CartanCurvatureStrategy(**kwargs)):
+        space = TensorSpace(coords, metric=metric, curvature_strategy=strategy)
+        if scale is not None:
+            space.set_scale(scale)
+            space.update()
+        spaces.append(space)
+    return spaces
+
+
+def test_cartan_matches_lyra_on_sphere():
+    th, ph = sp.symbols("theta phi")
+    lyra, cartan = _pair((th, ph), sp.diag(1, sp.sin(th) ** 2))
+    assert_same(lyra.riemann.components, cartan.riemann.components)
+    assert_same(lyra.ricci.components, cartan.ricci.components)
+    assert sp.simplify(cartan.scalar_curvature.components[()] - lyra.scalar_curvature.components[()]) == 0
+
+
+def test_cartan_matches_lyra_with_scale_field():
+    x, y = sp.symbols("x y")
+    scale = sp.Function("phi")(x, y)
+    lyra, cartan = _pair((x, y), sp.diag(1, sp.exp(2 * x)), scale=scale)
+    assert_same(lyra.riemann.components, cartan.riemann.components)
+    assert_same(lyra.einstein.components, cartan.einstein.components)
+
+
+def test_cartan_connection_matches_lyra_connection():
+    x, y = sp.symbols("x y")
+    metric = sp.diag(-1, x**2)
+    lyra = TensorSpace((x, y), metric=metric)
+    lyra.set_scale(sp.Function("phi")(x))
+    lyra.update()
+    cartan = TensorSpace((x, y), metric=metric, connection_strategy=CartanConnectionStrategy())
+    cartan.set_scale(sp.Function("phi")(x))
+    cartan.update()
+    assert_same(lyra.gamma.components, cartan.gamma.components)
+
+
+def test_cartan_curvature_uses_fixed_connection():
+    r, ph = sp.symbols("r phi")
+    space = TensorSpace(
+        (r, ph),
+        metric=sp.diag(1, sp.sin(r) ** 2),
+        connection_strategy=FixedConnectionStrategy(sp.MutableDenseNDimArray.zeros(2, 2, 2)),
+        curvature_strategy=CartanCurvatureStrategy(),
+    )
+    assert all(v == 0 for v in sp.flatten(space.riemann.components))
+    assert space.scalar_curvature.components[()] == 0
+
+
+def test_cartan_curvature_is_simplified_through_the_space():
+    t, r, th, ph = sp.symbols("t r theta phi")
+    M = sp.Symbol("M")
+    f = 1 - 2 * M / r
+    space = TensorSpace(
+        (t, r, th, ph),
+        metric=sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2),
+        curvature_strategy=CartanCurvatureStrategy(),
+    )
+    powers = set().union(*(v.atoms(sp.Pow) for v in sp.flatten(space.riemann.components)))
+    assert all(p.exp.is_integer for p in powers)
+    assert space.scalar_curvature.components[()] == 0
+
+
+def test_explicit_coframe_for_non_diagonal_metric():
+    x, y = sp.symbols("x y")
+    coframe = sp.Matrix([[1, 0], [x, 1]])
+    metric = coframe.T * coframe
+    lyra, cartan = _pair((x, y), metric, coframe=coframe)
+    assert_same(lyra.riemann.components, cartan.riemann.components)
+
+
+def test_non_diagonal_metric_requires_coframe():
+    x, y = sp.symbols("x y")
+    space = TensorSpace((x, y), metric=sp.Matrix([[1, x], [x, 2]]), curvature_strategy=None)
+    with pytest.raises(ValueError, match="coframe"):
+        cartan_connection_forms(space)
+
+
+def test_connection_forms_are_antisymmetric_in_orthonormal_frame():
+    th, ph = sp.symbols("theta phi")
+    space = TensorSpace((th, ph), metric=sp.diag(1, sp.sin(th) ** 2))
+    _, _, eta, omega = cartan_connection_forms(space)
+    assert eta == [1, 1]
+    for a, b, mu in itertools.product(range(2), repeat=3):
+        assert sp.simplify(omega[a][b][mu] + omega[b][a][mu]) == 0
+
+
+@pytest.mark.slow
+def test_cartan_matches_lyra_on_flrw_with_scale():
+    t, x, y, z = sp.symbols("t x y z")
+    a = sp.Function("a")(t)
+    metric = sp.diag(-1, a**2, a**2, a**2)
+    lyra, cartan = _pair((t, x, y, z), metric, scale=sp.Function("phi")(t))
+    assert_same(lyra.riemann.components, cartan.riemann.components)
+    assert_same(lyra.einstein.components, cartan.einstein.components)
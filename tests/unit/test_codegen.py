@@ -0,0 +1,58 @@
+import os
+import pickle
+import shutil
+
+import pytest
+import sympy as sp
+
+from lyra_geometry import TensorSpace, compile_kernel
+
+np = pytest.importorskip("numpy")
+
+needs_cc = pytest.mark.skipif(shutil.which(os.environ.get("CC", "cc")) is None, reason="no C compiler")
+
+
+@pytest.fixture
+def schwarzschild():
+    t, r, th, ph, M = sp.symbols("t r theta phi M", positive=True)
+    f = 1 - 2 * M / r
+    space = TensorSpace((t, r, th, ph), metric=sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2))
+    return space, (r, th, M)
+
+
+@needs_cc
+def test_c_kernel_matches_sweep_and_is_cached(schwarzschild, tmp_path):
+    space, (r, th, M) = schwarzschild
+    kernel = space.codegen(["kretschmann", "riemann"], cache_dir=tmp_path)
+    assert not kernel.from_cache and kernel.path.endswith(".so")
+    grid = {"r": np.linspace(3.0, 20.0, 30)[:, None], "theta": np.linspace(0.3, 2.8, 7)[None, :], "M": 1.0}
+    out = kernel(grid)
+    ref = space.sweep(["kretschmann", "riemann"], grid)
+    assert out["riemann"].shape == (30, 7, 4, 4, 4, 4)
+    assert np.allclose(out["kretschmann"], ref["kretschmann"])
+    assert np.allclose(out["riemann"], ref["riemann"])
+    assert np.allclose(kernel(grid, threads=3)["riemann"], ref["riemann"])
+    again = space.codegen(["kretschmann", "riemann"], cache_dir=tmp_path)
+    assert again.from_cache and again.path == kernel.path
+    restored = pickle.loads(pickle.dumps(again))
+    assert np.allclose(restored(grid)["kretschmann"], ref["kretschmann"])
+
+
+@needs_cc
+def test_geodesic_rhs_matches_numpy_backend(schwarzschild, tmp_path):
+    space, (r, th, M) = schwarzschild
+    kernel = space.codegen("geodesic", params={"M": 1.0}, cache_dir=tmp_path)
+    reference = space.codegen("geodesic", params={M: 1.0}, backend="numpy")
+    assert kernel.symbols[4:] == sp.symbols("v_t v_r v_theta v_phi")
+    rng = np.random.default_rng(1)
+    point = {"t": 0.0, "r": rng.uniform(3, 10, 50), "theta": rng.uniform(0.5, 2.5, 50), "phi": 0.0}
+    point.update({f"v_{c}": rng.normal(size=50) for c in ("t", "r", "theta", "phi")})
+    assert np.allclose(kernel(point)["geodesic"], reference(point)["geodesic"])
+
+
+def test_validation():
+    x = sp.Symbol("x")
+    with pytest.raises(ValueError, match="Unknown backend"):
+        compile_kernel([x], (x,), backend="fortran")
+    with pytest.raises(ValueError, match="Missing value for x"):
+        compile_kernel([x**2], (x,), backend="numpy")({})
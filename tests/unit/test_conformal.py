@@ -0,0 +1,75 @@
+import pytest
+import sympy as sp
+
+from conftest import assert_same
+from lyra_geometry import CurvatureStrategy, LyraCurvatureStrategy, TensorSpace
+
+
+def _assert_matches_direct(conformal, direct):
+    assert_same(conformal.christoffel2.components, direct.christoffel2.components)
+    assert_same(conformal.gamma.components, direct.gamma.components)
+    assert_same(conformal.riemann.components, direct.riemann.components)
+    assert_same(conformal.ricci.components, direct.ricci.components)
+    assert_same(conformal.einstein.components, direct.einstein.components)
+    scalar = conformal.scalar_curvature.components[()] - direct.scalar_curvature.components[()]
+    assert sp.simplify(scalar) == 0
+    assert sp.simplify(conformal.detg - direct.detg) == 0
+
+
+def test_conformally_flat_plane_matches_direct_computation():
+    x, y = sp.symbols("x y")
+    omega = sp.exp(sp.Function("f")(x, y))
+    flat = TensorSpace((x, y), metric=sp.diag(1, 1))
+    direct = TensorSpace((x, y), metric=sp.diag(omega**2, omega**2))
+    _assert_matches_direct(flat.conformal(omega), direct)
+
+
+def test_conformal_rescaling_keeps_scale_field():
+    x, y = sp.symbols("x y")
+    omega = sp.Function("W")(x)
+    phi = sp.Function("phi")(x)
+    base = TensorSpace((x, y), metric=sp.diag(1, sp.exp(2 * x)))
+    base.set_scale(phi)
+    base.update()
+    direct = TensorSpace((x, y), metric=sp.diag(omega**2, omega**2 * sp.exp(2 * x)))
+    direct.set_scale(phi)
+    direct.update()
+    rescaled = base.conformal(omega)
+    assert rescaled.phi.expr == phi
+    _assert_matches_direct(rescaled, direct)
+
+
+def test_conformal_does_not_rerun_curvature_strategy():
+    calls = []
+
+    class CountingStrategy(CurvatureStrategy):
+        def build(self, space, gamma_components):
+            calls.append(space.metric)
+            return LyraCurvatureStrategy().build(space, gamma_components)
+
+    x, y = sp.symbols("x y")
+    base = TensorSpace((x, y), metric=sp.diag(1, 1), curvature_strategy=CountingStrategy())
+    calls.clear()
+    rescaled = base.conformal(sp.exp(x))
+    assert all(metric is None for metric in calls)
+    assert rescaled.curvature_strategy is base.curvature_strategy
+
+
+def test_conformal_requires_torsion_free_space():
+    x, y = sp.symbols("x y")
+    space = TensorSpace((x, y), metric=sp.diag(1, 1))
+    torsion = sp.MutableDenseNDimArray.zeros(2, 2, 2)
+    torsion[0, 0, 1] = x
+    torsion[0, 1, 0] = -x
+    space.set_torsion(torsion)
+    with pytest.raises(ValueError, match="torsion"):
+        space.conformal(sp.exp(x))
+
+
+@pytest.mark.slow
+def test_de_sitter_from_minkowski_in_conformal_time():
+    eta, x, y, z, H = sp.symbols("eta x y z H", positive=True)
+    minkowski = TensorSpace((eta, x, y, z), metric=sp.diag(-1, 1, 1, 1))
+    de_sitter = minkowski.conformal(1 / (H * eta))
+    direct = TensorSpace((eta, x, y, z), metric=sp.diag(-1, 1, 1, 1) / (H * eta) ** 2)
+    _assert_matches_direct(de_sitter, direct)
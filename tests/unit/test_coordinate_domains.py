@@ -0,0 +1,74 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import D, Domains, SpaceTime, TensorSpace, U
+
+t, r, th, ph, M = sp.symbols("t r theta phi M")
+DOMAINS = {t: "real", "r": "positive", th: (0, sp.pi), "phi": "real", "M": "positive"}
+
+
+def test_declared_symbols_carry_assumptions():
+    space = TensorSpace((th, ph), metric=sp.diag(r**2, r**2 * sp.sin(th) ** 2), domains=DOMAINS)
+    theta, radius = space.coords[0], space.domains.symbols["r"]
+    assert theta.is_positive and radius.is_positive
+    assert space._coord_symbol(th) is theta
+    assert space.detg.free_symbols == {theta, radius}
+    # sqrt(detg) needs sin(theta) > 0, which only the interval provides.
+    assert space.euler_density().expr == -2 * sp.sin(theta)
+    plain = TensorSpace((th, ph), metric=sp.diag(r**2, r**2 * sp.sin(th) ** 2))
+    assert plain.euler_density().expr.has(sp.sqrt(r**4 * sp.sin(th) ** 2))
+
+
+def test_branch_dependent_powers_collapse():
+    R = sp.sqrt(r**2)
+    f = 1 - 2 * M / R
+    metric = sp.diag(-f, 1 / f, R**2, R**2 * sp.sin(th) ** 2)
+    space = SpaceTime((t, r, th, ph), metric=metric, domains=DOMAINS)
+    radius, mass = space.domains.symbols["r"], space.domains.symbols["M"]
+    assert space.metric.components[1, 1] == 1 / (1 - 2 * mass / radius)
+    assert space.kretschmann_scalar().expr == 48 * mass**2 / radius**6
+    space.set_scale(1 + M * r)
+    assert space.scale.expr == 1 + mass * radius
+    assert space.conformal(2).domains.symbols == space.domains.symbols
+
+
+def test_unknown_domains_are_rejected():
+    assert not Domains() and Domains(DOMAINS).facts is not None
+    with pytest.raises(ValueError, match="Unknown domain 'odd'"):
+        Domains({"r": "odd"})
+    with pytest.raises(ValueError, match="Empty interval"):
+        Domains({"r": (1, 0)})
+
+
+def test_user_tensors_use_the_declared_symbols():
+    space = TensorSpace((r, th), metric=sp.diag(1, r**2), domains={"r": "positive"})
+    radius = space.coords[0]
+    V = space.from_array([r, 0], (U,))
+    assert V.components[0] is radius
+    # d_r r = 1 and Gamma^theta_{theta r} r / r = 1: nothing is lost to a stray plain r.
+    assert space.nabla(V).components == sp.Array([[1, 0], [0, 1]])
+    assert space.nabla(space.scalar(r**2)).components == sp.Array([2 * radius, 0])
+    assert space.nabla(r**2).components == sp.Array([2 * radius, 0])
+    assert space.generic("f", (), coords=(r,)).expr == sp.Function("f")(radius)
+    assert space.tensor.from_function(lambda i: r**i, (D,)).components == sp.Array([1, radius])
+
+
+def test_field_equations_accept_plain_symbols():
+    G, w = sp.symbols("G w")
+    a, rho, p = (sp.Function(name)(t) for name in ("a", "rho", "p"))
+    metric = sp.diag(-1, a**2, a**2 * r**2, a**2 * r**2 * sp.sin(th) ** 2)
+    space = TensorSpace((t, r, th, ph), metric=metric, domains={"t": "positive", "r": "positive"})
+    T = sp.diag(rho, a**2 * p, a**2 * r**2 * p, a**2 * r**2 * sp.sin(th) ** 2 * p)
+    conservation = sp.diff(rho, t) + 3 * sp.diff(a, t) / a * (rho + p)
+    fe = space.field_equations(
+        T, unknowns=[a, rho], variable=t, coupling=8 * sp.pi * G, extra=[conservation], params={p: w * rho}
+    )
+    a_, a_t, rho_ = fe.state
+    assert sp.simplify(list(fe.highest.values())[1] + 3 * a_t * rho_ * (1 + w) / a_) == 0
+
+
+def test_covariant_derivatives_simplify_under_the_domains():
+    space = TensorSpace((th, ph), metric=sp.diag(1, sp.sin(th) ** 2), domains={"theta": (0, sp.pi)})
+    gradient = space.nabla(sp.sqrt(sp.sin(th) ** 2)).components[0]
+    assert not gradient.has(sp.Abs, sp.Piecewise)
+    assert sp.simplify(gradient - sp.cos(space.coords[0])) == 0
@@ -0,0 +1,63 @@
+import sympy as sp
+
+from lyra_geometry import D, TensorSpace
+
+
+def _space():
+    t, r, th, ph = sp.symbols("t r theta phi")
+    f = sp.Function("f")(r)
+    metric = sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2)
+    return TensorSpace((t, r, th, ph), metric=metric), (t, r, th, ph)
+
+
+def test_metric_mask_tracks_coordinates_and_function_arguments():
+    space, (t, r, th, ph) = _space()
+    masks = space.metric.dependency_mask
+    assert masks[0] == 0b0010
+    assert masks[15] == 0b0110
+    assert masks[1] == 0
+    assert space.metric.depends_on(th, 3, 3)
+    assert not space.metric.depends_on(t)
+    assert not space.metric.depends_on("phi")
+
+
+def test_masks_propagate_through_arithmetic():
+    space, (t, r, th, ph) = _space()
+    A = space.from_array([t, 0, 0, 0], (D,))
+    B = space.from_array([0, r, 0, 0], (D,))
+    assert A.dependency_mask == (0b0001, 0, 0, 0)
+    assert B.dependency_mask == (0, 0b0010, 0, 0)
+    total = A + B
+    assert total.dependency_mask == (0b0001, 0b0010, 0, 0)
+    product = A * B
+    assert product.dependency_mask[1] == 0b0011
+    assert product.depends_on(t, 0, 1) and product.depends_on(r, 0, 1)
+    assert not product.depends_on(th)
+    scaled = sp.sin(th) * A
+    assert scaled.dependency_mask[0] == 0b0101
+    assert scaled.depends_on("theta", 0) and not scaled.depends_on(r)
+    # Propagated masks are conservative: a cancelled component keeps its bits.
+    assert (A + (-1) * A).depends_on(t, 0)
+
+
+def test_ignorable_coordinates_are_never_differentiated(monkeypatch):
+    space, (t, r, th, ph) = _space()
+    seen = []
+    original = sp.diff
+
+    def recording_diff(expr, *symbols, **kwargs):
+        seen.extend(symbols)
+        return original(expr, *symbols, **kwargs)
+
+    monkeypatch.setattr(sp, "diff", recording_diff)
+    space.update()
+    assert t not in seen
+    assert ph not in seen
+
+
+def test_diff_hook_uses_mask():
+    space, (t, r, th, ph) = _space()
+    expr = sp.Function("f")(r) * sp.sin(th)
+    assert space._diff(expr, 0) == 0
+    assert space._diff(expr, 1) == sp.diff(expr, r)
+    assert space._diff(expr, 1, mask=0) == 0
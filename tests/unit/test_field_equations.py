@@ -0,0 +1,74 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import D, TensorSpace, U, reduce_field_equations
+
+t, r, th, ph = sp.symbols("t r theta phi", real=True)
+k, G, Lam, w = sp.symbols("k G Lambda w")
+a = sp.Function("a")(t)
+rho = sp.Function("rho")(t)
+p = sp.Function("p")(t)
+
+
+def _flrw(**kwargs):
+    metric = sp.diag(-1, a**2 / (1 - k * r**2), a**2 * r**2, a**2 * r**2 * sp.sin(th) ** 2)
+    return TensorSpace((t, r, th, ph), metric=metric, **kwargs)
+
+
+def _perfect_fluid(space):
+    u = space.from_array([1, 0, 0, 0], signature=(U,))(D).components
+    g = space.metric.components
+    return sp.Array([[(rho + p) * u[i] * u[j] + p * g[i, j] for j in range(4)] for i in range(4)])
+
+
+def test_friedmann_system_with_conservation_law():
+    # landau-lifshitz gives G_00 = 3 (a'^2 + k) / a^2 for signature (-, +, +, +)
+    space = _flrw(riemann_convention="landau-lifshitz")
+    conservation = sp.diff(rho, t) + 3 * sp.diff(a, t) / a * (rho + p)
+    fe = space.field_equations(
+        _perfect_fluid(space),
+        unknowns=[a, rho],
+        variable=t,
+        coupling=8 * sp.pi * G,
+        cosmological_constant=Lam,
+        extra=[conservation],
+        params={p: w * rho},
+    )
+    a_, a_t, rho_ = fe.state
+    assert (a_, a_t, rho_) == sp.symbols("a a_t rho")
+    expected = (Lam * a_**2 - 8 * sp.pi * G * w * rho_ * a_**2 - a_t**2 - k) / (2 * a_)
+    assert sp.simplify(fe.highest[sp.Derivative(a, (t, 2))] - expected) == 0
+    assert len(fe.constraints) == 1
+    friedmann = 3 * a_t**2 + 3 * k - 8 * sp.pi * G * rho_ * a_**2 - Lam * a_**2
+    assert sp.cancel(fe.constraints[0] / friedmann).is_number
+
+
+def test_matter_era_evolution_keeps_constraint():
+    np = pytest.importorskip("numpy")
+    space = _flrw(riemann_convention="landau-lifshitz")
+    conservation = sp.diff(rho, t) + 3 * sp.diff(a, t) / a * rho
+    fe = space.field_equations(_perfect_fluid(space), [a, rho], t, extra=[conservation], params={p: 0})
+    params = {"k": 0.0}
+    x, h = 1.0, 1e-3
+    y = np.array([1.0, 2.0 / 3.0, 1.0 / (6 * np.pi)])  # a = t**(2/3), 8 pi rho = 3 H**2
+    assert np.allclose(fe.constraint_values(x, y, params), 0.0)
+    for _ in range(1000):
+        k1 = fe.rhs(x, y, params)
+        k2 = fe.rhs(x + h / 2, y + h / 2 * k1, params)
+        k3 = fe.rhs(x + h / 2, y + h / 2 * k2, params)
+        k4 = fe.rhs(x + h, y + h * k3, params)
+        y, x = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4), x + h
+    assert np.isclose(y[0], 2.0 ** (2.0 / 3.0))
+    assert np.allclose(fe.constraint_values(x, y, params), 0.0, atol=1e-9)
+    batch = fe.rhs(x, np.stack([y, 2 * y]), params)
+    assert batch.shape == (2, 3)
+
+
+def test_underdetermined_and_unreduced_systems():
+    b = sp.Function("b")(t)
+    scale = (a * b) ** 2
+    space = TensorSpace((t, r, th, ph), metric=sp.diag(-1, scale, scale * r**2, scale * r**2 * sp.sin(th) ** 2))
+    with pytest.raises(ValueError, match="do not determine a_tt, b_tt"):
+        space.field_equations(None, [a, b], t)
+    with pytest.raises(ValueError, match="depends on r"):
+        reduce_field_equations([sp.diff(a, t) + r * a**2], [a], t, coords=(t, r))
@@ -0,0 +1,64 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import TensorSpace
+
+
+def test_polar_reduction_to_central_force():
+    r, th = sp.symbols("r theta", positive=True)
+    space = TensorSpace((r, th), metric=sp.diag(1, r**2))
+    result = space.first_integrals(parameter="tau")
+    tau, p = sp.Symbol("tau"), sp.Symbol("p_theta")
+    r_f = sp.Function("r")(tau)
+    assert result.cyclic == (th,)
+    assert result.constants == (p,)
+    expected = sp.diff(r_f, tau) ** 2 + p**2 / r_f**2
+    assert sp.simplify(result.constraint.lhs - expected) == 0
+    assert result.constraint.rhs == sp.Symbol("epsilon")
+    # Central force as a first-order system: r' from the normalization, theta' from p_theta.
+    assert result.eliminated == r
+    assert result.state == (r_f, sp.Function("theta")(tau))
+    radial, angular = result.equations
+    assert radial.lhs == sp.diff(r_f, tau)
+    eps = sp.Symbol("epsilon")
+    assert sp.simplify(radial.rhs.subs(result.branch, 1) ** 2 - (eps - p**2 / r_f**2)) == 0
+    assert sp.simplify(angular.rhs - p / r_f**2) == 0
+
+
+def test_schwarzschild_energy_and_angular_momentum():
+    t, r, th, ph, M = sp.symbols("t r theta phi M")
+    f = 1 - 2 * M / r
+    space = TensorSpace((t, r, th, ph), metric=sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2))
+    result = space.first_integrals(parameter="null")
+    lam = sp.Symbol("lambda")
+    t_f, r_f, th_f, ph_f = [sp.Function(str(c))(lam) for c in (t, r, th, ph)]
+    p_t, p_phi = result.constants
+    assert result.cyclic == (t, ph)
+    assert result.constraint.rhs == 0
+    assert sp.simplify(result.velocities[sp.diff(ph_f, lam)] - p_phi / (r_f**2 * sp.sin(th_f) ** 2)) == 0
+    assert sp.simplify(result.conserved[p_t] + f.subs(r, r_f) * sp.diff(t_f, lam)) == 0
+
+    # Eight first-order equations shrink to five: t, r, theta, phi and v_theta.
+    v_th = sp.Function("v_theta")(lam)
+    assert result.eliminated == r
+    assert result.state == (t_f, r_f, th_f, ph_f, v_th)
+    assert [eq.lhs for eq in result.equations] == [sp.diff(s, lam) for s in result.state]
+    radial = result.equations[1].rhs
+    on_shell = {sp.diff(r_f, lam): radial, sp.diff(th_f, lam): v_th}
+    constraint = result.constraint.lhs.xreplace(on_shell).subs(result.branch, 1)
+    assert sp.simplify(constraint) == 0
+    full = space.geodesic_equations(parameter="null")
+    accel = sp.diff(th_f, lam, 2)
+    substituted = (accel - full[2].lhs).xreplace(result.velocities).xreplace(on_shell)
+    assert sp.simplify(result.equations[4].rhs - substituted) == 0
+    assert space.first_integrals(parameter="null", eliminate="theta").eliminated == th
+
+
+def test_requires_cyclic_coordinate():
+    x, y = sp.symbols("x y")
+    space = TensorSpace((x, y), metric=sp.diag(1, x**2 + y**2))
+    with pytest.raises(ValueError, match="cyclic"):
+        space.first_integrals()
+    polar = TensorSpace((x, y), metric=sp.diag(1, x**2))
+    with pytest.raises(ValueError, match="Cannot eliminate"):
+        polar.first_integrals(eliminate=y)
@@ -0,0 +1,70 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import GridSpace, TensorSpace
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def lyra_sphere():
+    th, ph = sp.symbols("theta phi")
+    space = TensorSpace((th, ph), metric=sp.diag(1, sp.sin(th) ** 2))
+    space.set_scale(sp.exp(th / 3))
+    return space, th, ph
+
+
+def test_grid_matches_at_point_on_lyra_formulas(lyra_sphere):
+    space, th, ph = lyra_sphere
+    thetas = np.linspace(0.4, 2.6, 81)
+    grid = space.on_grid({th: thetas}, order=6)
+    assert grid.shape == (81,)
+    out = grid.compute(["connection", "riemann", "ricci_scalar"])
+    ref = space.at_point({th: thetas}, ["connection", "riemann", "ricci_scalar"])
+    for name in ref:
+        assert np.allclose(out[name], ref[name], atol=1e-6)
+
+
+def test_error_drops_with_order_and_chunks_match_single_pass():
+    x, y = sp.symbols("x y")
+    space = TensorSpace((x, y), metric=sp.diag(1 + x**2 * y, sp.exp(x * y)))
+    xs = np.linspace(0.0, 1.0, 41)
+    ys = np.linspace(0.5, 1.5, 33)
+    X, Y = np.meshgrid(xs, ys, indexing="ij")
+    ref = space.at_point({x: X, y: Y}, "ricci_scalar")["ricci_scalar"]
+    errors = [
+        np.abs(space.on_grid({x: xs, y: ys}, order=order).compute("ricci_scalar")["ricci_scalar"] - ref).max()
+        for order in (2, 4)
+    ]
+    assert errors[1] < errors[0] / 10
+    grid = space.on_grid({x: xs, y: ys})
+    full = grid.compute("riemann")["riemann"]
+    assert np.allclose(grid.compute("riemann", chunk_size=6)["riemann"], full, rtol=0, atol=1e-12)
+
+
+def test_chunks_match_single_pass_at_the_edges():
+    x, y = sp.symbols("x y")
+    space = TensorSpace((x, y), metric=sp.diag(1 + x**2 * y, sp.exp(x * y)))
+    xs = np.linspace(0.0, 1.0, 41)
+    ys = np.linspace(0.5, 1.5, 9)
+    for order in (2, 4):
+        grid = space.on_grid({x: xs, y: ys}, order=order)
+        full = grid.compute("riemann")["riemann"]
+        # chunk_size=40 leaves a one-point last slab, evaluated entirely by the one-sided edge stencil.
+        for chunk_size in (1, 5, 40):
+            chunked = grid.compute("riemann", chunk_size=chunk_size)["riemann"]
+            assert np.allclose(chunked, full, rtol=0, atol=1e-12)
+
+
+def test_direct_arrays_and_validation():
+    xs = np.linspace(0.0, 1.0, 11)
+    flat = GridSpace([xs, None], np.eye(2))
+    assert np.allclose(flat.compute("riemann")["riemann"], 0.0)
+    with pytest.raises(ValueError, match="uniformly spaced"):
+        GridSpace([xs**2, None], np.eye(2))
+    with pytest.raises(ValueError, match="even"):
+        GridSpace([xs, None], np.eye(2), order=3)
+    th = sp.Symbol("theta")
+    space = TensorSpace((th, sp.Symbol("phi")), metric=sp.diag(1, sp.sin(th) ** 2))
+    with pytest.raises(ValueError, match="Missing grid for coordinate theta"):
+        space.on_grid({"phi": xs})
@@ -0,0 +1,51 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import TensorSpace, leapfrog, yoshida4
+
+np = pytest.importorskip("numpy")
+
+
+def _polar():
+    r, th = sp.symbols("r theta", positive=True)
+    return TensorSpace((r, th), metric=sp.diag(1, r**2)), (r, th)
+
+
+def test_hamiltonian_expression_includes_scale():
+    space, (r, th) = _polar()
+    space.set_scale(r)
+    H = space.hamiltonian()
+    p_r, p_th = H.momenta
+    assert sp.simplify(H.expr - (p_r**2 + p_th**2 / r**2) / (2 * r**2)) == 0
+
+
+@pytest.mark.parametrize("method, tol", [(leapfrog, 1e-4), (yoshida4, 1e-9)])
+def test_polar_flow_follows_straight_lines(method, tol):
+    space, _ = _polar()
+    H = space.hamiltonian()
+    x0 = np.array([[1.0, 0.0], [2.0, 0.0]])
+    p0 = np.array([[0.0, 1.0], [0.0, 4.0]])
+    x, p = method(H, x0, p0, 0.01, 100)
+    expected = np.array([[np.sqrt(2.0), np.pi / 4], [2 * np.sqrt(2.0), np.pi / 4]])
+    assert np.allclose(x, expected, atol=tol)
+
+
+def test_schwarzschild_energy_is_conserved_over_many_orbits():
+    t, r, th, ph, M = sp.symbols("t r theta phi M")
+    f = 1 - 2 * M / r
+    space = TensorSpace((t, r, th, ph), metric=sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2))
+    H = space.hamiltonian(params={M: 1})
+    x0 = np.array([[0.0, 12.0, np.pi / 2, 0.0], [0.0, 15.0, np.pi / 2, 0.0]])
+    p0 = np.array([[-0.97, 0.0, 0.0, 4.2], [-0.975, 0.0, 0.0, 4.5]])
+    xs, ps = leapfrog(H, x0, p0, 1.0, 2000, save_every=100)
+    assert xs.shape == (20, 2, 4)
+    drift = np.abs(H.energy(xs, ps) - H.energy(x0, p0))
+    assert drift.max() < 1e-6
+
+
+def test_unresolved_symbols_raise():
+    t, r, M = sp.symbols("t r M")
+    space = TensorSpace((t, r), metric=sp.diag(-(1 - 2 * M / r), 1 / (1 - 2 * M / r)))
+    H = space.hamiltonian()
+    with pytest.raises(ValueError, match="M"):
+        H.energy([0.0, 10.0], [-1.0, 0.0])
@@ -55,3 +55,10 @@ def test_indexed_array_init_without_metric():
     st = TensorSpace(coords=(x, y))
     assert isinstance(st.delta, IndexedArray)
     assert isinstance(st.levi_civita, IndexedArray)
+
+
+def test_levi_civita_is_registered_on_lookup(space_flat):
+    epsilon = space_flat.get("levi_civita")
+    assert isinstance(epsilon, IndexedArray)
+    assert epsilon is space_flat.levi_civita
+    assert space_flat.get("levi_civita") is epsilon
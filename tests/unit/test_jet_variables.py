@@ -0,0 +1,46 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import TensorSpace
+from lyra_geometry.rational import RationalAlgebra, jet_functions
+
+t, r, th, ph, k, x, y = sp.symbols("t r theta phi k x y")
+a = sp.Function("a")(t)
+f = sp.Function("f")(x, y)
+
+
+def _same(p, q):
+    return all(sp.cancel(u - v) == 0 for u, v in zip(sp.flatten(p), sp.flatten(q)))
+
+
+def test_friedmann_workflow_with_scale_field():
+    metric = sp.diag(-1, a**2 / (1 - k * r**2), a**2 * r**2, a**2 * r**2 * sp.sin(th) ** 2)
+    spaces = []
+    for algebra in ("rational", "expr"):
+        space = TensorSpace((t, r, th, ph), metric=metric, algebra=algebra)
+        space.set_scale(sp.Function("phi")(t))
+        space.update()
+        spaces.append(space)
+    fast, reference = spaces
+    assert fast._rational is not None
+    assert _same(fast.gamma.components, reference.gamma.components)
+    assert _same(fast.einstein.components, reference.einstein.components)
+    assert fast.scalar_curvature.expr.has(sp.Derivative(a, (t, 2)))
+
+
+def test_mixed_partial_jets_of_functions_of_several_coordinates():
+    metric = sp.diag(f, x * f)
+    fast = TensorSpace((x, y), metric=metric, algebra="rational")
+    reference = TensorSpace((x, y), metric=metric)
+    assert sp.cancel(fast.ricci_scalar().expr - reference.ricci_scalar().expr) == 0
+
+    algebra = RationalAlgebra((x, y), functions={f: 2})
+    value = algebra.convert(sp.diff(f, x) * f)
+    mixed = algebra.to_expr(algebra.diff(value, 1))
+    assert sp.expand(mixed - sp.diff(sp.diff(f, x) * f, y)) == 0
+    with pytest.raises(ValueError, match="beyond order 2"):
+        algebra.diff(algebra.convert(sp.diff(f, x, y)), 0)
+
+
+def test_jet_orders_follow_the_inputs():
+    assert jet_functions([a * sp.diff(a, t, 3), sp.Function("b")(r**2)]) == {a: 3}
@@ -0,0 +1,65 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import TensorSpace, connection_geodesics, geodesic_equations, lagrangian_christoffel
+
+
+def _assert_table_matches(table, christoffel, dim):
+    for c in range(dim):
+        for a in range(dim):
+            for b in range(dim):
+                expected = christoffel[c, a, b]
+                actual = table.get((c, min(a, b), max(a, b)), 0)
+                assert sp.simplify(actual - expected) == 0
+
+
+def test_polar_table_is_sparse():
+    r, th = sp.symbols("r theta", positive=True)
+    table = lagrangian_christoffel(sp.diag(1, r**2), (r, th))
+    assert table == {(0, 1, 1): -r, (1, 0, 1): 1 / r}
+
+
+@pytest.mark.parametrize("dim", [3, 5])
+def test_table_matches_christoffel2_in_any_dimension(dim):
+    coords = sp.symbols(f"x0:{dim}")
+    f = sp.Function("f")(coords[1])
+    metric = sp.diag(-f, *[coords[1] ** 2 + k for k in range(1, dim)])
+    space = TensorSpace(coords, metric=metric)
+    equations, table = space.geodesic_equations(with_christoffel=True)
+    assert len(equations) == dim
+    _assert_table_matches(table, space.christoffel2.components, dim)
+
+
+def test_quick_constructor_works_in_2d():
+    r, th = sp.symbols("r theta", positive=True)
+    tau = sp.Symbol("tau")
+    equations = geodesic_equations(sp.diag(1, r**2), (r, th), parameter="tau")
+    r_f, th_f = sp.Function("r")(tau), sp.Function("theta")(tau)
+    expected = sp.diff(th_f, tau, 2) + 2 * sp.diff(r_f, tau) * sp.diff(th_f, tau) / r_f
+    assert sp.simplify(equations[1].lhs - expected) == 0
+
+
+def test_scale_field_matches_autoparallel_form():
+    x, y = sp.symbols("x y")
+    space = TensorSpace((x, y), metric=sp.diag(1, x**2))
+    space.set_scale(sp.Function("phi")(x))
+    space.update()
+    _, table = space.autoparallel_equations(with_christoffel=True)
+    phi = space.phi.expr
+    _, expected = connection_geodesics(space.gamma.components, (x, y), sp.Symbol("tau"), phi=phi)
+    assert set(table) == set(expected)
+    assert all(sp.simplify(table[key] - expected[key]) == 0 for key in table)
+
+
+def test_torsion_uses_connection():
+    t, x, y = sp.symbols("t x y")
+    space = TensorSpace((t, x, y), metric=sp.diag(-1, 1, 1))
+    torsion = sp.MutableDenseNDimArray.zeros(3, 3, 3)
+    torsion[0, 1, 2] = x
+    torsion[0, 2, 1] = -x
+    space.set_torsion(torsion)
+    space.update()
+    _, table = space.autoparallel_equations(with_christoffel=True)
+    gamma = space.gamma.components
+    for (c, a, b), value in table.items():
+        assert sp.simplify(value - (gamma[c, a, b] + gamma[c, b, a]) / 2) == 0
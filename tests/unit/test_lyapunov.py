@@ -0,0 +1,55 @@
+import pickle
+
+import pytest
+import sympy as sp
+
+from lyra_geometry import TensorSpace, lyapunov_spectrum
+
+np = pytest.importorskip("numpy")
+
+r, th = sp.symbols("r theta", real=True)
+
+
+def test_jacobian_matches_finite_differences():
+    t, x, M = sp.symbols("t r M", positive=True)
+    f = 1 - 2 * M / x
+    space = TensorSpace((t, x), metric=sp.diag(-f, 1 / f))
+    space.set_scale(1 + x / 10)
+    system = space.variational_equations("autoparallel", params={"M": 1.0})
+    rng = np.random.default_rng(3)
+    y = np.column_stack([np.zeros(5), rng.uniform(3, 8, 5), rng.normal(size=(5, 2))])
+    jac = system.jacobian_at(y)
+    assert jac.shape == (5, 4, 4)
+    h = 1e-6
+    for j in range(4):
+        dy = np.zeros(4)
+        dy[j] = h
+        column = (system.rhs(y + dy) - system.rhs(y - dy)) / (2 * h)
+        assert np.allclose(jac[..., j], column, atol=1e-6)
+    restored = pickle.loads(pickle.dumps(system))
+    assert np.allclose(restored.rhs(y), system.rhs(y))
+
+
+def test_spectrum_of_hyperbolic_closed_geodesic():
+    # r = 0 is a geodesic of curvature -1: Jacobi fields grow like exp(+-s).
+    system = TensorSpace((r, th), metric=sp.diag(1, sp.cosh(r) ** 2)).variational_equations()
+    y0 = np.array([[0.0, 0.0, 0.0, 1.0], [0.0, 2.0, 0.0, 1.0]])
+    exponents, y = lyapunov_spectrum(system, y0, step=0.01, n_steps=3000, transient=1000)
+    assert exponents.shape == (2, 4)
+    assert np.allclose(exponents[:, 0], 1.0, atol=1e-3)
+    assert np.allclose(exponents[:, -1], -1.0, atol=1e-3)
+    assert np.all(np.abs(exponents[:, 1:3]) < 0.1)
+    assert np.allclose(y[:, 1], [30.0, 32.0])
+
+
+def test_flat_space_and_validation():
+    system = TensorSpace((r, th), metric=sp.diag(1, 1)).variational_equations()
+    exponents, _ = lyapunov_spectrum(system, [0.0, 0.0, 1.0, 1.0], step=0.1, n_steps=200)
+    # Shear grows linearly, so the exponents only decay like log(s)/s.
+    assert np.all(np.abs(exponents) < 0.2) and np.isclose(exponents.sum(), 0.0)
+    with pytest.raises(ValueError, match="n_vectors"):
+        lyapunov_spectrum(system, [0.0, 0.0, 1.0, 1.0], step=0.1, n_steps=10, n_vectors=5)
+    with pytest.raises(ValueError, match="trailing axis of size 4"):
+        system.rhs([0.0, 1.0])
+    with pytest.raises(ValueError, match="kind must be"):
+        TensorSpace((r, th), metric=sp.diag(1, 1)).variational_equations("hamiltonian")
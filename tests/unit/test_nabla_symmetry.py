@@ -0,0 +1,73 @@
+import pytest
+import sympy as sp
+
+from conftest import assert_same
+from lyra_geometry import D, TensorSpace
+
+
+@pytest.fixture
+def polar_space():
+    r, th = sp.symbols("r theta", positive=True)
+    return TensorSpace((r, th), metric=sp.diag(1, r**2)), (r, th)
+
+
+def test_generic_symmetric_tensor_shares_components(polar_space):
+    space, _ = polar_space
+    S = space.generic("S", (D, D), symmetries=[(0, 1)])
+    assert S.components[0, 1] == S.components[1, 0]
+    A = space.generic("A", (D, D), symmetries=[(0, 1, -1)])
+    assert A.components[0, 0] == 0
+    assert A.components[0, 1] == -A.components[1, 0]
+
+
+def test_nabla_of_symmetric_tensor_matches_full_computation(polar_space):
+    space, _ = polar_space
+    S = space.generic("S", (D, D), symmetries=[(0, 1)])
+    fast = space.nabla(S)
+    full = space.nabla(S, use_symmetry=False)
+    assert fast.symmetries == ((1, 2, 1),)
+    assert_same(fast.components, full.components)
+
+
+def test_nabla_detects_metric_symmetry_and_skips_simplify(polar_space, monkeypatch):
+    space, _ = polar_space
+    calls = []
+    original = sp.simplify
+
+    def counting_simplify(expr, *args, **kwargs):
+        calls.append(expr)
+        return original(expr, *args, **kwargs)
+
+    derivatives = []
+    original_diff = space._diff
+
+    def counting_diff(expr, coord_index, mask=None):
+        derivatives.append((expr, coord_index))
+        return original_diff(expr, coord_index, mask)
+
+    monkeypatch.setattr(sp, "simplify", counting_simplify)
+    monkeypatch.setattr(space, "_diff", counting_diff)
+    result = space.nabla(space.g)
+    assert result.symmetries == ((1, 2, 1),)
+    assert len(derivatives) == 6
+    assert len(calls) <= 6
+    assert all(sp.simplify(c) == 0 for c in sp.flatten(result.components))
+
+
+def test_nabla_nabla_of_scalar_is_symmetric_for_constant_scale(polar_space):
+    space, (r, th) = polar_space
+    f = sp.Function("f")(r, th)
+    hessian = space.nabla(space.scalar(f), order=2)
+    assert hessian.symmetries == ((0, 1, 1),)
+    full = space.nabla(space.scalar(f), order=2, use_symmetry=False)
+    assert_same(hessian.components, full.components)
+
+
+def test_nabla_nabla_phi_without_lower_symmetry_keeps_all_components(polar_space):
+    space, (r, _) = polar_space
+    space.set_scale(sp.Function("phi")(r))
+    space.update()
+    hessian = space.nabla_nabla_phi
+    assert hessian.symmetries == ()
+    full = space.nabla(space.phi, order=2, use_symmetry=False)
+    assert hessian.components == full.components
@@ -0,0 +1,67 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import D, NumericSpace, TensorSpace, U
+
+np = pytest.importorskip("numpy")
+
+
+def _numeric(array, subs):
+    return np.array(sp.Array(array).subs(subs).applyfunc(float).tolist(), dtype=float)
+
+
+@pytest.fixture
+def sphere():
+    th, ph = sp.symbols("theta phi")
+    space = TensorSpace((th, ph), metric=sp.diag(1, sp.sin(th) ** 2))
+    return space, th, ph
+
+
+def test_evaluate_and_raise_lower_match_symbolic(sphere):
+    space, th, ph = sphere
+    thetas = np.array([0.3, 0.9, 1.7])
+    num = space.numeric({"theta": thetas})
+    assert num.batch_shape == (3,)
+    riemann = num.evaluate(space.riemann)
+    down = riemann(D, D, D, D)
+    for k, value in enumerate(thetas):
+        expected = _numeric(space.riemann(D, D, D, D).components, {th: value})
+        assert np.allclose(down.components[k], expected)
+        assert np.allclose(riemann[0, 1, 0, 1][k], float(space.riemann.components[0, 1, 0, 1].subs(th, value)))
+
+
+def test_index_contractions_match_symbolic(sphere):
+    space, th, ph = sphere
+    num = space.numeric({th: 0.7})
+    a, b, c = space.index("a b c")
+    riemann = num.evaluate(space.riemann)
+    ricci = riemann[+a, -b, -c, -a]
+    scalar = num.g(U, U)[+b, +c] * ricci
+    expected = _numeric(space.ricci.components, {th: 0.7})
+    assert np.allclose(ricci.components, expected)
+    assert np.allclose(riemann.contract(0, 3).components, expected)
+    assert np.isclose(scalar.components, float(space.scalar_curvature.expr))
+
+
+def test_indexed_algebra_with_label_permutation():
+    num = NumericSpace(np.diag([-1.0, 1.0, 1.0]))
+    a, b = num.index("a b")
+    F = num.from_array(np.arange(9.0).reshape(3, 3), (D, D))
+    sym = F[-a, -b].symmetric(-a, -b)
+    anti = F[-a, -b].antisymmetric(0, 1)
+    assert np.allclose((sym + anti).components, F.components)
+    assert np.allclose((F[-a, -b] - F[-b, -a]).components, 2 * anti.components)
+    assert np.allclose(F(U, D).components, np.diag([-1.0, 1.0, 1.0]) @ F.components)
+    with pytest.raises(ValueError, match="same variance"):
+        F[-a, -b] * F[-a, -b]
+
+
+def test_batched_metric_with_explicit_array():
+    metrics = np.stack([np.diag([1.0, s]) for s in (1.0, 2.0, 4.0)])
+    num = NumericSpace(metrics)
+    a = num.index("a")
+    v = num.from_array(np.ones((3, 2)), (U,))
+    norm = v[+a] * v(D)[-a]
+    assert np.allclose(norm.components, [2.0, 3.0, 5.0])
+    with pytest.raises(ValueError, match="does not end in"):
+        num.from_array(np.ones((3, 3)), (U,))
@@ -0,0 +1,55 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import TensorSpace
+from lyra_geometry.numeric import StreamingStats, stream_stats, sweep_arrays
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def schwarzschild():
+    t, r, th, ph, M = sp.symbols("t r theta phi M", positive=True)
+    f = 1 - 2 * M / r
+    space = TensorSpace((t, r, th, ph), metric=sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2))
+    grid = {r: np.linspace(3.0, 30.0, 40)[:, None], th: np.linspace(0.2, 2.9, 30)[None, :], M: 1.0}
+    return space, grid
+
+
+def test_sweep_streams_into_memmaps(schwarzschild, tmp_path):
+    space, grid = schwarzschild
+    ref = space.sweep(["riemann", "kretschmann"], grid)
+    out = space.sweep(["riemann", "kretschmann"], grid, chunk_size=97, out=tmp_path)
+    assert isinstance(out["riemann"], np.memmap)
+    stored = np.load(tmp_path / "kretschmann.npy", mmap_mode="r")
+    assert np.allclose(stored, ref["kretschmann"])
+    assert np.allclose(out["riemann"], ref["riemann"])
+    single = space.metric.sweep(grid, chunk_size=50, out=tmp_path / "g.npy")
+    assert np.allclose(single, space.metric.sweep(grid))
+
+
+def test_streaming_reductions_match_in_memory(schwarzschild, tmp_path):
+    space, grid = schwarzschild
+    K = space.sweep("kretschmann", grid)["kretschmann"]
+    stats = space.sweep_stats("kretschmann", grid, chunk_size=111, bins=8, range=(0.0, 0.1))["kretschmann"]
+    assert stats.count == K.size
+    assert np.isclose(stats.max, K.max()) and np.isclose(stats.min, K.min())
+    assert np.isclose(stats.mean, K.mean())
+    assert np.isclose(stats.norm, np.linalg.norm(K))
+    assert np.array_equal(stats.histogram, np.histogram(K, bins=8, range=(0.0, 0.1))[0])
+    riemann = sweep_arrays([space.riemann.components], grid, chunk_size=200, out=tmp_path, names=["riemann"])[0]
+    per_component = stream_stats(riemann, rank=4, chunk_size=64)
+    assert np.allclose(per_component.abs_max, np.abs(riemann).reshape(-1, 4, 4, 4, 4).max(axis=0))
+    with pytest.raises(ValueError, match="fixed range"):
+        StreamingStats(bins=10)
+
+
+def test_grid_compute_writes_slabs(schwarzschild, tmp_path):
+    space, _ = schwarzschild
+    grid = space.on_grid({"r": np.linspace(3.0, 30.0, 30), "theta": np.linspace(0.2, 2.9, 20)}, params={"M": 1.0})
+    ref = grid.compute(["riemann", "kretschmann"])
+    out = grid.compute(["riemann", "kretschmann"], chunk_size=7, out=tmp_path)
+    assert np.allclose(out["riemann"], ref["riemann"], rtol=0, atol=1e-12)
+    assert np.allclose(np.load(tmp_path / "kretschmann.npy"), ref["kretschmann"], rtol=0, atol=1e-12)
+    with pytest.raises(ValueError, match="expected"):
+        grid.compute("kretschmann", out={"kretschmann": np.zeros((2, 2))})
@@ -0,0 +1,61 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import TensorSpace
+
+t, x, y, k = sp.symbols("t x y k")
+
+
+def _lyra_space(algebra):
+    space = TensorSpace((t, x, y), metric=sp.diag(-1, 1, x**2 + 1), algebra=algebra)
+    torsion = sp.MutableDenseNDimArray.zeros(3, 3, 3)
+    torsion[0, 1, 2] = x * y
+    torsion[0, 2, 1] = -x * y
+    nonmetricity = sp.MutableDenseNDimArray.zeros(3, 3, 3)
+    nonmetricity[1, 1, 2] = y / (1 + x)
+    space.set_torsion(torsion)
+    space.set_nonmetricity(nonmetricity)
+    space.set_scale(1 + k * x)
+    space.update()
+    return space
+
+
+def _same(a, b):
+    return all(sp.cancel(p - q) == 0 for p, q in zip(sp.flatten(a), sp.flatten(b)))
+
+
+def test_rational_backend_matches_expr_backend():
+    reference = _lyra_space("expr")
+    space = _lyra_space("rational")
+    assert space._rational is not None
+    assert _same(space.metric_inv, reference.metric_inv)
+    assert sp.cancel(space.detg - reference.detg) == 0
+    assert _same(space.christoffel2.components, reference.christoffel2.components)
+    assert _same(space.gamma.components, reference.gamma.components)
+    assert _same(space.riemann.components, reference.riemann.components)
+    assert _same(space.einstein.components, reference.einstein.components)
+    assert sp.cancel(space.scalar_curvature.expr - reference.scalar_curvature.expr) == 0
+
+
+def test_results_are_already_canonical():
+    M, r, u = sp.symbols("M r u")
+    f = 1 - 2 * M / r
+    metric = sp.diag(-f, 1 / f, r**2 / (1 - u**2), r**2 * (1 - u**2))
+    space = TensorSpace((t, r, u, sp.Symbol("phi")), metric=metric, algebra="rational")
+    assert all(c == 0 for c in sp.flatten(space.ricci.components))
+    assert space.kretschmann_scalar().expr == 48 * M**2 / r**6
+    assert space.christoffel2.components[1, 0, 0] == sp.cancel(M * (r - 2 * M) / r**3)
+
+
+def test_auto_falls_back_and_rational_rejects_non_rational_metrics():
+    th, ph = sp.symbols("theta phi")
+    hyperbolic = sp.diag(1, sp.exp(2 * th))
+    space = TensorSpace((th, ph), metric=hyperbolic, algebra="auto")
+    assert space._rational is None and space.ricci_scalar().expr == 2
+    assert TensorSpace((th, ph), metric=sp.diag(1, th**2), algebra="auto")._rational is not None
+    with pytest.raises(ValueError, match="not a rational function"):
+        TensorSpace((th, ph), metric=hyperbolic, algebra="rational")
+    with pytest.raises(ValueError, match="inexact coefficients"):
+        TensorSpace((th, ph), metric=sp.diag(1, 0.5 * th**2), algebra="rational")
+    with pytest.raises(ValueError, match="Unknown algebra"):
+        TensorSpace((th, ph), metric=hyperbolic, algebra="poly")
@@ -0,0 +1,51 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import NullGeodesicTracer, TensorSpace
+from lyra_geometry.raytrace import CAPTURED, ESCAPED
+
+np = pytest.importorskip("numpy")
+
+
+def _schwarzschild():
+    t, r, th, ph, M = sp.symbols("t r theta phi M")
+    f = 1 - 2 * M / r
+    space = TensorSpace((t, r, th, ph), metric=sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2))
+    return NullGeodesicTracer(space, params={M: 1}, radius=r, horizon=2.01, escape=60.0)
+
+
+def test_camera_rays_are_null_and_tetrad_is_orthonormal():
+    tracer = _schwarzschild()
+    x_obs = [0.0, 30.0, np.pi / 2, 0.0]
+    e = tracer.tetrad(x_obs)
+    g = tracer.metric_at(np.array(x_obs))
+    assert np.allclose(e @ g @ e.T, np.diag([-1.0, 1.0, 1.0, 1.0]))
+    x0, v0 = tracer.camera_rays(x_obs, 5, 3, 0.5)
+    assert x0.shape == v0.shape == (15, 4)
+    assert np.allclose(np.einsum("na,ab,nb->n", v0, g, v0), 0.0)
+
+
+def test_flat_rays_are_straight_lines():
+    x, y = sp.symbols("x y")
+    tracer = NullGeodesicTracer(TensorSpace((x, y), metric=sp.diag(1, 1)))
+    status, final = tracer.trace([[0.0, 0.0]], [[1.0, 2.0]], step=0.1, max_steps=10)
+    assert np.allclose(final, [[1.0, 2.0]])
+
+
+def test_shadow_center_is_captured_and_edges_escape():
+    tracer = _schwarzschild()
+    status, final = tracer.render([0.0, 30.0, np.pi / 2, 0.0], 9, 9, 0.8, step=0.05, max_steps=2000)
+    assert status.shape == (9, 9)
+    assert final.shape == (9, 9, 4)
+    assert status[4, 4] == CAPTURED
+    assert status[0, 0] == ESCAPED
+    assert (status == status[::-1, ::-1]).all()
+
+
+def test_process_pool_matches_serial():
+    tracer = _schwarzschild()
+    x0, v0 = tracer.camera_rays([0.0, 30.0, np.pi / 2, 0.0], 4, 4, 0.8)
+    serial = tracer.trace(x0, v0, step=0.05, max_steps=500)
+    pooled = tracer.trace(x0, v0, step=0.05, max_steps=500, chunk_size=5, workers=2)
+    assert (serial[0] == pooled[0]).all()
+    assert np.allclose(serial[1], pooled[1])
@@ -0,0 +1,66 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import TensorSpace
+
+np = pytest.importorskip("numpy")
+
+
+def _reissner_nordstrom():
+    t, r, th, ph, M, Q = sp.symbols("t r theta phi M Q", positive=True)
+    f = 1 - 2 * M / r + Q**2 / r**2
+    space = TensorSpace((t, r, th, ph), metric=sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2))
+    return space, (r, th, M, Q)
+
+
+def test_tensor_sweep_broadcasts_grid():
+    space, (r, th, M, Q) = _reissner_nordstrom()
+    masses = np.linspace(0.5, 1.5, 3)[:, None]
+    radii = np.linspace(4.0, 8.0, 5)[None, :]
+    values = space.metric.sweep({M: masses, "r": radii, Q: 0.1, th: 1.0})
+    assert values.shape == (3, 5, 4, 4)
+    expected = -(1 - 2 * 1.5 / 8.0 + 0.01 / 64.0)
+    assert np.isclose(values[2, 4, 0, 0], expected)
+    assert np.all(values[..., 0, 1] == 0)
+
+
+def test_space_sweep_matches_subs():
+    space, (r, th, M, Q) = _reissner_nordstrom()
+    grid = {M: np.array([0.7, 1.1]), Q: np.array([0.2, 0.3]), r: 5.0, th: 0.4}
+    out = space.sweep(["kretschmann", "einstein"], grid)
+    assert out["kretschmann"].shape == (2,)
+    assert out["einstein"].shape == (2, 4, 4)
+    K = space.kretschmann_scalar().expr
+    expected = [float(K.subs({M: 0.7, Q: 0.2, r: 5.0, th: 0.4})), float(K.subs({M: 1.1, Q: 0.3, r: 5.0, th: 0.4}))]
+    assert np.allclose(out["kretschmann"], expected)
+
+
+def test_sweep_over_worker_processes():
+    space, (r, th, M, Q) = _reissner_nordstrom()
+    grid = {M: np.linspace(0.5, 1.5, 40), r: 6.0, Q: 0.0, th: 1.0}
+    serial = space.sweep("kretschmann", grid)["kretschmann"]
+    pooled = space.sweep("kretschmann", grid, chunk_size=8, workers=2)["kretschmann"]
+    assert np.allclose(serial, pooled)
+    assert np.allclose(serial, 48 * grid[M] ** 2 / 6.0**6)
+
+
+def test_sweep_requires_all_parameters():
+    space, (r, th, M, Q) = _reissner_nordstrom()
+    with pytest.raises(ValueError, match="Q"):
+        space.metric.sweep({M: 1.0, r: 3.0, th: 1.0})
+    with pytest.raises(ValueError, match="Unknown quantity"):
+        space.sweep("torsion_scalar", {M: 1.0})
+
+
+def test_sweep_accepts_unused_coordinates_and_parameters():
+    t, r, th, ph, M = sp.symbols("t r theta phi M", positive=True)
+    f = 1 - 2 * M / r
+    space = TensorSpace((t, r, th, ph), metric=sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2))
+    radii = np.linspace(3.0, 6.0, 4)
+    out = space.sweep(["kretschmann", "ricci_scalar"], {"r": radii, "M": 1.0, "theta": 1.0, "t": 0.0})
+    assert np.allclose(out["kretschmann"], 48 / radii**6)
+    assert np.allclose(out["ricci_scalar"], 0) and out["ricci_scalar"].shape == (4,)
+    assert space.sweep_stats("ricci_scalar", {"r": radii, "M": 1.0})["ricci_scalar"].abs_max == 0
+    assert space.metric.sweep({"r": radii, "M": 1.0, "theta": 1.0, "phi": 0.0}).shape == (4, 4, 4)
+    with pytest.raises(ValueError, match="Unknown parameter 'Q'"):
+        space.sweep("kretschmann", {"r": radii, "M": 1.0, "Q": 0.1})
@@ -0,0 +1,80 @@
+import pytest
+import sympy as sp
+
+from conftest import assert_same
+from lyra_geometry import D, TensorSpace
+
+
+def _assert_same_geometry(left, right):
+    assert_same(left.metric.components, right.metric.components)
+    assert_same(left.christoffel2.components, right.christoffel2.components)
+    assert_same(left.gamma.components, right.gamma.components)
+    assert_same(left.riemann.components, right.riemann.components)
+    assert_same(left.ricci.components, right.ricci.components)
+    assert_same(left.einstein.components, right.einstein.components)
+    assert sp.simplify(left.scalar_curvature.expr - right.scalar_curvature.expr) == 0
+    assert sp.simplify(left.detg - right.detg) == 0
+
+
+@pytest.fixture
+def polar_with_scale():
+    r, th = sp.symbols("r theta", positive=True)
+    space = TensorSpace((r, th), metric=sp.diag(1, r**2))
+    space.set_scale(sp.Function("phi")(r))
+    space.update()
+    return space, (r, th)
+
+
+def test_polar_to_cartesian_matches_direct_computation(polar_with_scale):
+    polar, (r, th) = polar_with_scale
+    x, y = sp.symbols("x y", positive=True)
+    cartesian = polar.transform((x, y), {r: sp.sqrt(x**2 + y**2), th: sp.atan2(y, x)})
+    direct = TensorSpace((x, y), metric=sp.eye(2))
+    direct.set_scale(sp.Function("phi")(sp.sqrt(x**2 + y**2)))
+    direct.update()
+    _assert_same_geometry(cartesian, direct)
+
+
+def test_transform_keeps_jacobians_and_registered_tensors(polar_with_scale):
+    polar, (r, th) = polar_with_scale
+    x, y = sp.symbols("x y", positive=True)
+    polar.from_array([1, 0], (D,), name="dr")
+    cartesian = polar.transform((x, y), [sp.sqrt(x**2 + y**2), sp.atan2(y, x)])
+    assert sp.simplify(cartesian.jacobian * cartesian.inverse_jacobian - sp.eye(2)) == sp.zeros(2, 2)
+    dr = cartesian.get("dr")
+    assert dr.signature == (D,)
+    assert_same(dr.components, [x / sp.sqrt(x**2 + y**2), y / sp.sqrt(x**2 + y**2)])
+
+
+def test_transform_does_not_rerun_curvature(polar_with_scale, monkeypatch):
+    polar, (r, th) = polar_with_scale
+    x, y = sp.symbols("x y", positive=True)
+
+    original = polar.curvature_strategy.build
+
+    def guarded(space, gamma_components):
+        assert space.metric is None, "curvature strategy must not run on the new chart"
+        return original(space, gamma_components)
+
+    monkeypatch.setattr(polar.curvature_strategy, "build", guarded)
+    polar.transform((x, y), {r: sp.sqrt(x**2 + y**2), th: sp.atan2(y, x)})
+
+
+def test_transform_validates_mapping(polar_with_scale):
+    polar, (r, th) = polar_with_scale
+    x, y = sp.symbols("x y")
+    with pytest.raises(ValueError, match="old coordinate"):
+        polar.transform((x, y), {r: x})
+    with pytest.raises(ValueError, match="singular"):
+        polar.transform((x, y), {r: x, th: x})
+
+
+@pytest.mark.slow
+def test_schwarzschild_to_eddington_finkelstein():
+    t, r, th, ph, v, M = sp.symbols("t r theta phi v M", positive=True)
+    f = 1 - 2 * M / r
+    schwarzschild = TensorSpace((t, r, th, ph), metric=sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2))
+    ingoing = schwarzschild.transform((v, r, th, ph), {t: v - r - 2 * M * sp.log(r / (2 * M) - 1)})
+    metric = sp.Matrix([[-f, 1, 0, 0], [1, 0, 0, 0], [0, 0, r**2, 0], [0, 0, 0, r**2 * sp.sin(th) ** 2]])
+    direct = TensorSpace((v, r, th, ph), metric=metric)
+    _assert_same_geometry(ingoing, direct)
@@ -0,0 +1,41 @@
+import sympy as sp
+
+from lyra_geometry import TensorSpace
+from lyra_geometry.rational import RationalAlgebra, trig_angles
+
+t, r, th, ph, M, a = sp.symbols("t r theta phi M a")
+
+
+def test_algebraic_sin_cos_reduce_modulo_the_circle_relation():
+    algebra = RationalAlgebra((r, th), angles=trig_angles([sp.tan(th), sp.sin(2 * th)]))
+    assert algebra.angles == (th,)
+    one = algebra.convert(sp.sin(th) ** 2 + sp.cos(th) ** 2)
+    assert one == algebra.one
+    value = algebra.convert(sp.sin(2 * th) / (1 + sp.cos(th)))
+    assert sp.simplify(algebra.to_expr(value) - sp.sin(2 * th) / (1 + sp.cos(th))) == 0
+    assert not algebra.to_expr(value).has(sp.cos(th) ** 2)
+    derivative = algebra.diff(algebra.convert(r * sp.tan(th)), 1)
+    assert sp.simplify(algebra.to_expr(derivative) - r / sp.cos(th) ** 2) == 0
+    assert algebra.reduce(algebra.convert(sp.cot(th)) * algebra.convert(sp.tan(th))) == algebra.one
+
+
+def test_schwarzschild_and_kerr_curvature():
+    f = 1 - 2 * M / r
+    schwarzschild = sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2)
+    space = TensorSpace((t, r, th, ph), metric=schwarzschild, algebra="rational")
+    assert space.christoffel2.components[3, 2, 3] == sp.cos(th) / sp.sin(th)
+    assert space.kretschmann_scalar().expr == 48 * M**2 / r**6
+    reference = TensorSpace((t, r, th, ph), metric=schwarzschild)
+    assert all(sp.simplify(p - q) == 0 for p, q in zip(sp.flatten(space.riemann.components), sp.flatten(reference.riemann.components)))
+
+    sigma = r**2 + a**2 * sp.cos(th) ** 2
+    delta = r**2 - 2 * M * r + a**2
+    kerr = sp.zeros(4)
+    kerr[0, 0] = -(1 - 2 * M * r / sigma)
+    kerr[0, 3] = kerr[3, 0] = -2 * M * r * a * sp.sin(th) ** 2 / sigma
+    kerr[1, 1] = sigma / delta
+    kerr[2, 2] = sigma
+    kerr[3, 3] = (r**2 + a**2 + 2 * M * r * a**2 * sp.sin(th) ** 2 / sigma) * sp.sin(th) ** 2
+    space = TensorSpace((t, r, th, ph), metric=kerr, algebra="rational")
+    assert all(c == 0 for c in sp.flatten(space.ricci.components))
+    assert space.riemann.components[0, 1, 0, 1] != 0
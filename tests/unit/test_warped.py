@@ -0,0 +1,115 @@
+import pytest
+import sympy as sp
+
+from conftest import assert_same
+from lyra_geometry import (
+    FixedConnectionStrategy,
+    TensorSpace,
+    WarpedCurvatureStrategy,
+    detect_warped_product,
+    warped_product,
+)
+from lyra_geometry.warped import _block_spaces
+
+
+def _assert_same_curvature(left, right):
+    assert_same(left.riemann.components, right.riemann.components)
+    assert_same(left.ricci.components, right.ricci.components)
+    assert_same(left.einstein.components, right.einstein.components)
+    scalar = left.scalar_curvature.components[()] - right.scalar_curvature.components[()]
+    assert sp.simplify(scalar) == 0
+
+
+def test_detects_polar_plane_as_warped_product():
+    r, th = sp.symbols("r theta", positive=True)
+    space = TensorSpace((r, th), metric=sp.diag(1, r**2), curvature_strategy=None)
+    assert detect_warped_product(space) == ((r,), (th,), r**2)
+
+
+def test_detection_rejects_non_warped_metric():
+    x, y = sp.symbols("x y")
+    space = TensorSpace((x, y), metric=sp.Matrix([[1, x], [x, 2]]), curvature_strategy=None)
+    assert detect_warped_product(space) is None
+
+
+def test_warped_strategy_matches_lyra_on_cone_over_sphere():
+    r, th, ph = sp.symbols("r theta phi", positive=True)
+    f = sp.Function("f")(r)
+    metric = sp.diag(1, f**2, f**2 * sp.sin(th) ** 2)
+    lyra = TensorSpace((r, th, ph), metric=metric)
+    warped = TensorSpace((r, th, ph), metric=metric, curvature_strategy=WarpedCurvatureStrategy())
+    _assert_same_curvature(lyra, warped)
+
+
+def test_warped_product_assembles_from_block_spaces():
+    t, x, y = sp.symbols("t x y")
+    a = sp.Function("a")(t)
+    base = TensorSpace((t,), metric=sp.Matrix([[-1]]))
+    fiber = TensorSpace((x, y), metric=sp.diag(1, sp.exp(2 * x)))
+    space = warped_product(base, fiber, a)
+    direct = TensorSpace((t, x, y), metric=sp.diag(-1, a**2, a**2 * sp.exp(2 * x)))
+    assert_same(space.christoffel2.components, direct.christoffel2.components)
+    _assert_same_curvature(space, direct)
+    assert sp.simplify(space.detg - direct.detg) == 0
+
+
+def test_explicit_base_must_give_warped_split():
+    x, y = sp.symbols("x y")
+    strategy = WarpedCurvatureStrategy(base_coords=(x,))
+    with pytest.raises(ValueError, match="warped product"):
+        TensorSpace((x, y), metric=sp.Matrix([[1, x], [x, 2]]), curvature_strategy=strategy)
+
+
+def test_scale_field_falls_back_to_lyra_strategy():
+    r, th = sp.symbols("r theta", positive=True)
+    metric = sp.diag(1, r**2)
+    lyra = TensorSpace((r, th), metric=metric)
+    warped = TensorSpace((r, th), metric=metric, curvature_strategy=WarpedCurvatureStrategy())
+    for space in (lyra, warped):
+        space.set_scale(sp.Function("phi")(r))
+        space.update()
+    _assert_same_curvature(lyra, warped)
+
+
+def test_fixed_connection_falls_back_to_lyra_strategy():
+    r, th = sp.symbols("r theta", positive=True)
+    space = TensorSpace(
+        (r, th),
+        metric=sp.diag(1, sp.sin(r) ** 2),
+        connection_strategy=FixedConnectionStrategy(sp.MutableDenseNDimArray.zeros(2, 2, 2)),
+        curvature_strategy=WarpedCurvatureStrategy(),
+    )
+    assert all(v == 0 for v in sp.flatten(space.riemann.components))
+    assert space.scalar_curvature.components[()] == 0
+
+
+@pytest.mark.slow
+def test_warped_strategy_matches_lyra_on_schwarzschild():
+    t, r, th, ph, M = sp.symbols("t r theta phi M")
+    f = 1 - 2 * M / r
+    metric = sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(th) ** 2)
+    lyra = TensorSpace((t, r, th, ph), metric=metric)
+    warped = TensorSpace((t, r, th, ph), metric=metric, curvature_strategy=WarpedCurvatureStrategy())
+    _assert_same_curvature(lyra, warped)
+
+
+def test_block_spaces_and_products_inherit_domains_and_zero_test():
+    r, th, ph = sp.symbols("r theta phi")
+    domains = {"r": "positive", "theta": (0, sp.pi)}
+    metric = sp.diag(1, r**2, r**2 * sp.sin(th) ** 2)
+    space = TensorSpace(
+        (r, th, ph), metric=metric, domains=domains, zero_test="numeric", curvature_strategy=WarpedCurvatureStrategy()
+    )
+    assert all(v == 0 for v in sp.flatten(space.riemann.components))
+    base, fiber = _block_spaces(space, [0], [1, 2], sp.diag(1, sp.sin(th) ** 2))
+    for block in (base, fiber):
+        assert block.domains.symbols == space.domains.symbols and block.zero_test == "numeric"
+    line = TensorSpace((r,), metric=sp.diag(1), domains={"r": "positive"}, zero_test="numeric")
+    sphere = TensorSpace(
+        (th, ph), metric=sp.diag(1, sp.sin(th) ** 2), domains={"theta": (0, sp.pi)}, zero_test="numeric"
+    )
+    product = warped_product(line, sphere, r)
+    assert product.domains.symbols == space.domains.symbols and product.zero_test == "numeric"
+    assert product.coords == space.coords
+    with pytest.raises(ValueError, match="share the algebra and zero_test"):
+        warped_product(line, TensorSpace((th, ph), metric=sp.diag(1, sp.sin(th) ** 2)), r)
@@ -0,0 +1,50 @@
+import pytest
+import sympy as sp
+
+from lyra_geometry import D, TensorSpace, U, probably_zero
+
+x, y, r, th, ph = sp.symbols("x y r theta phi")
+f = sp.Function("f")
+
+
+def test_probably_zero_on_identities():
+    assert probably_zero(sp.sin(x) ** 2 + sp.cos(x) ** 2 - 1)
+    assert probably_zero(sp.diff(f(x) ** 2, x) - 2 * f(x) * f(x).diff(x))
+    assert not probably_zero(sp.diff(f(x) ** 2, x) - f(x) * f(x).diff(x))
+    assert not probably_zero(sp.sqrt(x**2) - x)
+    # The domain decides identities that hold on a branch only.
+    space = TensorSpace((r, th), metric=sp.diag(1, r**2), domains={"r": "positive"})
+    assert probably_zero(sp.sqrt(r**2) - r, domains=space.domains)
+
+
+def test_tiny_nonzero_coefficients_are_not_zero():
+    assert not probably_zero(x / 10**30)
+    assert not probably_zero(1e-26 * x**2)
+    assert not probably_zero(sp.Rational(1, 10**60) * sp.sin(x))
+    # The tolerance is relative to the terms that cancel, not absolute.
+    assert probably_zero(10**40 * (sp.cosh(x) ** 2 - sp.sinh(x) ** 2 - 1))
+    assert probably_zero((sp.sin(x) ** 2 + sp.cos(x) ** 2 - 1) / 10**40)
+    G = sp.Rational(667, 10**32)
+    space = TensorSpace((r, th), metric=sp.diag(1, r**2 + G * r**3), zero_test="numeric")
+    assert space.scalar_curvature.expr != 0
+
+
+def test_zero_test_modes_agree_with_simplify():
+    metric = sp.diag(1, r**2 * sp.sin(th) ** 2 + r**2 * sp.cos(th) ** 2)
+    for mode in ("numeric", "verified"):
+        space = TensorSpace((r, th), metric=metric, zero_test=mode)
+        assert set(sp.flatten(space.ricci.components)) == {0}
+        assert space.scalar_curvature.expr == 0
+    with pytest.raises(ValueError, match="Unknown zero_test"):
+        TensorSpace((r, th), metric=metric, zero_test="always")
+
+
+def test_equals_and_is_flat():
+    polar = TensorSpace((r, th), metric=sp.diag(1, r**2))
+    sphere = TensorSpace((th, ph), metric=sp.diag(1, sp.sin(th) ** 2))
+    assert polar.is_flat() and not sphere.is_flat()
+    ricci = sphere.ricci
+    expanded = sphere.from_array(sp.Array(ricci.components).applyfunc(sp.expand_trig), ricci.signature)
+    assert ricci.equals(expanded) and ricci.equals(expanded(U, D))
+    assert not ricci.equals(sphere.einstein)
+    assert sphere.scalar_curvature.equals(sphere.scalar_curvature.expr)